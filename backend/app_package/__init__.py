@@ -4,11 +4,19 @@ from flask_cors import CORS
 from dotenv import load_dotenv
 import os
 from flask_migrate import Migrate
+from .logging_config import configure_logging
+from . import database, metrics, strict_mode
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={"class_": database.RoutingSession})
 migrate= Migrate()
 
-def create_app():
+def create_app(start_background_workers: bool = False):
+    """
+    Builds the app. Only the processes that serve requests start the
+    background workers: gunicorn's post_worker_init and run.py's development
+    server call start_background_workers(app). CLI commands (flask db upgrade),
+    the reloader's parent, scripts and tests never run them.
+    """
     app = Flask(__name__)
 
     load_dotenv()
@@ -18,6 +26,79 @@ def create_app():
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
     app.config["SECRET_KEY"] = os.getenv("SECRET_KEY", "dev_secret_key")
 
+    # Connection pool (ignored for SQLite) and Postgres statement timeout (0 disables it;
+    # migrations always run without it, see migrations/env.py)
+    app.config["DB_POOL_SIZE"] = int(os.getenv("DB_POOL_SIZE", "10"))
+    app.config["DB_MAX_OVERFLOW"] = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    app.config["DB_POOL_RECYCLE"] = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    app.config["DB_POOL_TIMEOUT"] = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+    app.config["DB_POOL_PRE_PING"] = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+    app.config["DB_STATEMENT_TIMEOUT_MS"] = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "30000"))
+
+    # Optional read replica for read-only service functions
+    app.config["DATABASE_REPLICA_URL"] = os.getenv("DATABASE_REPLICA_URL")
+    app.config["DB_REPLICA_STICKY_SECONDS"] = int(os.getenv("DB_REPLICA_STICKY_SECONDS", "5"))
+
+    # Logging configuration
+    app.config["LOG_LEVEL"] = os.getenv("LOG_LEVEL", "INFO")
+    app.config["LOG_FORMAT"] = os.getenv("LOG_FORMAT", "json")
+
+    # Strict N+1 detection for tests and staging
+    app.config["STRICT_QUERY_MODE"] = os.getenv("STRICT_QUERY_MODE", "false").lower() in ("1", "true", "yes")
+    app.config["DEFAULT_QUERY_BUDGET"] = int(os.getenv("DEFAULT_QUERY_BUDGET", "10"))
+
+    # AI feedback cache configuration ("memory", "database" or "none")
+    app.config["AI_FEEDBACK_CACHE"] = os.getenv("AI_FEEDBACK_CACHE", "memory")
+    app.config["AI_FEEDBACK_CACHE_SIZE"] = int(os.getenv("AI_FEEDBACK_CACHE_SIZE", "512"))
+    app.config["AI_FEEDBACK_CACHE_TTL"] = int(os.getenv("AI_FEEDBACK_CACHE_TTL", "86400"))
+
+    # Bound of the response_cache table behind the "database" caches, enforced every purge interval
+    app.config["RESPONSE_CACHE_MAX_ROWS"] = int(os.getenv("RESPONSE_CACHE_MAX_ROWS", "10000"))
+    app.config["RESPONSE_CACHE_PURGE_SECONDS"] = int(os.getenv("RESPONSE_CACHE_PURGE_SECONDS", "300"))
+
+    # Async AI feedback worker pool
+    app.config["AI_FEEDBACK_WORKERS"] = int(os.getenv("AI_FEEDBACK_WORKERS", "4"))
+    app.config["AI_FEEDBACK_MAX_PENDING"] = int(os.getenv("AI_FEEDBACK_MAX_PENDING", "100"))
+    # Running jobs heartbeat this often; one silent for AI_FEEDBACK_JOB_TIMEOUT is presumed dead and re-queued
+    app.config["AI_FEEDBACK_HEARTBEAT_SECONDS"] = int(os.getenv("AI_FEEDBACK_HEARTBEAT_SECONDS", "15"))
+    app.config["AI_FEEDBACK_JOB_TIMEOUT"] = int(os.getenv("AI_FEEDBACK_JOB_TIMEOUT", "60"))
+
+    # PDF extraction process pool and limits
+    app.config["PDF_EXTRACT_WORKERS"] = int(os.getenv("PDF_EXTRACT_WORKERS", "2"))
+    app.config["PDF_EXTRACT_MAX_PENDING"] = int(os.getenv("PDF_EXTRACT_MAX_PENDING", "8"))
+    app.config["PDF_EXTRACT_TIMEOUT"] = float(os.getenv("PDF_EXTRACT_TIMEOUT", "10"))
+    app.config["PDF_MAX_PAGES"] = int(os.getenv("PDF_MAX_PAGES", "20"))
+    app.config["PDF_MAX_CHARS"] = int(os.getenv("PDF_MAX_CHARS", "100000"))
+
+    # Extracted PDF text cache ("memory", "database" or "none")
+    app.config["PDF_TEXT_CACHE"] = os.getenv("PDF_TEXT_CACHE", "memory")
+    app.config["PDF_TEXT_CACHE_SIZE"] = int(os.getenv("PDF_TEXT_CACHE_SIZE", "256"))
+    app.config["PDF_TEXT_CACHE_TTL"] = int(os.getenv("PDF_TEXT_CACHE_TTL", "604800"))
+
+    # Per-user list cache ("memory", "redis" or "none"), keyed on collection versions
+    app.config["LIST_CACHE"] = os.getenv("LIST_CACHE", "memory")
+    app.config["LIST_CACHE_SIZE"] = int(os.getenv("LIST_CACHE_SIZE", "2048"))
+    app.config["LIST_CACHE_TTL"] = int(os.getenv("LIST_CACHE_TTL", "300"))
+    app.config["REDIS_URL"] = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+    # Rows per INSERT/commit when importing jobs from CSV or JSONL
+    app.config["JOB_IMPORT_CHUNK_SIZE"] = int(os.getenv("JOB_IMPORT_CHUNK_SIZE", "500"))
+
+    # Per-user job term indexes kept in memory for local match scoring
+    app.config["MATCH_INDEX_CACHE_SIZE"] = int(os.getenv("MATCH_INDEX_CACHE_SIZE", "64"))
+
+    # Structured logging with per-request correlation ids
+    configure_logging(app)
+
+    # Latency, SQL and external call metrics exposed at /metrics
+    metrics.init_app(app)
+
+    # Raise on lazy loads and enforce per-endpoint query budgets when enabled
+    strict_mode.init_app(app)
+
+    # Engine options and replica bind must be set before the engines are created
+    database.init_app(app)
+
     # Initialize database
     db.init_app(app)
     
@@ -36,6 +117,36 @@ def create_app():
     # Import models so SQLAlchemy detects them
     from . import models
 
+    # Cache for AI feedback responses
+    from .services.cache_service import build_cache
+    app.extensions["feedback_cache"] = build_cache(
+        app.config["AI_FEEDBACK_CACHE"],
+        max_entries=app.config["AI_FEEDBACK_CACHE_SIZE"],
+        ttl=app.config["AI_FEEDBACK_CACHE_TTL"],
+        max_rows=app.config["RESPONSE_CACHE_MAX_ROWS"],
+        purge_interval=app.config["RESPONSE_CACHE_PURGE_SECONDS"]
+    )
+
+    # Read-through cache for the per-user list endpoints
+    from .services import list_cache_service
+    list_cache_service.init_app(app)
+
+    # Local resume-to-job match scoring
+    from .services import match_service
+    match_service.init_app(app)
+
+    # Background workers for async AI feedback
+    from .services import feedback_job_service
+    feedback_job_service.init_app(app, start=start_background_workers)
+
+    # Process pool for PDF text extraction
+    from .services import pdf_service
+    pdf_service.init_app(app)
+
+    # Liveness and readiness probes
+    from . import health
+    health.init_app(app)
+
     # Import blueprints
     from .routes.auth_route import auth_bp
     from .routes.ai_route import ai_bp
@@ -56,4 +167,28 @@ def create_app():
     def home():
         return "Backend running on port 5000!"
 
-    return app
\ No newline at end of file
+    return app
+
+
+def reset_after_fork(app):
+    """
+    Re-creates the process-local resources a worker inherits when the app was
+    created before forking (gunicorn preload_app): pooled database connections
+    and the PDF process pool.
+    """
+    from .services import pdf_service
+
+    with app.app_context():
+        for engine in db.engines.values():
+            # Drop the parent's connections without closing them under it
+            engine.dispose(close=False)
+
+    pdf_service.init_app(app)
+
+
+def start_background_workers(app):
+    """
+    Starts the feedback job monitor, which heartbeats this process's running
+    jobs and re-queues those of dead processes (see feedback_job_service).
+    """
+    app.extensions["feedback_workers"].start()
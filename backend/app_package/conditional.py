@@ -0,0 +1,48 @@
+from .database import replica_reads
+from .services.collection_version_service import get_collection_version
+from flask import make_response, request, session
+from functools import wraps
+import hashlib
+
+
+# -----------------------------
+# Conditional GET (weak ETags)
+# -----------------------------
+def conditional_get(collection: str):
+    """
+    Tags a view's response with a weak ETag derived from the user's version of
+    `collection` and the request path/query, and answers 304 Not Modified when
+    the client's If-None-Match still matches, without running the view.
+
+    Only one primary-key lookup runs on a revalidation hit. The view's service
+    must read through reads_from_replica, like the version does. Must sit below
+    the route decorator so the query budget of the wrapped view is kept.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            user_id = session.get("user_id")
+            if not user_id:
+                return view(*args, **kwargs)
+
+            # Read before the view runs so a concurrent write can only make the tag stale, never too new,
+            # and from the database the view reads from, so a lagging replica's rows get its own tag
+            with replica_reads(user_id):
+                version = get_collection_version(user_id, collection)
+            variant = hashlib.sha256(request.full_path.encode("utf-8")).hexdigest()[:12]
+            etag = f"{collection}-{user_id}-{version}-{variant}"
+
+            if request.if_none_match.contains_weak(etag):
+                response = make_response("", 304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            response.set_etag(etag, weak=True)
+            # Per-user content: shared caches must not reuse it across sessions
+            response.headers["Cache-Control"] = "private, no-cache"
+            response.vary.add("Cookie")
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,166 @@
+from contextlib import contextmanager
+from flask import current_app, has_app_context
+from flask_sqlalchemy.session import Session as FlaskSession
+from functools import wraps
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+import contextvars
+
+# Bind key of the optional read replica (SQLALCHEMY_BINDS)
+REPLICA_BIND = "replica"
+# Session.info key holding the users written in the open transaction
+PENDING_WRITES = "replica_pending_writes"
+
+_use_replica = contextvars.ContextVar("use_replica", default=False)
+
+
+# -----------------------------
+# ENGINE OPTIONS
+# -----------------------------
+def engine_options(url: str, config) -> dict:
+    """
+    Builds create_engine() options for a database URL from the DB_* settings.
+
+    SQLite engines get pre-ping only: Flask-SQLAlchemy picks their pool class,
+    which takes no sizing options.
+    """
+    if not url:
+        return {}
+    options = {"pool_pre_ping": config["DB_POOL_PRE_PING"]}
+    backend = make_url(url).get_backend_name()
+    if backend == "sqlite":
+        return options
+
+    options.update({
+        "pool_size": config["DB_POOL_SIZE"],
+        "max_overflow": config["DB_MAX_OVERFLOW"],
+        "pool_recycle": config["DB_POOL_RECYCLE"],
+        "pool_timeout": config["DB_POOL_TIMEOUT"]
+    })
+    if backend == "postgresql" and config["DB_STATEMENT_TIMEOUT_MS"]:
+        # Server-side limit, so a runaway query cannot hold a pooled connection forever
+        options["connect_args"] = {"options": f"-c statement_timeout={config['DB_STATEMENT_TIMEOUT_MS']}"}
+    return options
+
+
+# -----------------------------
+# READ-REPLICA ROUTING
+# -----------------------------
+class RoutingSession(FlaskSession):
+    """
+    Sends SELECTs made inside a reads_from_replica function to the replica bind.
+    Writes, flushes and reads in a transaction that already wrote stay on the
+    primary.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if (
+            bind is None
+            and _use_replica.get()
+            and (clause is None or getattr(clause, "is_select", False))
+            and not self._flushing
+            and not (self.new or self.dirty or self.deleted)
+            and PENDING_WRITES not in self.info
+        ):
+            replica = self._db.engines.get(REPLICA_BIND)
+            if replica is not None:
+                return replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def replica_reads_active() -> bool:
+    """True inside a reads_from_replica function whose reads go to the replica."""
+    return _use_replica.get()
+
+
+def _sticky_key(user_id: int) -> str:
+    return f"replica-sticky:{user_id}"
+
+
+def _replica_allowed(user_id) -> bool:
+    if not has_app_context():
+        return False
+    if not current_app.config["DATABASE_REPLICA_URL"]:
+        return False
+    store = current_app.extensions.get("replica_sticky")
+    # Users who just wrote read from the primary until the replica has caught up
+    return store is None or store.get(_sticky_key(user_id)) is None
+
+
+@contextmanager
+def replica_reads(user_id: int):
+    """
+    Routes the reads made in the block to the replica, when DATABASE_REPLICA_URL
+    is set and the user has not written in the last DB_REPLICA_STICKY_SECONDS.
+    """
+    if not _replica_allowed(user_id):
+        yield
+        return
+    token = _use_replica.set(True)
+    try:
+        yield
+    finally:
+        _use_replica.reset(token)
+
+
+def reads_from_replica(func):
+    """Runs a read-only service function taking user_id first in replica_reads."""
+    @wraps(func)
+    def wrapper(user_id, *args, **kwargs):
+        with replica_reads(user_id):
+            return func(user_id, *args, **kwargs)
+    return wrapper
+
+
+def mark_write(session, user_id: int):
+    """Keeps the user's reads on the primary for a while once this transaction commits."""
+    session.info.setdefault(PENDING_WRITES, set()).add(user_id)
+
+
+def _stick_after_commit(session):
+    pending = session.info.pop(PENDING_WRITES, None)
+    if not pending or not has_app_context():
+        return
+    store = current_app.extensions.get("replica_sticky")
+    if store is None:
+        return
+    for user_id in pending:
+        store.set(_sticky_key(user_id), "1")
+
+
+def _discard_after_rollback(session):
+    session.info.pop(PENDING_WRITES, None)
+
+
+def init_app(app):
+    """
+    Sets the engine options of the primary and, with DATABASE_REPLICA_URL, adds
+    the replica bind. Must run before db.init_app.
+
+    Sticky marks are kept in redis when LIST_CACHE is "redis" and in process
+    memory otherwise, which only covers writes made by the same worker.
+    DB_REPLICA_STICKY_SECONDS=0 turns them off.
+    """
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options(app.config["SQLALCHEMY_DATABASE_URI"], app.config)
+
+    replica_url = app.config["DATABASE_REPLICA_URL"]
+    if not replica_url:
+        return
+
+    app.config["SQLALCHEMY_BINDS"] = {
+        REPLICA_BIND: {"url": replica_url, **engine_options(replica_url, app.config)}
+    }
+
+    from .services.cache_service import MemoryCache, RedisCache
+    ttl = app.config["DB_REPLICA_STICKY_SECONDS"]
+    if not ttl:
+        return
+    if app.config["LIST_CACHE"] == "redis":
+        app.extensions["replica_sticky"] = RedisCache(app.config["REDIS_URL"], ttl)
+    else:
+        app.extensions["replica_sticky"] = MemoryCache(app.config["LIST_CACHE_SIZE"], ttl)
+
+    if not event.contains(Session, "after_commit", _stick_after_commit):
+        event.listen(Session, "after_commit", _stick_after_commit)
+        event.listen(Session, "after_rollback", _discard_after_rollback)
@@ -0,0 +1,65 @@
+from flask import jsonify
+from sqlalchemy import text
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# -----------------------------
+# Pool and dependency status
+# -----------------------------
+def pool_status(engine) -> dict:
+    """Reads the engine's pool counters; no connection is checked out."""
+    pool = engine.pool
+    status = {"class": type(pool).__name__}
+    # QueuePool exposes counters; SQLite's static/singleton pools do not
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        counter = getattr(pool, name, None)
+        if callable(counter):
+            status[name] = counter()
+    return status
+
+
+def _ping(engine) -> bool:
+    # Checks out a pooled connection (opened only if the pool is empty) and returns it
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        return True
+    except Exception as e:
+        logger.warning("Readiness check failed for %s: %s", engine.url.render_as_string(), e)
+        return False
+
+
+# -----------------------------
+# Flask integration
+# -----------------------------
+def init_app(app):
+    """
+    Registers /healthz (liveness: the process serves requests, no I/O) and
+    /readyz (readiness: each database answers on a pooled connection). Both
+    are excluded from request metrics by metrics.init_app.
+    """
+    from . import db
+    from .services import ai_service
+
+    @app.route("/healthz")
+    def healthz():
+        return jsonify({"status": "ok"}), 200
+
+    @app.route("/readyz")
+    def readyz():
+        databases = {}
+        ready = True
+        for key, engine in db.engines.items():
+            ok = _ping(engine)
+            ready = ready and ok
+            databases[key or "primary"] = {"ok": ok, "pool": pool_status(engine)}
+
+        body = {
+            "status": "ready" if ready else "unavailable",
+            "databases": databases,
+            # Reported only: the app serves everything but AI feedback without it
+            "ai_client": ai_service.client_status()
+        }
+        return jsonify(body), 200 if ready else 503
@@ -0,0 +1,105 @@
+from flask import g, has_request_context, request
+import json
+import logging
+import re
+import sys
+import time
+import uuid
+
+REQUEST_ID_HEADER = "X-Request-ID"
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._-]{1,128}$")
+# Probes are polled every few seconds; logging them would drown the requests
+_UNLOGGED_ENDPOINTS = ("metrics", "healthz", "readyz")
+
+access_logger = logging.getLogger("app_package.access")
+
+# Attributes every LogRecord has; anything else was passed through `extra=`
+_STANDARD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "request_id"}
+
+
+# -----------------------------
+# Filter: attach correlation id
+# -----------------------------
+class RequestIdFilter(logging.Filter):
+    """Adds the current request's correlation id to every record ("-" outside requests)."""
+
+    def filter(self, record):
+        record.request_id = g.get("request_id", "-") if has_request_context() else "-"
+        return True
+
+
+# -----------------------------
+# Formatter: one JSON object per line
+# -----------------------------
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "logger": record.name,
+            "request_id": getattr(record, "request_id", "-"),
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _STANDARD_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+TEXT_FORMAT = "%(asctime)s %(levelname)s [%(request_id)s] %(name)s: %(message)s"
+
+
+def configure_logging(app):
+    """
+    Installs the app_package log handler and per-request correlation ids.
+
+    LOG_LEVEL sets the threshold (DEBUG, INFO, ...). LOG_FORMAT is "json" or
+    "text". Messages below the level are discarded before their arguments are
+    formatted, so debug logging costs nothing when disabled.
+
+    Every request except the probes gets one INFO line on app_package.access
+    with its method, path, status and duration. Streamed bodies are still
+    being sent when it is written.
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    handler.addFilter(RequestIdFilter())
+    if app.config["LOG_FORMAT"] == "json":
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+
+    logger = logging.getLogger("app_package")
+    logger.handlers = [handler]
+    logger.setLevel(app.config["LOG_LEVEL"].upper())
+    logger.propagate = False
+
+    @app.before_request
+    def assign_request_id():
+        # Reuse the caller's id (e.g. from a proxy) when it is safe to log
+        incoming = request.headers.get(REQUEST_ID_HEADER, "")
+        g.request_id = incoming if _VALID_REQUEST_ID.match(incoming) else uuid.uuid4().hex
+        g.access_log_start = time.perf_counter()
+
+    @app.after_request
+    def echo_request_id(response):
+        if "request_id" in g:
+            response.headers[REQUEST_ID_HEADER] = g.request_id
+        return response
+
+    @app.after_request
+    def log_request(response):
+        if "access_log_start" not in g or request.endpoint in _UNLOGGED_ENDPOINTS:
+            return response
+        duration_ms = round((time.perf_counter() - g.access_log_start) * 1000, 1)
+        access_logger.info(
+            "%s %s %s %.1fms", request.method, request.path, response.status_code, duration_ms,
+            extra={
+                "method": request.method,
+                "path": request.path,
+                "status": response.status_code,
+                "duration_ms": duration_ms
+            }
+        )
+        return response
@@ -0,0 +1,209 @@
+from flask import Response, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+import threading
+import time
+
+# Latency buckets in seconds, shared by every histogram below
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 250)
+
+
+# -----------------------------
+# Metric types
+# -----------------------------
+class Counter:
+    def __init__(self, name: str, help_text: str, labels: tuple = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels):
+        key = tuple(labels.get(label, "") for label in self.labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labels, key)} {value}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, labels: tuple = (), buckets: tuple = DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self.buckets = buckets
+        self._series = {}  # label values -> [bucket counts..., sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        key = tuple(labels.get(label, "") for label in self.labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def time(self, **labels):
+        """Context manager observing the wall-clock time of its block."""
+        return _Timer(self, labels)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, series in sorted(self._series.items()):
+                for bound, count in zip(self.buckets, series):
+                    le_labels = _format_labels(self.labels + ("le",), key + (_format_bound(bound),))
+                    lines.append(f"{self.name}_bucket{le_labels} {count}")
+                inf_labels = _format_labels(self.labels + ("le",), key + ("+Inf",))
+                lines.append(f"{self.name}_bucket{inf_labels} {series[-1]}")
+                lines.append(f"{self.name}_sum{_format_labels(self.labels, key)} {series[-2]}")
+                lines.append(f"{self.name}_count{_format_labels(self.labels, key)} {series[-1]}")
+        return lines
+
+
+class _Timer:
+    def __init__(self, histogram, labels):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.start, **self.labels)
+        return False
+
+
+def _format_bound(bound):
+    return str(float(bound)) if isinstance(bound, float) else str(bound)
+
+
+def _format_labels(names, values):
+    if not names:
+        return ""
+    pairs = []
+    for name, value in zip(names, values):
+        escaped = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{name}="{escaped}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+# -----------------------------
+# Registry
+# -----------------------------
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by blueprint and endpoint.",
+    labels=("blueprint", "endpoint", "method", "status")
+)
+DB_QUERIES_PER_REQUEST = Histogram(
+    "db_queries_per_request",
+    "Number of SQL statements executed per request.",
+    labels=("blueprint", "endpoint"),
+    buckets=QUERY_COUNT_BUCKETS
+)
+DB_TIME_PER_REQUEST = Histogram(
+    "db_time_per_request_seconds",
+    "Time spent executing SQL per request.",
+    labels=("blueprint", "endpoint")
+)
+DB_QUERIES_TOTAL = Counter(
+    "db_queries_total",
+    "SQL statements executed, including outside requests."
+)
+OPENAI_LATENCY = Histogram(
+    "openai_request_duration_seconds",
+    "Latency of OpenAI chat completion calls.",
+    labels=("mode",)
+)
+PDF_EXTRACTION_LATENCY = Histogram(
+    "pdf_extraction_duration_seconds",
+    "Time to extract text from an uploaded PDF.",
+    labels=("outcome",)
+)
+
+REGISTRY = (
+    REQUEST_LATENCY,
+    DB_QUERIES_PER_REQUEST,
+    DB_TIME_PER_REQUEST,
+    DB_QUERIES_TOTAL,
+    OPENAI_LATENCY,
+    PDF_EXTRACTION_LATENCY,
+)
+
+
+def render_metrics() -> str:
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+# -----------------------------
+# SQLAlchemy listeners
+# -----------------------------
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+    DB_QUERIES_TOTAL.inc()
+    if has_request_context() and "db_queries" in g:
+        g.db_queries += 1
+        g.db_time += elapsed
+
+
+def _install_engine_listeners():
+    # Listening on the Engine class covers every engine the app creates
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+# -----------------------------
+# Flask integration
+# -----------------------------
+def init_app(app):
+    """Installs request timing hooks, SQL listeners and the /metrics endpoint."""
+    _install_engine_listeners()
+
+    @app.before_request
+    def start_request_metrics():
+        g.request_start_time = time.perf_counter()
+        g.db_queries = 0
+        g.db_time = 0.0
+
+    @app.after_request
+    def record_request_metrics(response):
+        if "request_start_time" not in g or request.endpoint in ("metrics", "healthz", "readyz"):
+            return response
+
+        blueprint = request.blueprint or "app"
+        endpoint = request.endpoint or "unmatched"
+        REQUEST_LATENCY.observe(
+            time.perf_counter() - g.request_start_time,
+            blueprint=blueprint,
+            endpoint=endpoint,
+            method=request.method,
+            status=str(response.status_code)
+        )
+        DB_QUERIES_PER_REQUEST.observe(g.db_queries, blueprint=blueprint, endpoint=endpoint)
+        DB_TIME_PER_REQUEST.observe(g.db_time, blueprint=blueprint, endpoint=endpoint)
+        return response
+
+    @app.route("/metrics")
+    def metrics():
+        return Response(render_metrics(), mimetype="text/plain; version=0.0.4")
@@ -1,5 +1,6 @@
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime, timezone
+from sqlalchemy import DDL, event
 from . import db
 
 # ==========================
@@ -7,6 +8,9 @@ from . import db
 # ==========================
 class User(db.Model):
     __tablename__ = "users"
+    __table_args__ = (
+        db.Index("ix_users_username", "username"),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(255), nullable=False)
@@ -28,6 +32,11 @@ class User(db.Model):
 # ==========================
 class Job(db.Model):
     __tablename__ = "jobs"
+    __table_args__ = (
+        db.Index("ix_jobs_user_id_id", "user_id", "id"),
+        db.Index("ix_jobs_user_id_company", "user_id", "company"),
+        db.Index("ix_jobs_user_id_deadline", "user_id", "deadline"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(255), nullable=False)
@@ -39,6 +48,10 @@ class Job(db.Model):
     deadline = db.Column(db.DateTime)
     employment_type = db.Column(db.String(100), default="Full-time")
 
+    # Token counts of title + description for local match scoring (JSON), deferred
+    term_vector = db.deferred(db.Column(db.Text))
+    term_length = db.Column(db.Integer)
+
     user_id = db.Column(
         db.Integer,
         db.ForeignKey("users.id", ondelete="CASCADE", onupdate="CASCADE"),
@@ -77,12 +90,19 @@ class Job(db.Model):
 # ==========================
 class Resume(db.Model):
     __tablename__ = "resumes"
+    __table_args__ = (
+        db.Index("ix_resumes_user_id_id", "user_id", "id"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     content = db.Column(db.Text)
     title = db.Column(db.String(255))
     created_at = db.Column(db.DateTime, default=datetime.now(timezone.utc))
 
+    # Token counts of content for local match scoring (JSON), deferred
+    term_vector = db.deferred(db.Column(db.Text))
+    term_length = db.Column(db.Integer)
+
     # Foreign Key
     user_id = db.Column(
         db.Integer,
@@ -101,6 +121,11 @@ class Resume(db.Model):
 # ==========================
 class Application(db.Model):
     __tablename__ = "applications"
+    __table_args__ = (
+        db.Index("ix_applications_user_id_id", "user_id", "id"),
+        db.Index("ix_applications_user_id_status", "user_id", "status"),
+        db.Index("ix_applications_user_id_submitted_at", "user_id", "submitted_at"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(255), nullable=False)
@@ -124,6 +149,9 @@ class Application(db.Model):
 # ==========================
 class CoverLetter(db.Model):
     __tablename__ = "coverletters"
+    __table_args__ = (
+        db.Index("ix_coverletters_application_id_id", "application_id", "id"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(255), nullable=False)
@@ -137,3 +165,98 @@ class CoverLetter(db.Model):
 
     # Relationships
     application = db.relationship("Application", back_populates="coverletters")
+
+
+# ==========================
+# ResponseCache Model
+# ==========================
+class ResponseCache(db.Model):
+    __tablename__ = "response_cache"
+    __table_args__ = (
+        db.Index("ix_response_cache_expires_at", "expires_at"),
+    )
+
+    key = db.Column(db.String(64), primary_key=True)
+    value = db.Column(db.Text, nullable=False)
+    expires_at = db.Column(db.Float)  # unix timestamp, NULL = never expires
+
+
+# ==========================
+# FeedbackJob Model
+# ==========================
+class FeedbackJob(db.Model):
+    __tablename__ = "feedback_jobs"
+    __table_args__ = (
+        db.Index("ix_feedback_jobs_status_updated_at", "status", "updated_at"),
+    )
+
+    id = db.Column(db.String(36), primary_key=True)
+    status = db.Column(db.String(20), nullable=False, default="queued")  # queued, running, done, failed
+    prompt = db.Column(db.Text, nullable=False)
+    result = db.Column(db.Text)
+    error = db.Column(db.String(255))
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+    updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+
+    # Foreign Key
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id", ondelete="CASCADE", onupdate="CASCADE"), nullable=False)
+
+
+# ==========================
+# CollectionVersion Model
+# ==========================
+class CollectionVersion(db.Model):
+    __tablename__ = "collection_versions"
+
+    # Bumped on every write to one of a user's collections (jobs, applications, ...)
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id", ondelete="CASCADE", onupdate="CASCADE"), primary_key=True)
+    collection = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+
+# ==========================
+# Full-text search
+# ==========================
+# Searchable columns per table with their rank weight (A highest). Postgres
+# gets a generated tsvector column with a GIN index, SQLite an external-content
+# FTS5 table kept in sync by triggers. Neither is mapped on the models; the
+# migration creates them on migrated databases, the listeners below on create_all,
+# and migrations/env.py hides them from autogenerate.
+SEARCH_COLUMNS = {
+    "jobs": (("title", "A"), ("company", "B"), ("description", "C")),
+    "resumes": (("title", "A"), ("content", "B")),
+    "coverletters": (("title", "A"), ("content", "B")),
+}
+
+
+def postgres_search_ddl(table: str, columns) -> list:
+    vector = " || ".join(
+        f"setweight(to_tsvector('english', coalesce({name}, '')), '{weight}')"
+        for name, weight in columns
+    )
+    return [
+        f"ALTER TABLE {table} ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ({vector}) STORED",
+        f"CREATE INDEX ix_{table}_search_vector ON {table} USING GIN (search_vector)",
+    ]
+
+
+def sqlite_search_ddl(table: str, columns) -> list:
+    names = ", ".join(name for name, _ in columns)
+    new_values = ", ".join(f"new.{name}" for name, _ in columns)
+    old_values = ", ".join(f"old.{name}" for name, _ in columns)
+    insert = f"INSERT INTO {table}_fts(rowid, {names}) VALUES (new.id, {new_values});"
+    remove = f"INSERT INTO {table}_fts({table}_fts, rowid, {names}) VALUES ('delete', old.id, {old_values});"
+    return [
+        f"CREATE VIRTUAL TABLE {table}_fts USING fts5({names}, content='{table}', content_rowid='id', tokenize='porter unicode61')",
+        f"CREATE TRIGGER {table}_fts_ai AFTER INSERT ON {table} BEGIN {insert} END",
+        f"CREATE TRIGGER {table}_fts_ad AFTER DELETE ON {table} BEGIN {remove} END",
+        f"CREATE TRIGGER {table}_fts_au AFTER UPDATE ON {table} BEGIN {remove} {insert} END",
+    ]
+
+
+for _model in (Job, Resume, CoverLetter):
+    _table = _model.__table__
+    for _statement in postgres_search_ddl(_table.name, SEARCH_COLUMNS[_table.name]):
+        event.listen(_table, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+    for _statement in sqlite_search_ddl(_table.name, SEARCH_COLUMNS[_table.name]):
+        event.listen(_table, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
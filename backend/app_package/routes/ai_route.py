@@ -1,61 +1,35 @@
-from flask import Blueprint, request, jsonify, session
-import os
-from dotenv import load_dotenv
-from openai import OpenAI
+from flask import Blueprint, request, jsonify, session, Response, stream_with_context
+from ..services import ai_service, feedback_job_service
+import json
+import logging
 
-load_dotenv()
+logger = logging.getLogger(__name__)
 
 ai_bp = Blueprint("ai", __name__)
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-#Static system prompt 
-SYSTEM_PROMPT = (
-    "You are an experienced hiring manager and career coach."
-)
-#Feedback prompt
-FEEDBACK_PROMPT = """
-Your task is to review a cover letter in the context of:
-The candidate's resume
-The job description
 
-Your goal is to provide constructive, specific feedback to improve the cover letter.
-
-Do NOT rewrite the cover letter.
-Do NOT invent experience that is not present in the resume.
-Base all feedback strictly on the provided documents.
-If a section has no meaningful feedback, return an empty array rather than speculating.
-
-Focus on:
-- Alignment between the cover letter and the job description
-- How well the resume's strongest points are reflected
-- Missing or weak connections
-- Clarity, specificity, and tone
-
-Return your response strictly in JSON with keys in this order:
-strengths, gaps, suggestions, tone_feedback.
-
-Each item in "strengths", "gaps", and "suggestions" should be 1-2 sentences and reference concrete elements from the documents.
-"tone_feedback" should assess professionalism, confidence, enthusiasm, and clarity in 2-3 sentences. ONLY answer in the specified JSON format.
-
-JSON Structure:
-{{
-  "strengths": [string],
-  "gaps": [string],
-  "suggestions": [string],
-  "tone_feedback": string
-}}
-
-Documents:
+# -----------------------------
+# Helper: Build prompt from request payload
+# -----------------------------
+def _prompt_from_payload(data: dict):
+    resume = data.get("resume", "").strip()
+    job = data.get("job", "").strip()
+    cover_letter = data.get("cover_letter", "").strip()
 
-RESUME:
-\"\"\"{resume}\"\"\"
+    missing = []
+    if not resume:
+        missing.append("resume")
+    if not job:
+        missing.append("job")
+    if not cover_letter:
+        missing.append("cover_letter")
 
-JOB DESCRIPTION:
-\"\"\"{job}\"\"\"
+    if missing:
+        return None, missing
+    return ai_service.build_feedback_prompt(resume, job, cover_letter), []
 
-COVER LETTER:
-\"\"\"{cover_letter}\"\"\"
-"""
 
+def _sse(event: str, payload) -> str:
+    return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
 
 
 @ai_bp.route("/feedback", methods=["POST"])
@@ -69,45 +43,86 @@ def feedback():
     if not data:
         return jsonify({"error": "Invalid JSON body"}), 400
 
-    resume = data.get("resume", "").strip()
-    job = data.get("job", "").strip()
-    cover_letter = data.get("cover_letter", "").strip()
-
-    missing = []
-    if not resume:
-        missing.append("resume")
-    if not job:
-        missing.append("job")
-    if not cover_letter:
-        missing.append("cover_letter")
-
+    prompt, missing = _prompt_from_payload(data)
     if missing:
         return jsonify({
             "error": "Missing required fields",
             "missing": missing
         }), 400
 
-    prompt = FEEDBACK_PROMPT.format(
-        resume=resume,
-        job=job,
-        cover_letter=cover_letter
-    )
-    #OpenAI API call with their format
-    try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {"role": "user", "content": prompt},
-            ],
-            temperature=0.3,
-        )
-
-        content = response.choices[0].message.content
+    # Async mode: queue the call and let the client poll for the result
+    if request.args.get("async") in ("1", "true") or data.get("async") is True:
+        result, status = feedback_job_service.enqueue_feedback_job(session["user_id"], prompt)
+        return jsonify(result), status
 
-        return jsonify({"feedback": content}), 200
+    try:
+        content, cached = ai_service.generate_feedback(prompt)
+        return jsonify({"feedback": content}), 200, {"X-Cache": "HIT" if cached else "MISS"}
 
     except Exception as e:
+        logger.exception("AI feedback generation failed: %s", e)
         return jsonify({
             "error": "AI feedback generation failed"
         }), 500
+
+
+# -----------------------------
+# Stream feedback as Server-Sent Events
+# -----------------------------
+@ai_bp.route("/feedback/stream", methods=["POST"])
+def feedback_stream():
+    if not session.get("user_id"):
+        return jsonify({"error": "Unauthorized"}), 401
+
+    data = request.get_json(silent=True)
+    if not data:
+        return jsonify({"error": "Invalid JSON body"}), 400
+
+    prompt, missing = _prompt_from_payload(data)
+    if missing:
+        return jsonify({
+            "error": "Missing required fields",
+            "missing": missing
+        }), 400
+
+    def generate():
+        parts = []
+        try:
+            for delta in ai_service.stream_feedback(prompt):
+                parts.append(delta)
+                yield _sse("token", {"text": delta})
+        except Exception as e:
+            logger.exception("AI feedback stream failed: %s", e)
+            yield _sse("error", {"error": "AI feedback generation failed"})
+            return
+
+        # Final event carries the validated feedback object
+        try:
+            feedback = ai_service.parse_feedback("".join(parts))
+        except ValueError as e:
+            logger.warning("AI feedback stream returned invalid feedback: %s", e)
+            yield _sse("error", {"error": "AI returned invalid feedback", "detail": str(e)})
+            return
+        yield _sse("result", {"feedback": feedback})
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+# -----------------------------
+# Poll an async feedback job
+# -----------------------------
+@ai_bp.route("/feedback/<job_id>", methods=["GET"])
+def feedback_status(job_id):
+    user_id = session.get("user_id")
+    if not user_id:
+        return jsonify({"error": "Unauthorized"}), 401
+
+    job = feedback_job_service.get_feedback_job(user_id, job_id)
+    if not job:
+        return jsonify({"error": "Not found"}), 404
+
+    return jsonify(job), 200
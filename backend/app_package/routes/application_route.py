@@ -1,5 +1,9 @@
 from flask import Blueprint, request, jsonify, session
-from ..services import application_service
+from ..services import application_service, export_service
+from ..utils import parse_page_args, parse_fields_arg, parse_bulk_items, parse_bulk_ids, parse_export_format
+from ..strict_mode import query_budget
+from ..conditional import conditional_get
+from ..services.collection_version_service import APPLICATIONS
 
 application_bp = Blueprint("application_bp", __name__)
 
@@ -7,18 +11,50 @@ application_bp = Blueprint("application_bp", __name__)
 # LIST all applications for the logged-in user
 # -----------------------------
 @application_bp.route("/list", methods=["GET"])
+@conditional_get(APPLICATIONS)
+@query_budget(2)
 def list_applications():
     user_id = session.get("user_id")
     if not user_id:
         return jsonify({"error": "Unauthorized"}), 401
 
-    apps = application_service.get_applications_by_user(user_id)
+    try:
+        filters, sort = application_service.parse_application_filters(request.args)
+        # Only the default sort pages by id; the others page by offset
+        limit, after = parse_page_args(request.args, offset_cursor=sort != application_service.DEFAULT_SORT)
+        summary = parse_fields_arg(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    apps = application_service.get_applications_by_user(user_id, limit, after, summary, filters, sort)
     return jsonify(apps), 200  # already serialized in service
 
+# -----------------------------
+# STATS for the dashboard
+# -----------------------------
+@application_bp.route("/stats", methods=["GET"])
+@conditional_get(APPLICATIONS)
+@query_budget(4)
+def application_stats():
+    user_id = session.get("user_id")
+    if not user_id:
+        return jsonify({"error": "Unauthorized"}), 401
+
+    try:
+        upcoming = int(request.args.get("upcoming", 4))
+    except ValueError:
+        return jsonify({"error": "upcoming must be an integer"}), 400
+    if upcoming < 0 or upcoming > 50:
+        return jsonify({"error": "upcoming must be between 0 and 50"}), 400
+
+    stats, status = application_service.get_application_stats(user_id, upcoming)
+    return jsonify(stats), status
+
 # -----------------------------
 # CREATE a new application
 # -----------------------------
 @application_bp.route("/create", methods=["POST"])
+@query_budget(4)
 def create_application():
     user_id = session.get("user_id")
     if not user_id:
@@ -36,6 +72,8 @@ def create_application():
 # GET a single application by ID
 # -----------------------------
 @application_bp.route("/<int:app_id>", methods=["GET"])
+@conditional_get(APPLICATIONS)
+@query_budget(2)
 def get_application(app_id):
     user_id = session.get("user_id")
     if not user_id:
@@ -52,6 +90,7 @@ def get_application(app_id):
 # UPDATE an application by ID
 # -----------------------------
 @application_bp.route("/update/<int:app_id>", methods=["PUT"])
+@query_budget(5)
 def update_application(app_id):
     user_id = session.get("user_id")
     if not user_id:
@@ -69,6 +108,7 @@ def update_application(app_id):
 # DELETE an application by ID
 # -----------------------------
 @application_bp.route("/delete/<int:app_id>", methods=["DELETE"])
+@query_budget(6)
 def delete_application(app_id):
     user_id = session.get("user_id")
     if not user_id:
@@ -79,3 +119,74 @@ def delete_application(app_id):
         return jsonify({"error": "Not found"}), 404
 
     return jsonify({"message": "Application deleted"}), 200
+
+
+# -----------------------------
+# BULK CREATE / UPDATE / DELETE
+# -----------------------------
+@application_bp.route("/bulk/create", methods=["POST"])
+@query_budget(5)
+def bulk_create_applications():
+    user_id = session.get("user_id")
+    if not user_id:
+        return jsonify({"error": "Unauthorized"}), 401
+
+    try:
+        items = parse_bulk_items(request.get_json(silent=True), "applications")
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    result, status = application_service.bulk_create_applications(user_id, items)
+    return jsonify(result), status
+
+
+@application_bp.route("/bulk/update", methods=["PUT"])
+@query_budget(3)
+def bulk_update_applications():
+    user_id = session.get("user_id")
+    if not user_id:
+        return jsonify({"error": "Unauthorized"}), 401
+
+    data = request.get_json(silent=True)
+    try:
+        ids = parse_bulk_ids(data)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    result, status = application_service.bulk_update_applications(user_id, ids, data.get("changes"))
+    return jsonify(result), status
+
+
+@application_bp.route("/bulk/delete", methods=["DELETE"])
+@query_budget(4)
+def bulk_delete_applications():
+    user_id = session.get("user_id")
+    if not user_id:
+        return jsonify({"error": "Unauthorized"}), 401
+
+    try:
+        ids = parse_bulk_ids(request.get_json(silent=True))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    result, status = application_service.bulk_delete_applications(user_id, ids)
+    return jsonify(result), status
+
+
+# -----------------------------
+# EXPORT (all applications with their job) as NDJSON or CSV
+# -----------------------------
+@application_bp.route("/export", methods=["GET"])
+def export_applications():
+    user_id = session.get("user_id")
+    if not user_id:
+        return jsonify({"error": "Unauthorized"}), 401
+
+    try:
+        fmt = parse_export_format(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    # Streamed straight from the cursor; rows are never collected into a list
+    chunks = export_service.export_applications(user_id, fmt)
+    return export_service.export_response(chunks, fmt, "applications")
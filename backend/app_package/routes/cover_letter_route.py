@@ -1,8 +1,9 @@
 from flask import Blueprint, request, jsonify, session
-from ..services import cover_letter_service
-from ..services.ai_service import extract_text_from_pdf
-import tempfile
-import os
+from ..services import cover_letter_service, export_service, pdf_service, search_service
+from ..utils import parse_page_args, parse_fields_arg, parse_export_format, parse_search_args
+from ..strict_mode import query_budget
+from ..conditional import conditional_get
+from ..services.collection_version_service import COVER_LETTERS
 
 cover_letter_bp = Blueprint("cover_letter_bp", __name__)
 
@@ -10,12 +11,20 @@ cover_letter_bp = Blueprint("cover_letter_bp", __name__)
 # Get all cover letters
 # -----------------------------
 @cover_letter_bp.route("/list", methods=["GET"])
+@conditional_get(COVER_LETTERS)
+@query_budget(2)
 def get_cover_letters():
     user_id = session.get("user_id")
     if not user_id:
         return jsonify({"error": "Unauthorized"}), 401
 
-    cover_letters = cover_letter_service.get_cover_letters_by_user(user_id)
+    try:
+        limit, after = parse_page_args(request.args)
+        summary = parse_fields_arg(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    cover_letters = cover_letter_service.get_cover_letters_by_user(user_id, limit, after, summary)
     return jsonify(cover_letters), 200
 
 
@@ -23,6 +32,8 @@ def get_cover_letters():
 # Get single cover letter
 # -----------------------------
 @cover_letter_bp.route("/<int:cl_id>", methods=["GET"])
+@conditional_get(COVER_LETTERS)
+@query_budget(2)
 def get_cover_letter(cl_id):
     user_id = session.get("user_id")
     if not user_id:
@@ -39,6 +50,7 @@ def get_cover_letter(cl_id):
 # Create cover letter (PDF supported)
 # -----------------------------
 @cover_letter_bp.route("/create", methods=["POST"])
+@query_budget(4)
 def create_cover_letter():
     user_id = session.get("user_id")
     if not user_id:
@@ -60,14 +72,12 @@ def create_cover_letter():
         if not pdf_file.filename.lower().endswith(".pdf"):
                 return jsonify({"error": "Only PDF files are supported"}), 400
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-            pdf_file.save(tmp.name)
-            content = extract_text_from_pdf(tmp.name)
+        extracted, extract_status = pdf_service.extract_pdf_text(pdf_file.read())
 
-        os.remove(tmp.name)
+        if extract_status != 200:
+            return jsonify(extracted), extract_status
 
-        if not content:
-            return jsonify({"error": "Could not extract text from PDF"}), 400
+        content = extracted["text"]
 
     result, status = cover_letter_service.create_cover_letter(user_id, {
         "title": title,
@@ -83,6 +93,7 @@ def create_cover_letter():
 # Update cover letter (PDF supported)
 # -----------------------------
 @cover_letter_bp.route("/update/<int:cl_id>", methods=["PUT"])
+@query_budget(4)
 def update_cover_letter(cl_id):
     user_id = session.get("user_id")
     if not user_id:
@@ -98,14 +109,12 @@ def update_cover_letter(cl_id):
         if pdf_file.mimetype != "application/pdf":
             return jsonify({"error": "Invalid file type"}), 400
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-            pdf_file.save(tmp.name)
-            content = extract_text_from_pdf(tmp.name)
+        extracted, extract_status = pdf_service.extract_pdf_text(pdf_file.read())
 
-        os.remove(tmp.name)
+        if extract_status != 200:
+            return jsonify(extracted), extract_status
 
-        if not content:
-            return jsonify({"error": "Could not extract text from PDF"}), 400
+        content = extracted["text"]
 
     updates = {}
     if title is not None:
@@ -125,6 +134,7 @@ def update_cover_letter(cl_id):
 # Delete cover letter
 # -----------------------------
 @cover_letter_bp.route("/delete/<int:cl_id>", methods=["DELETE"])
+@query_budget(3)
 def delete_cover_letter(cl_id):
     user_id = session.get("user_id")
     if not user_id:
@@ -132,3 +142,42 @@ def delete_cover_letter(cl_id):
 
     result, status = cover_letter_service.delete_cover_letter(user_id, cl_id)
     return jsonify(result), status
+
+
+# -----------------------------
+# EXPORT (all cover letters) as NDJSON or CSV
+# -----------------------------
+@cover_letter_bp.route("/export", methods=["GET"])
+def export_cover_letters():
+    user_id = session.get("user_id")
+    if not user_id:
+        return jsonify({"error": "Unauthorized"}), 401
+
+    try:
+        fmt = parse_export_format(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    # Streamed straight from the cursor; rows are never collected into a list
+    chunks = export_service.export_cover_letters(user_id, fmt)
+    return export_service.export_response(chunks, fmt, "cover_letters")
+
+
+# -----------------------------
+# SEARCH cover letters by title and content (ranked, paginated)
+# -----------------------------
+@cover_letter_bp.route("/search", methods=["GET"])
+@conditional_get(COVER_LETTERS)
+@query_budget(2)
+def search_cover_letters():
+    user_id = session.get("user_id")
+    if not user_id:
+        return jsonify({"error": "Unauthorized"}), 401
+
+    try:
+        q, limit, offset = parse_search_args(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    result, status = search_service.search_cover_letters(user_id, q, limit, offset)
+    return jsonify(result), status
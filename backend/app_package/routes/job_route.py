@@ -1,11 +1,19 @@
 from flask import Blueprint, request, jsonify, session
-from ..services import job_service
+from ..services import export_service, job_service, search_service
+from ..utils import parse_page_args, parse_fields_arg, parse_bulk_items, parse_bulk_ids, parse_export_format, parse_search_args
+from ..strict_mode import query_budget
+from ..conditional import conditional_get
+from ..services.collection_version_service import JOBS
+import logging
+
+logger = logging.getLogger(__name__)
 
 job_bp = Blueprint("job_bp", __name__)
 # -----------------------------
 # CREATE JOB
 # -----------------------------
 @job_bp.route("/create", methods=["POST"])
+@query_budget(3)
 def create_job_route():
     user_id = session.get("user_id")
     if not user_id:
@@ -22,24 +30,33 @@ def create_job_route():
 # LIST jobs for current user
 # -----------------------------
 @job_bp.route("/list", methods=["GET"])
+@conditional_get(JOBS)
+@query_budget(2)
 def list_jobs():
     user_id = session.get("user_id")
-    print(f"[DEBUG] list_jobs called. session user_id={user_id}")
 
     if not user_id:
-        print("[WARN] Unauthorized access to /list")
+        logger.warning("Unauthorized access to /list")
         return jsonify({"error": "Unauthorized"}), 401
 
-    jobs = job_service.get_jobs_by_user(user_id)
-    print(f"[DEBUG] Returning {len(jobs)} jobs for user_id={user_id}")
-    for job in jobs:
-        print(f"[DEBUG] Job: {job}")
+    try:
+        limit, after = parse_page_args(request.args)
+        summary = parse_fields_arg(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    jobs = job_service.get_jobs_by_user(user_id, limit, after, summary)
+    if logger.isEnabledFor(logging.DEBUG):
+        page = jobs["items"] if limit is not None else jobs
+        logger.debug("Returning %d jobs", len(page), extra={"user_id": user_id})
 
     return jsonify(jobs), 200
 # -----------------------------
 # GET SINGLE
 # -----------------------------
 @job_bp.route("/<int:job_id>", methods=["GET"])
+@conditional_get(JOBS)
+@query_budget(2)
 def get_job(job_id):
     user_id = session.get("user_id")
     if not user_id:
@@ -53,6 +70,7 @@ def get_job(job_id):
 # UPDATE job
 # -----------------------------
 @job_bp.route("/<int:job_id>", methods=["PUT"])
+@query_budget(5)
 def update_job_route(job_id):
     user_id = session.get("user_id")
     if not user_id:
@@ -62,8 +80,130 @@ def update_job_route(job_id):
     if not data:
         return jsonify({"error": "Missing request body"}), 400
 
+    try:
+        data = job_service.parse_job_dates(data)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
     updated_job = job_service.update_job(user_id, job_id, data)
     if not updated_job:
         return jsonify({"error": "Not found or permission denied"}), 404
 
     return jsonify(updated_job), 200
+
+# -----------------------------
+# BULK CREATE / UPDATE / DELETE
+# -----------------------------
+@job_bp.route("/bulk/create", methods=["POST"])
+@query_budget(4)
+def bulk_create_jobs_route():
+    user_id = session.get("user_id")
+    if not user_id:
+        return jsonify({"error": "Unauthorized"}), 401
+
+    try:
+        items = parse_bulk_items(request.get_json(silent=True), "jobs")
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    result, status = job_service.bulk_create_jobs(user_id, items)
+    return jsonify(result), status
+
+
+@job_bp.route("/bulk/update", methods=["PUT"])
+@query_budget(3)
+def bulk_update_jobs_route():
+    user_id = session.get("user_id")
+    if not user_id:
+        return jsonify({"error": "Unauthorized"}), 401
+
+    data = request.get_json(silent=True)
+    try:
+        ids = parse_bulk_ids(data)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    result, status = job_service.bulk_update_jobs(user_id, ids, data.get("changes"))
+    return jsonify(result), status
+
+
+@job_bp.route("/bulk/delete", methods=["DELETE"])
+@query_budget(6)
+def bulk_delete_jobs_route():
+    user_id = session.get("user_id")
+    if not user_id:
+        return jsonify({"error": "Unauthorized"}), 401
+
+    try:
+        ids = parse_bulk_ids(request.get_json(silent=True))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    result, status = job_service.bulk_delete_jobs(user_id, ids)
+    return jsonify(result), status
+
+
+# -----------------------------
+# IMPORT from CSV / JSONL upload
+# -----------------------------
+@job_bp.route("/import", methods=["POST"])
+@query_budget(None)
+def import_jobs_route():
+    user_id = session.get("user_id")
+    if not user_id:
+        return jsonify({"error": "Unauthorized"}), 401
+
+    upload = request.files.get("file")
+    if not upload:
+        return jsonify({"error": "No file uploaded"}), 400
+
+    # Explicit ?format= wins over the file extension
+    fmt = request.args.get("format") or request.form.get("format")
+    if not fmt:
+        extension = (upload.filename or "").rsplit(".", 1)[-1].lower()
+        fmt = "jsonl" if extension == "ndjson" else extension
+    if fmt not in job_service.IMPORT_FORMATS:
+        return jsonify({"error": "format must be 'csv' or 'jsonl'"}), 400
+
+    # Werkzeug spools large uploads to disk, so the file is read as a stream
+    result, status = job_service.import_jobs(user_id, upload.stream, fmt)
+    return jsonify(result), status
+
+
+# -----------------------------
+# EXPORT (all jobs) as NDJSON or CSV
+# -----------------------------
+@job_bp.route("/export", methods=["GET"])
+def export_jobs_route():
+    user_id = session.get("user_id")
+    if not user_id:
+        return jsonify({"error": "Unauthorized"}), 401
+
+    try:
+        fmt = parse_export_format(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    # Streamed straight from the cursor; rows are never collected into a list
+    chunks = export_service.export_jobs(user_id, fmt)
+    return export_service.export_response(chunks, fmt, "jobs")
+
+
+# -----------------------------
+# SEARCH jobs by title, company and description (ranked, paginated)
+# -----------------------------
+@job_bp.route("/search", methods=["GET"])
+@conditional_get(JOBS)
+@query_budget(2)
+def search_jobs_route():
+    user_id = session.get("user_id")
+    if not user_id:
+        return jsonify({"error": "Unauthorized"}), 401
+
+    try:
+        q, limit, offset = parse_search_args(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    result, status = search_service.search_jobs(user_id, q, limit, offset)
+    return jsonify(result), status
@@ -1,8 +1,9 @@
 from flask import Blueprint, request, jsonify, session
-from ..services import resume_service
-from ..services.ai_service import extract_text_from_pdf
-import tempfile
-import os
+from ..services import match_service, resume_service, pdf_service, search_service
+from ..utils import parse_page_args, parse_fields_arg, parse_search_args
+from ..strict_mode import query_budget
+from ..conditional import conditional_get
+from ..services.collection_version_service import RESUMES
 
 resume_bp = Blueprint("resume_bp", __name__)
 
@@ -10,12 +11,20 @@ resume_bp = Blueprint("resume_bp", __name__)
 # List all resumes
 # -----------------------------
 @resume_bp.route("/list", methods=["GET"])
+@conditional_get(RESUMES)
+@query_budget(2)
 def list_resumes():
     user_id = session.get("user_id")
     if not user_id:
         return jsonify({"error": "Unauthorized"}), 401
 
-    result, status = resume_service.get_resumes_by_user(user_id)
+    try:
+        limit, after = parse_page_args(request.args)
+        summary = parse_fields_arg(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    result, status = resume_service.get_resumes_by_user(user_id, limit, after, summary)
     return jsonify(result), status
 
 
@@ -23,6 +32,7 @@ def list_resumes():
 # Create a new resume (PDF supported)
 # -----------------------------
 @resume_bp.route("/create", methods=["POST"])
+@query_budget(3)
 def create_resume():
     user_id = session.get("user_id")
     if not user_id:
@@ -36,15 +46,12 @@ def create_resume():
         if pdf_file.mimetype != "application/pdf" or not pdf_file.filename.lower().endswith(".pdf"):
             return jsonify({"error": "Only PDF files are supported"}), 400
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-            pdf_file.save(tmp.name)
-            extracted_text = extract_text_from_pdf(tmp.name)
-        os.remove(tmp.name)
+        extracted, extract_status = pdf_service.extract_pdf_text(pdf_file.read())
 
-        if not extracted_text:
-            return jsonify({"error": "Could not extract text from PDF"}), 400
+        if extract_status != 200:
+            return jsonify(extracted), extract_status
 
-        content = extracted_text 
+        content = extracted["text"] 
 
     result, status = resume_service.create_resume(user_id, {
         "title": title,
@@ -57,6 +64,7 @@ def create_resume():
 # Update an existing resume (PDF supported)
 # -----------------------------
 @resume_bp.route("/update/<int:resume_id>", methods=["PUT"])
+@query_budget(4)
 def update_resume(resume_id):
     user_id = session.get("user_id")
     if not user_id:
@@ -70,15 +78,12 @@ def update_resume(resume_id):
         if pdf_file.mimetype != "application/pdf" or not pdf_file.filename.lower().endswith(".pdf"):
             return jsonify({"error": "Only PDF files are supported"}), 400
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-            pdf_file.save(tmp.name)
-            extracted_text = extract_text_from_pdf(tmp.name)
-        os.remove(tmp.name)
+        extracted, extract_status = pdf_service.extract_pdf_text(pdf_file.read())
 
-        if not extracted_text:
-            return jsonify({"error": "Could not extract text from PDF"}), 400
+        if extract_status != 200:
+            return jsonify(extracted), extract_status
 
-        content = extracted_text
+        content = extracted["text"]
 
     updates = {}
     if title is not None:
@@ -94,6 +99,7 @@ def update_resume(resume_id):
 # Delete a resume
 # -----------------------------
 @resume_bp.route("/delete/<int:resume_id>", methods=["DELETE"])
+@query_budget(5)
 def delete_resume(resume_id):
     user_id = session.get("user_id")
     if not user_id:
@@ -101,3 +107,41 @@ def delete_resume(resume_id):
 
     result, status = resume_service.delete_resume(user_id, resume_id)
     return jsonify(result), status
+
+
+# -----------------------------
+# SEARCH resumes by title and content (ranked, paginated)
+# -----------------------------
+@resume_bp.route("/search", methods=["GET"])
+@conditional_get(RESUMES)
+@query_budget(2)
+def search_resumes():
+    user_id = session.get("user_id")
+    if not user_id:
+        return jsonify({"error": "Unauthorized"}), 401
+
+    try:
+        q, limit, offset = parse_search_args(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    result, status = search_service.search_resumes(user_id, q, limit, offset)
+    return jsonify(result), status
+
+
+# -----------------------------
+# MATCH all jobs against a resume (local BM25 scoring)
+# -----------------------------
+@resume_bp.route("/<int:resume_id>/matches", methods=["GET"])
+@query_budget(7)
+def resume_matches(resume_id):
+    user_id = session.get("user_id")
+    if not user_id:
+        return jsonify({"error": "Unauthorized"}), 401
+
+    limit = request.args.get("limit", 20, type=int)
+    if limit < 1 or limit > 200:
+        return jsonify({"error": "limit must be between 1 and 200"}), 400
+
+    result, status = match_service.score_jobs_for_resume(user_id, resume_id, limit)
+    return jsonify(result), status
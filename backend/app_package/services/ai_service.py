@@ -1,34 +1,211 @@
-import fitz  # PyMuPDF
 import os
-import logging
+import json
+from dotenv import load_dotenv
+from flask import current_app
+from .cache_service import hash_key
+from ..metrics import OPENAI_LATENCY
+import threading
+import time
 
-def extract_text_from_pdf(file_path: str, pages: list[int] = None) -> str:
+load_dotenv()
+
+# The openai package takes a few hundred ms to import, so the client is built on first use
+_client = None
+_client_lock = threading.Lock()
+MODEL = "gpt-4o-mini"
+TEMPERATURE = 0.3
+#Static system prompt 
+SYSTEM_PROMPT = (
+    "You are an experienced hiring manager and career coach."
+)
+#Feedback prompt
+FEEDBACK_PROMPT = """
+Your task is to review a cover letter in the context of:
+The candidate's resume
+The job description
+
+Your goal is to provide constructive, specific feedback to improve the cover letter.
+
+Do NOT rewrite the cover letter.
+Do NOT invent experience that is not present in the resume.
+Base all feedback strictly on the provided documents.
+If a section has no meaningful feedback, return an empty array rather than speculating.
+
+Focus on:
+- Alignment between the cover letter and the job description
+- How well the resume's strongest points are reflected
+- Missing or weak connections
+- Clarity, specificity, and tone
+
+Return your response strictly in JSON with keys in this order:
+strengths, gaps, suggestions, tone_feedback.
+
+Each item in "strengths", "gaps", and "suggestions" should be 1-2 sentences and reference concrete elements from the documents.
+"tone_feedback" should assess professionalism, confidence, enthusiasm, and clarity in 2-3 sentences. ONLY answer in the specified JSON format.
+
+JSON Structure:
+{{
+  "strengths": [string],
+  "gaps": [string],
+  "suggestions": [string],
+  "tone_feedback": string
+}}
+
+Documents:
+
+RESUME:
+\"\"\"{resume}\"\"\"
+
+JOB DESCRIPTION:
+\"\"\"{job}\"\"\"
+
+COVER LETTER:
+\"\"\"{cover_letter}\"\"\"
+"""
+
+
+def get_client():
+    """Returns the shared OpenAI client, importing and creating it on first call."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                from openai import OpenAI
+                _client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    return _client
+
+
+def client_status() -> str:
+    """Reports the OpenAI client state without creating it or calling the API."""
+    if not os.getenv("OPENAI_API_KEY"):
+        return "missing_api_key"
+    return "loaded" if _client is not None else "configured"
+
+
+def build_feedback_prompt(resume: str, job: str, cover_letter: str) -> str:
+    """Renders FEEDBACK_PROMPT for the given documents."""
+    return FEEDBACK_PROMPT.format(
+        resume=resume,
+        job=job,
+        cover_letter=cover_letter
+    )
+
+
+def generate_feedback(prompt: str) -> tuple[str, bool]:
     """
-    Extracts plain text from a PDF file.
+    Gets cover letter feedback for a rendered prompt from OpenAI.
 
-    Args:
-        file_path (str): Path to the PDF file.
-        pages (list[int], optional): List of page numbers to extract (0-indexed). Extracts all pages if None.
+    Identical prompts produce identical requests, so answers are served from the
+    feedback cache when one is configured.
 
     Returns:
-        str: Extracted text, empty string if file missing or extraction fails.
+        tuple: (feedback JSON string, True if it came from the cache).
+
+    Raises:
+        Exception: If the OpenAI call fails.
     """
-    if not os.path.exists(file_path):
-        logging.warning(f"PDF file not found: {file_path}")
-        return ""
+    cache = current_app.extensions.get("feedback_cache")
+    cache_key = hash_key(MODEL, SYSTEM_PROMPT, prompt, TEMPERATURE)
+    if cache is not None:
+        content = cache.get(cache_key)
+        if content is not None:
+            return content, True
+
+    #OpenAI API call with their format
+    with OPENAI_LATENCY.time(mode="sync"):
+        response = get_client().chat.completions.create(
+            model=MODEL,
+            messages=_feedback_messages(prompt),
+            temperature=TEMPERATURE,
+        )
+    content = response.choices[0].message.content
+
+    if cache is not None:
+        _cache_if_valid(cache, cache_key, content)
 
-    text = ""
+    return content, False
+
+
+def stream_feedback(prompt: str):
+    """
+    Streams cover letter feedback for a rendered prompt from OpenAI.
+
+    Yields the text deltas as the model produces them. A cached answer is
+    yielded as a single chunk, and a completed answer is written to the cache.
+
+    Raises:
+        Exception: If the OpenAI call fails.
+    """
+    cache = current_app.extensions.get("feedback_cache")
+    cache_key = hash_key(MODEL, SYSTEM_PROMPT, prompt, TEMPERATURE)
+    if cache is not None:
+        content = cache.get(cache_key)
+        if content is not None:
+            yield content
+            return
+
+    start = time.perf_counter()
+    stream = get_client().chat.completions.create(
+        model=MODEL,
+        messages=_feedback_messages(prompt),
+        temperature=TEMPERATURE,
+        stream=True,
+    )
+    parts = []
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if delta:
+            parts.append(delta)
+            yield delta
+    OPENAI_LATENCY.observe(time.perf_counter() - start, mode="stream")
+
+    if cache is not None:
+        _cache_if_valid(cache, cache_key, "".join(parts))
+
+
+def parse_feedback(content: str) -> dict:
+    """
+    Parses and validates the JSON feedback returned by the model.
+
+    Raises:
+        ValueError: If the content is not JSON in the FEEDBACK_PROMPT structure.
+    """
+    text = content.strip()
+    # Models sometimes wrap JSON in a markdown code fence
+    if text.startswith("```"):
+        text = text.strip("`")
+        if text.startswith("json"):
+            text = text[len("json"):]
+
+    try:
+        feedback = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Feedback is not valid JSON: {e}")
+
+    if not isinstance(feedback, dict):
+        raise ValueError("Feedback must be a JSON object")
+    for key in ("strengths", "gaps", "suggestions"):
+        if not isinstance(feedback.get(key), list):
+            raise ValueError(f"Feedback field '{key}' must be a list")
+    if not isinstance(feedback.get("tone_feedback"), str):
+        raise ValueError("Feedback field 'tone_feedback' must be a string")
+
+    return feedback
+
+
+def _cache_if_valid(cache, cache_key: str, content: str):
+    # Never cache a malformed answer, or every retry would get it back
     try:
-        doc = fitz.open(file_path)
-        page_indices = pages if pages is not None else range(len(doc))
-        for i in page_indices:
-            if 0 <= i < len(doc):
-                page_text = doc[i].get_text().strip()
-                if page_text:
-                    text += page_text + "\n"
-        doc.close()
-    except Exception as e:
-        logging.error(f"Failed to extract text from PDF '{file_path}': {e}")
-        text = ""
-
-    return text.strip()
+        parse_feedback(content or "")
+    except ValueError:
+        return
+    cache.set(cache_key, content)
+
+
+def _feedback_messages(prompt: str) -> list[dict]:
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": prompt},
+    ]
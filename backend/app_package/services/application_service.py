@@ -1,9 +1,69 @@
-from ..models import Application
+from ..database import reads_from_replica
+from ..models import Application, CoverLetter, Job, Resume
 from ..import db
-from sqlalchemy.orm import joinedload
+from .collection_version_service import bump_collection_versions, APPLICATIONS, COVER_LETTERS
+from .list_cache_service import cached_list
+from ..utils import insert_returning_ids, paginate_by_id, paginate_by_offset, parse_iso_datetime
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.orm import contains_eager, joinedload
 import datetime
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Job columns needed by the summary projection (no description)
+JOB_SUMMARY_COLUMNS = (
+    Job.id, Job.title, Job.company, Job.location,
+    Job.employment_type, Job.job_url, Job.deadline
+)
+
+# List filters: ?status=, ?employment_type= (repeated or comma-separated) and
+# ?company= (repeated; names may contain commas), matched exactly
+LIST_FILTERS = {
+    "status": Application.status,
+    "company": Job.company,
+    "employment_type": Job.employment_type
+}
+COMMA_SEPARATED_FILTERS = ("status", "employment_type")
+# Range filters: "_after" is inclusive, "_before" exclusive
+RANGE_FILTERS = {
+    "submitted_after": Application.submitted_at,
+    "submitted_before": Application.submitted_at,
+    "deadline_after": Job.deadline,
+    "deadline_before": Job.deadline
+}
+# ?sort=<key> ascending, ?sort=-<key> descending
+SORT_COLUMNS = {
+    "id": Application.id,
+    "submitted_at": Application.submitted_at,
+    "status": Application.status,
+    "title": Application.title,
+    "company": Job.company,
+    "deadline": Job.deadline
+}
+DEFAULT_SORT = "-id"
+
+def serialize_application(app: Application, summary: bool = False):
+    if summary:
+        return {
+            "id": app.id,
+            "title": app.title,
+            "submitted_at": app.submitted_at,
+            "status": app.status,
+            "user_id": app.user_id,
+            "job_id": app.job_id,
+            "resume_id": app.resume_id,
+            "job": {
+                "id": app.job.id,
+                "title": app.job.title,
+                "company": app.job.company,
+                "location": app.job.location,
+                "employment_type": app.job.employment_type,
+                "job_url": app.job.job_url,
+                "deadline": app.job.deadline
+            } if app.job else None
+        }
 
-def serialize_application(app: Application):
     return {
         "id": app.id,
         "title": app.title,
@@ -40,42 +100,204 @@ def create_application(user_id: int, data: dict):
         new_app = Application(
             title=title,
             status=data.get("status", "Pending"),
-            submitted_at=datetime.datetime.now(),
+            submitted_at=_utcnow(),
             user_id=user_id,
             job_id=job_id,
             resume_id=data.get("resume_id")
         )
 
         db.session.add(new_app)
+        bump_collection_versions(user_id, APPLICATIONS)
         db.session.commit()
         return serialize_application(new_app), 201
 
     except Exception as e:
         db.session.rollback()
-        print("Error creating application:", e)
+        logger.exception("Error creating application: %s", e)
         return {"error": "Internal server error"}, 500
 
 
+# -----------------------------
+# LIST FILTERS
+# -----------------------------
+def _naive_utc(value):
+    # Columns hold naive UTC timestamps
+    if value is not None and value.tzinfo is not None:
+        value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _utcnow():
+    return _naive_utc(datetime.datetime.now(datetime.timezone.utc))
+
+
+def _utc_isoformat(value) -> str:
+    # Naive column values are UTC; the offset keeps clients from reading them as local time
+    return _naive_utc(value).replace(tzinfo=datetime.timezone.utc).isoformat()
+
+
+def parse_application_filters(args):
+    """
+    Reads the list filters and sort key from the request args.
+
+    Returns:
+        tuple: (filters dict with sorted value tuples and datetimes, sort key)
+
+    Raises:
+        ValueError: If a date or the sort key is invalid.
+    """
+    filters = {}
+    for name in LIST_FILTERS:
+        values = set()
+        for raw in args.getlist(name):
+            parts = raw.split(",") if name in COMMA_SEPARATED_FILTERS else [raw]
+            values.update(part.strip() for part in parts if part.strip())
+        if values:
+            filters[name] = tuple(sorted(values))
+
+    for name in RANGE_FILTERS:
+        value = parse_iso_datetime(args.get(name), name)
+        if value is not None:
+            filters[name] = value
+
+    sort = args.get("sort") or DEFAULT_SORT
+    if sort.lstrip("-") not in SORT_COLUMNS:
+        raise ValueError(f"sort must be one of: {', '.join(SORT_COLUMNS)} (prefix - for descending)")
+    return filters, sort
+
+
+def _filter_key(filters: dict) -> tuple:
+    return tuple(
+        (name, value.isoformat() if isinstance(value, datetime.datetime) else value)
+        for name, value in sorted(filters.items())
+    )
+
+
+def _apply_filters(query, filters: dict):
+    for name, column in LIST_FILTERS.items():
+        if name in filters:
+            query = query.filter(column.in_(filters[name]))
+    for name, column in RANGE_FILTERS.items():
+        if name in filters:
+            bound = filters[name]
+            query = query.filter(column >= bound if name.endswith("_after") else column < bound)
+    return query
+
+
+def _apply_sort(query, sort: str):
+    column = SORT_COLUMNS[sort.lstrip("-")]
+    order = column.desc() if sort.startswith("-") else column.asc()
+    if column is Application.id:
+        return query.order_by(order)
+    # id breaks ties so offset pages are stable
+    return query.order_by(order.nulls_last(), Application.id.desc())
+
+
 # -----------------------------
 # GET ALL (FOR USER)
 # -----------------------------
-def get_applications_by_user(user_id: int):
+@reads_from_replica
+def get_applications_by_user(user_id: int, limit: int = None, after: int = None, summary: bool = False,
+                             filters: dict = None, sort: str = DEFAULT_SORT):
+    """
+    Lists the user's applications with their job, filtered and sorted in SQL.
+
+    `after` is an id for the default sort (keyset) and an offset for the others.
+    """
+    filters = filters or {}
     try:
-        apps = (
-            Application.query
-            .options(joinedload(Application.job))  # load job relationship
-            .filter_by(user_id=user_id)
-            .order_by(Application.id.desc())
+        return cached_list(
+            APPLICATIONS, user_id, (limit, after, summary, sort, _filter_key(filters)),
+            lambda: _load_applications(user_id, limit, after, summary, filters, sort)
+        )
+    except Exception as e:
+        logger.exception("Error fetching applications: %s", e)
+        return {"items": [], "next_cursor": None} if limit is not None else []
+
+
+def _load_applications(user_id: int, limit: int, after: int, summary: bool, filters: dict, sort: str):
+    # Explicit inner join (job_id is NOT NULL) so job columns can be filtered and
+    # sorted on, loaded from the same row
+    job_loader = contains_eager(Application.job)
+    if summary:
+        job_loader = job_loader.load_only(*JOB_SUMMARY_COLUMNS)
+
+    query = (
+        Application.query
+        .join(Application.job)
+        .options(job_loader)
+        .filter(Application.user_id == user_id)
+    )
+    query = _apply_filters(query, filters)
+
+    if limit is not None:
+        if sort == DEFAULT_SORT:
+            apps, next_cursor = paginate_by_id(query, Application.id, limit, after)
+        else:
+            apps, next_cursor = paginate_by_offset(_apply_sort(query, sort), limit, after or 0)
+        return {
+            "items": [serialize_application(a, summary) for a in apps],
+            "next_cursor": next_cursor
+        }
+
+    apps = _apply_sort(query, sort).all()
+    return [serialize_application(a, summary) for a in apps]
+
+# -----------------------------
+# DASHBOARD STATS (AGGREGATED IN SQL)
+# -----------------------------
+@reads_from_replica
+def get_application_stats(user_id: int, upcoming: int = 4):
+    try:
+        by_status = (
+            db.session.query(Application.status, func.count(Application.id))
+            .filter(Application.user_id == user_id)
+            .group_by(Application.status)
+            .all()
+        )
+        by_company = (
+            db.session.query(Job.company, func.count(Application.id))
+            .join(Job, Application.job_id == Job.id)
+            .filter(Application.user_id == user_id)
+            .group_by(Job.company)
+            .order_by(func.count(Application.id).desc(), Job.company)
+            .all()
+        )
+        deadlines = (
+            db.session.query(Application.id, Application.title, Application.job_id, Job.company, Job.deadline)
+            .join(Job, Application.job_id == Job.id)
+            .filter(
+                Application.user_id == user_id,
+                Job.deadline >= _utcnow()
+            )
+            .order_by(Job.deadline.asc())
+            .limit(upcoming)
             .all()
         )
-        return [serialize_application(a) for a in apps]
+
+        return {
+            "total": sum(count for _, count in by_status),
+            "by_status": {status: count for status, count in by_status},
+            "by_company": [{"company": company, "count": count} for company, count in by_company],
+            "upcoming_deadlines": [
+                {
+                    "id": app_id,
+                    "title": title,
+                    "job_id": job_id,
+                    "company": company,
+                    "deadline": _utc_isoformat(deadline)
+                }
+                for app_id, title, job_id, company, deadline in deadlines
+            ]
+        }, 200
     except Exception as e:
-        print("Error fetching applications:", e)
-        return []
+        logger.exception("Error computing application stats: %s", e)
+        return {"error": "Internal server error"}, 500
 
 # -----------------------------
 # GET ONE APPLICATION
 # -----------------------------
+@reads_from_replica
 def get_application_by_id(user_id: int, app_id: int):
     try:
         app = (
@@ -87,7 +309,7 @@ def get_application_by_id(user_id: int, app_id: int):
             return None
         return serialize_application(app)
     except Exception as e:
-        print("Error fetching application:", e)
+        logger.exception("Error fetching application: %s", e)
         return None
 
 
@@ -104,12 +326,13 @@ def update_application(user_id: int, app_id: int, updates: dict):
             if hasattr(app, key):
                 setattr(app, key, value)
 
+        bump_collection_versions(user_id, APPLICATIONS)
         db.session.commit()
         return serialize_application(app)
 
     except Exception as e:
         db.session.rollback()
-        print("Error updating application:", e)
+        logger.exception("Error updating application: %s", e)
         return None
 
 
@@ -123,10 +346,170 @@ def delete_application(user_id: int, app_id: int):
             return False
 
         db.session.delete(app)
+        bump_collection_versions(user_id, APPLICATIONS, COVER_LETTERS)
         db.session.commit()
         return True
 
     except Exception as e:
         db.session.rollback()
-        print("Error deleting application:", e)
+        logger.exception("Error deleting application: %s", e)
         return False
+
+
+# -----------------------------
+# BULK HELPERS
+# -----------------------------
+def _is_id(value) -> bool:
+    # JSON true/false are ints in Python, and lists or objects cannot be looked up in a set
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _owned_ids(model, user_id: int, ids) -> set:
+    """Returns the subset of ids that belong to the user, in one query."""
+    ids = {i for i in ids if _is_id(i)}
+    if not ids:
+        return set()
+    return set(db.session.execute(
+        select(model.id).where(model.user_id == user_id, model.id.in_(ids))
+    ).scalars())
+
+
+def _check_string(value, field: str):
+    if not isinstance(value, str):
+        raise ValueError(f"{field} must be a string")
+    length = Application.__table__.c[field].type.length
+    if len(value) > length:
+        raise ValueError(f"{field} exceeds {length} characters")
+
+
+# -----------------------------
+# BULK CREATE
+# -----------------------------
+def bulk_create_applications(user_id: int, items: list):
+    results = [None] * len(items)
+
+    # Ownership of every referenced job and resume, checked in two queries
+    owned_jobs = _owned_ids(Job, user_id, (i.get("job_id") for i in items if isinstance(i, dict)))
+    owned_resumes = _owned_ids(Resume, user_id, (i.get("resume_id") for i in items if isinstance(i, dict)))
+
+    rows, indexes = [], []
+    now = _utcnow()
+    for index, item in enumerate(items):
+        try:
+            if not isinstance(item, dict):
+                raise ValueError("Application must be an object")
+            if not item.get("title"):
+                raise ValueError("Application title is required")
+            if not item.get("job_id"):
+                raise ValueError("job_id is required")
+            _check_string(item["title"], "title")
+            status = item.get("status") or "Pending"
+            _check_string(status, "status")
+            if not _is_id(item["job_id"]) or item["job_id"] not in owned_jobs:
+                raise ValueError("Invalid job_id")
+            resume_id = item.get("resume_id")
+            if resume_id is not None and (not _is_id(resume_id) or resume_id not in owned_resumes):
+                raise ValueError("Invalid resume_id")
+        except ValueError as e:
+            results[index] = {"index": index, "status": "error", "error": str(e)}
+            continue
+
+        rows.append({
+            "title": item["title"],
+            "status": status,
+            "submitted_at": now,
+            "user_id": user_id,
+            "job_id": item["job_id"],
+            "resume_id": resume_id
+        })
+        indexes.append(index)
+
+    if rows:
+        try:
+            ids = insert_returning_ids(db.session, Application, rows)
+            bump_collection_versions(user_id, APPLICATIONS)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.exception("Error bulk creating applications: %s", e)
+            return {"error": "Internal server error"}, 500
+        for index, app_id in zip(indexes, ids):
+            results[index] = {"index": index, "status": "created", "id": app_id}
+
+    return {"results": results, "succeeded": len(rows), "failed": len(items) - len(rows)}, 200
+
+
+# -----------------------------
+# BULK UPDATE (E.G. STATUS CHANGES)
+# -----------------------------
+def bulk_update_applications(user_id: int, ids: list, changes: dict):
+    if not isinstance(changes, dict):
+        return {"error": "changes must be an object"}, 400
+
+    values = {}
+    try:
+        for field in ("title", "status"):
+            if field in changes:
+                if not changes[field]:
+                    raise ValueError(f"{field} cannot be empty")
+                _check_string(changes[field], field)
+                values[field] = changes[field]
+        if "resume_id" in changes:
+            resume_id = changes["resume_id"]
+            if resume_id is not None and not (_is_id(resume_id) and _owned_ids(Resume, user_id, [resume_id])):
+                raise ValueError("Invalid resume_id")
+            values["resume_id"] = resume_id
+    except ValueError as e:
+        return {"error": str(e)}, 400
+    if not values:
+        return {"error": "No updatable fields in changes"}, 400
+
+    try:
+        stmt = (
+            update(Application)
+            .where(Application.user_id == user_id, Application.id.in_(ids))
+            .values(**values)
+            .returning(Application.id)
+            .execution_options(synchronize_session=False)
+        )
+        updated = set(db.session.execute(stmt).scalars())
+        if updated:
+            bump_collection_versions(user_id, APPLICATIONS)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logger.exception("Error bulk updating applications: %s", e)
+        return {"error": "Internal server error"}, 500
+
+    results = [{"id": app_id, "status": "updated" if app_id in updated else "not_found"} for app_id in ids]
+    return {"results": results, "succeeded": len(updated), "failed": len(ids) - len(updated)}, 200
+
+
+# -----------------------------
+# BULK DELETE
+# -----------------------------
+def bulk_delete_applications(user_id: int, ids: list):
+    owned = select(Application.id).where(Application.user_id == user_id, Application.id.in_(ids))
+    try:
+        # Cover letters first, so nothing depends on the database enforcing ON DELETE CASCADE
+        db.session.execute(
+            delete(CoverLetter)
+            .where(CoverLetter.application_id.in_(owned))
+            .execution_options(synchronize_session=False)
+        )
+        deleted = set(db.session.execute(
+            delete(Application)
+            .where(Application.user_id == user_id, Application.id.in_(ids))
+            .returning(Application.id)
+            .execution_options(synchronize_session=False)
+        ).scalars())
+        if deleted:
+            bump_collection_versions(user_id, APPLICATIONS, COVER_LETTERS)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logger.exception("Error bulk deleting applications: %s", e)
+        return {"error": "Internal server error"}, 500
+
+    results = [{"id": app_id, "status": "deleted" if app_id in deleted else "not_found"} for app_id in ids]
+    return {"results": results, "succeeded": len(deleted), "failed": len(ids) - len(deleted)}, 200
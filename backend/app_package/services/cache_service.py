@@ -0,0 +1,290 @@
+from .. import db
+from ..models import ResponseCache
+from collections import OrderedDict
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+import hashlib
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# -----------------------------
+# KEYS
+# -----------------------------
+def hash_key(*parts) -> str:
+    """
+    Builds a content-addressed cache key from the given parts.
+
+    Each part is length-prefixed before hashing so ("ab", "c") and ("a", "bc")
+    never collide.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        encoded = str(part).encode("utf-8")
+        digest.update(str(len(encoded)).encode() + b":" + encoded)
+    return digest.hexdigest()
+
+
+# -----------------------------
+# IN-MEMORY LRU WITH TTL
+# -----------------------------
+class MemoryCache:
+    """Thread-safe LRU cache with a per-entry time to live."""
+
+    def __init__(self, max_entries: int = 1024, ttl: float = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl: float = None):
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.time() + ttl if ttl else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+# -----------------------------
+# PERSISTENT (SQLITE/POSTGRES) CACHE
+# -----------------------------
+class DatabaseCache:
+    """
+    Cache stored in the response_cache table so entries survive restarts and
+    are shared by every worker using the same database.
+
+    Reads and writes run on their own engine connection, never on the request's
+    db.session, so a lookup cannot commit or roll back the caller's pending work.
+    At most every `purge_interval` seconds a write deletes expired rows and, past
+    `max_rows`, the rows closest to expiring; permanent ones go last.
+
+    Cache failures are logged and treated as misses; they never fail the caller.
+    """
+
+    def __init__(self, ttl: float = None, max_rows: int = 10000, purge_interval: float = 300):
+        self.ttl = ttl
+        self.max_rows = max_rows
+        self.purge_interval = purge_interval
+        self._table = ResponseCache.__table__
+        self._next_purge = 0.0
+        self._purge_lock = threading.Lock()
+
+    def get(self, key):
+        table = self._table
+        try:
+            with db.engine.begin() as conn:
+                row = conn.execute(
+                    select(table.c.value, table.c.expires_at).where(table.c.key == key)
+                ).first()
+                if row is None:
+                    return None
+                if row.expires_at is not None and row.expires_at <= time.time():
+                    conn.execute(delete(table).where(table.c.key == key))
+                    return None
+                return row.value
+        except Exception as e:
+            logger.warning("Cache read failed for key %s: %s", key, e)
+            return None
+
+    def set(self, key, value, ttl: float = None):
+        ttl = self.ttl if ttl is None else ttl
+        values = {"key": key, "value": value, "expires_at": time.time() + ttl if ttl else None}
+        try:
+            with db.engine.begin() as conn:
+                dialect = conn.dialect.name
+                if dialect in ("postgresql", "sqlite"):
+                    insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+                    stmt = insert(self._table).values(**values)
+                    conn.execute(stmt.on_conflict_do_update(
+                        index_elements=[self._table.c.key],
+                        set_={"value": stmt.excluded.value, "expires_at": stmt.excluded.expires_at}
+                    ))
+                else:
+                    conn.execute(delete(self._table).where(self._table.c.key == key))
+                    conn.execute(self._table.insert().values(**values))
+        except Exception as e:
+            logger.warning("Cache write failed for key %s: %s", key, e)
+            return
+        self._purge_if_due()
+
+    def delete(self, key):
+        try:
+            with db.engine.begin() as conn:
+                conn.execute(delete(self._table).where(self._table.c.key == key))
+        except Exception as e:
+            logger.warning("Cache delete failed for key %s: %s", key, e)
+
+    def clear(self):
+        try:
+            with db.engine.begin() as conn:
+                conn.execute(delete(self._table))
+        except Exception as e:
+            logger.warning("Cache clear failed: %s", e)
+
+    def _purge_if_due(self):
+        now = time.time()
+        # One purge per process and interval, run by whichever write gets the lock
+        if now < self._next_purge or not self._purge_lock.acquire(blocking=False):
+            return
+        try:
+            self._next_purge = now + self.purge_interval
+            self.purge()
+        finally:
+            self._purge_lock.release()
+
+    def purge(self):
+        """Deletes expired rows, then the rows closest to expiring beyond max_rows, permanent ones last."""
+        table = self._table
+        try:
+            with db.engine.begin() as conn:
+                conn.execute(delete(table).where(table.c.expires_at <= time.time()))
+                excess = conn.execute(select(func.count()).select_from(table)).scalar() - self.max_rows
+                if excess > 0:
+                    oldest = (
+                        select(table.c.key)
+                        .order_by(table.c.expires_at.asc().nulls_last())
+                        .limit(excess)
+                        .scalar_subquery()
+                    )
+                    conn.execute(delete(table).where(table.c.key.in_(oldest)))
+        except Exception as e:
+            logger.warning("Cache purge failed: %s", e)
+
+
+# -----------------------------
+# TIERED CACHE
+# -----------------------------
+class TieredCache:
+    """Checks a fast local cache before falling back to a shared one."""
+
+    def __init__(self, front, back):
+        self.front = front
+        self.back = back
+
+    def get(self, key):
+        value = self.front.get(key)
+        if value is not None:
+            return value
+        value = self.back.get(key)
+        if value is not None:
+            self.front.set(key, value)
+        return value
+
+    def set(self, key, value, ttl: float = None):
+        self.front.set(key, value, ttl)
+        self.back.set(key, value, ttl)
+
+    def delete(self, key):
+        self.front.delete(key)
+        self.back.delete(key)
+
+    def clear(self):
+        self.front.clear()
+        self.back.clear()
+
+
+# -----------------------------
+# SHARED (REDIS) CACHE
+# -----------------------------
+class RedisCache:
+    """
+    Cache stored in Redis or any server speaking its protocol (Valkey,
+    KeyDB, ...), shared by every worker and host. Values are strings.
+
+    Cache failures are logged and treated as misses; they never fail the caller.
+    """
+
+    def __init__(self, url: str = None, ttl: float = None, prefix: str = "career-engine:", client=None):
+        if client is None:
+            try:
+                import redis
+            except ImportError:
+                raise RuntimeError("The redis package is required for the redis cache backend")
+            client = redis.Redis.from_url(url)
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def get(self, key):
+        try:
+            value = self.client.get(self.prefix + key)
+        except Exception as e:
+            logger.warning("Cache read failed for key %s: %s", key, e)
+            return None
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+    def set(self, key, value, ttl: float = None):
+        ttl = self.ttl if ttl is None else ttl
+        try:
+            self.client.set(self.prefix + key, value, ex=int(ttl) if ttl else None)
+        except Exception as e:
+            logger.warning("Cache write failed for key %s: %s", key, e)
+
+    def delete(self, key):
+        try:
+            self.client.delete(self.prefix + key)
+        except Exception as e:
+            logger.warning("Cache delete failed for key %s: %s", key, e)
+
+    def clear(self):
+        try:
+            keys = list(self.client.scan_iter(match=self.prefix + "*"))
+            if keys:
+                self.client.delete(*keys)
+        except Exception as e:
+            logger.warning("Cache clear failed: %s", e)
+
+
+# -----------------------------
+# FACTORY
+# -----------------------------
+def build_cache(backend: str, max_entries: int = 1024, ttl: float = None, url: str = None,
+                max_rows: int = 10000, purge_interval: float = 300):
+    """
+    Creates a cache for the given backend name.
+
+    Args:
+        backend (str): "memory", "database" (memory in front of the response_cache table),
+            "redis" or "none".
+        max_entries (int): Size bound of the in-memory LRU.
+        ttl (float, optional): Seconds before an entry expires. Never expires if None or 0.
+        url (str, optional): Server URL for the redis backend, e.g. redis://localhost:6379/0.
+        max_rows (int): Size bound of the response_cache table (database backend).
+        purge_interval (float): Seconds between evictions of the database backend.
+
+    Returns:
+        The cache, or None when caching is disabled.
+    """
+    if backend == "none":
+        return None
+    if backend == "memory":
+        return MemoryCache(max_entries, ttl)
+    if backend == "database":
+        return TieredCache(MemoryCache(max_entries, ttl), DatabaseCache(ttl, max_rows, purge_interval))
+    if backend == "redis":
+        return RedisCache(url, ttl)
+    raise ValueError(f"Unknown cache backend: {backend}")
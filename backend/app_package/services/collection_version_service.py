@@ -0,0 +1,76 @@
+from .. import db
+from ..database import mark_write, replica_reads_active
+from ..models import CollectionVersion
+from flask import g, has_app_context
+from sqlalchemy.dialects import postgresql, sqlite
+
+# Collection names
+JOBS = "jobs"
+APPLICATIONS = "applications"
+RESUMES = "resumes"
+COVER_LETTERS = "cover_letters"
+
+
+# -----------------------------
+# READ
+# -----------------------------
+def _request_versions():
+    # Versions read during this request; None outside one
+    if not has_app_context():
+        return None
+    return g.setdefault("collection_versions", {})
+
+
+def get_collection_version(user_id: int, collection: str) -> int:
+    """
+    Returns the current version of a user's collection, 0 if it was never written.
+
+    Reads are remembered for the rest of the request, separately for the
+    primary and the replica, so the ETag of conditional_get and the list cache
+    key cost a single lookup and a payload loaded from the replica is keyed on
+    the replica's version.
+    """
+    versions = _request_versions()
+    key = (user_id, collection, replica_reads_active())
+    if versions is not None and key in versions:
+        return versions[key]
+
+    version = (
+        db.session.query(CollectionVersion.version)
+        .filter_by(user_id=user_id, collection=collection)
+        .scalar()
+    ) or 0
+    if versions is not None:
+        versions[key] = version
+    return version
+
+
+# -----------------------------
+# BUMP
+# -----------------------------
+def bump_collection_versions(user_id: int, *collections: str):
+    """
+    Increments the version of each collection in the current transaction, so
+    the bump commits (or rolls back) together with the write that caused it.
+    Cached lists are keyed on the version, so every worker stops serving them
+    once the transaction commits, and the user's reads stay on the primary
+    while a replica may lag behind. Call it before the service's db.session.commit().
+    """
+    dialect = db.session.get_bind().dialect.name
+    insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+
+    for collection in collections:
+        # Upsert so concurrent first writes never collide on the primary key
+        stmt = insert(CollectionVersion).values(user_id=user_id, collection=collection, version=1)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CollectionVersion.user_id, CollectionVersion.collection],
+            set_={"version": CollectionVersion.version + 1}
+        )
+        db.session.execute(stmt)
+
+    versions = _request_versions()
+    if versions is not None:
+        for collection in collections:
+            for replica in (False, True):
+                versions.pop((user_id, collection, replica), None)
+    mark_write(db.session, user_id)
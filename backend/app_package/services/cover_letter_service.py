@@ -1,12 +1,33 @@
+from ..database import reads_from_replica
 from .. import db
 from ..models import CoverLetter, Application
+from .collection_version_service import bump_collection_versions, COVER_LETTERS
+from .list_cache_service import cached_list
+from ..utils import paginate_by_id
+from sqlalchemy.orm import load_only
 
 MAX_CONTENT_LENGTH = 8000
 
+# Columns needed by the summary projection (no content)
+SUMMARY_COLUMNS = (
+    CoverLetter.id, CoverLetter.title, CoverLetter.language,
+    CoverLetter.status, CoverLetter.created_at, CoverLetter.application_id
+)
+
 # -----------------------------
 # Serializer
 # -----------------------------
-def serialize_cover_letter(cl: CoverLetter):
+def serialize_cover_letter(cl: CoverLetter, summary: bool = False):
+    if summary:
+        return {
+            "id": cl.id,
+            "title": cl.title,
+            "language": cl.language,
+            "status": cl.status,
+            "created_at": cl.created_at.isoformat(),
+            "application_id": cl.application_id,
+        }
+
     return {
         "id": cl.id,
         "title": cl.title,
@@ -54,6 +75,7 @@ def create_cover_letter(user_id, data):
     )
 
     db.session.add(new_cl)
+    bump_collection_versions(user_id, COVER_LETTERS)
     db.session.commit()
 
     return serialize_cover_letter(new_cl), 201
@@ -62,19 +84,37 @@ def create_cover_letter(user_id, data):
 # -----------------------------
 # Get all for user
 # -----------------------------
-def get_cover_letters_by_user(user_id):
-    cover_letters = (
+@reads_from_replica
+def get_cover_letters_by_user(user_id, limit=None, after=None, summary=False):
+    return cached_list(
+        COVER_LETTERS, user_id, (limit, after, summary),
+        lambda: _load_cover_letters(user_id, limit, after, summary)
+    )
+
+
+def _load_cover_letters(user_id, limit, after, summary):
+    query = (
         CoverLetter.query
         .join(Application)
         .filter(Application.user_id == user_id)
-        .all()
     )
-    return [serialize_cover_letter(cl) for cl in cover_letters]
+    if summary:
+        query = query.options(load_only(*SUMMARY_COLUMNS))
+    if limit is not None:
+        cover_letters, next_cursor = paginate_by_id(query, CoverLetter.id, limit, after)
+        return {
+            "items": [serialize_cover_letter(cl, summary) for cl in cover_letters],
+            "next_cursor": next_cursor
+        }
+
+    cover_letters = query.all()
+    return [serialize_cover_letter(cl, summary) for cl in cover_letters]
 
 
 # -----------------------------
 # Get by id (ownership enforced)
 # -----------------------------
+@reads_from_replica
 def get_cover_letter_by_id(user_id, cl_id):
     cl = (
         CoverLetter.query
@@ -122,6 +162,7 @@ def update_cover_letter(user_id, cl_id, updates):
         if key in allowed_fields and value is not None:
             setattr(cl, key, value)
 
+    bump_collection_versions(user_id, COVER_LETTERS)
     db.session.commit()
     return serialize_cover_letter(cl), 200
 
@@ -144,6 +185,7 @@ def delete_cover_letter(user_id, cl_id):
         return {"error": "Not found"}, 404
 
     db.session.delete(cl)
+    bump_collection_versions(user_id, COVER_LETTERS)
     db.session.commit()
 
     return {"message": "Cover letter deleted"}, 200
@@ -0,0 +1,132 @@
+from ..models import Application, CoverLetter, Job
+from .application_service import serialize_application
+from .cover_letter_service import serialize_cover_letter
+from .job_service import serialize_job
+from flask import Response, current_app, stream_with_context
+from sqlalchemy.orm import joinedload
+from datetime import date, datetime
+import csv
+import io
+
+EXPORT_MIMETYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+# Rows fetched per round trip; on Postgres yield_per also uses a server-side cursor
+EXPORT_BATCH_SIZE = 500
+
+JOB_COLUMNS = (
+    "id", "title", "company", "location", "job_url", "description",
+    "date_posted", "deadline", "employment_type"
+)
+APPLICATION_COLUMNS = (
+    "id", "title", "status", "submitted_at", "job_id", "resume_id",
+    "job_title", "job_company", "job_location", "job_deadline"
+)
+COVER_LETTER_COLUMNS = ("id", "title", "language", "status", "created_at", "application_id", "content")
+
+
+# -----------------------------
+# ENCODERS
+# -----------------------------
+def _csv_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return "" if value is None else value
+
+
+def _ndjson_lines(rows, serialize):
+    for row in rows:
+        yield current_app.json.dumps(serialize(row)) + "\n"
+
+
+def _csv_lines(rows, serialize, columns):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush():
+        line = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return line
+
+    # The header goes out before the first query runs
+    writer.writerow(columns)
+    yield flush()
+    for row in rows:
+        record = serialize(row)
+        writer.writerow([_csv_value(record.get(column)) for column in columns])
+        yield flush()
+
+
+def _rows(build_query):
+    # The query is built on first iteration, inside the streamed context: a Query
+    # made in the view would keep the view's session, which is torn down before
+    # streaming starts, and its connection would only go back to the pool on GC
+    yield from build_query().yield_per(EXPORT_BATCH_SIZE)
+
+
+def _export(build_query, fmt: str, serialize, csv_serialize, columns):
+    """Returns a lazy generator of text chunks; nothing is queried until it is iterated."""
+    rows = _rows(build_query)
+    if fmt == "csv":
+        return _csv_lines(rows, csv_serialize, columns)
+    return _ndjson_lines(rows, serialize)
+
+
+def export_response(chunks, fmt: str, name: str) -> Response:
+    """Wraps an export generator in a streamed attachment response."""
+    return Response(
+        stream_with_context(chunks),
+        mimetype=EXPORT_MIMETYPES[fmt],
+        headers={
+            "Content-Disposition": f'attachment; filename="{name}.{fmt}"',
+            "Cache-Control": "no-store",
+            # Tell nginx-style proxies to pass rows on as they are produced
+            "X-Accel-Buffering": "no"
+        }
+    )
+
+
+# -----------------------------
+# JOBS
+# -----------------------------
+def export_jobs(user_id: int, fmt: str):
+    def query():
+        return Job.query.filter_by(user_id=user_id).order_by(Job.id)
+    return _export(query, fmt, serialize_job, serialize_job, JOB_COLUMNS)
+
+
+# -----------------------------
+# APPLICATIONS (WITH JOB)
+# -----------------------------
+def _flat_application(app: Application) -> dict:
+    record = serialize_application(app, summary=True)
+    job = record.pop("job") or {}
+    for key in ("title", "company", "location", "deadline"):
+        record[f"job_{key}"] = job.get(key)
+    return record
+
+
+def export_applications(user_id: int, fmt: str):
+    def query():
+        # Many-to-one joinedload adds columns to each row, so it streams with yield_per
+        return (
+            Application.query
+            .options(joinedload(Application.job))
+            .filter_by(user_id=user_id)
+            .order_by(Application.id)
+        )
+    return _export(query, fmt, serialize_application, _flat_application, APPLICATION_COLUMNS)
+
+
+# -----------------------------
+# COVER LETTERS
+# -----------------------------
+def export_cover_letters(user_id: int, fmt: str):
+    def query():
+        return (
+            CoverLetter.query
+            .join(Application)
+            .filter(Application.user_id == user_id)
+            .order_by(CoverLetter.id)
+        )
+    return _export(query, fmt, serialize_cover_letter, serialize_cover_letter, COVER_LETTER_COLUMNS)
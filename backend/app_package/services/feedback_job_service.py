@@ -0,0 +1,232 @@
+from .. import db
+from ..models import FeedbackJob
+from . import ai_service
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from flask import current_app
+import logging
+import threading
+import uuid
+
+logger = logging.getLogger(__name__)
+
+# -----------------------------
+# SERIALIZER
+# -----------------------------
+def serialize_feedback_job(job: FeedbackJob):
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "feedback": job.result if job.status == "done" else None,
+        "error": job.error,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "updated_at": job.updated_at.isoformat() if job.updated_at else None,
+    }
+
+
+# -----------------------------
+# WORKER POOL
+# -----------------------------
+class FeedbackWorkerPool:
+    """
+    Bounded pool of threads running OpenAI calls outside the request thread.
+
+    At most `workers` calls run at once and at most `max_pending` jobs wait;
+    anything beyond that is rejected so the caller can answer 503.
+
+    Once started, a monitor thread touches updated_at of the jobs this process
+    is running every `heartbeat` seconds and re-submits jobs whose process
+    died (see recover_feedback_jobs). Nothing runs until start(), so a pool
+    created in a pre-fork master never owns a thread.
+    """
+
+    def __init__(self, app, workers: int, max_pending: int, heartbeat: float = 15, timeout: float = 60):
+        self.app = app
+        self.heartbeat = heartbeat
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="feedback")
+        self._slots = threading.BoundedSemaphore(workers + max_pending)
+        self._jobs = set()  # ids submitted here and not finished
+        self._jobs_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._monitor = None
+
+    def submit(self, job_id: str) -> bool:
+        with self._jobs_lock:
+            if job_id in self._jobs:
+                return True
+            if not self._slots.acquire(blocking=False):
+                return False
+            self._jobs.add(job_id)
+        try:
+            self._executor.submit(self._run, job_id)
+        except Exception:
+            self._finish(job_id)
+            raise
+        return True
+
+    def active_jobs(self) -> set:
+        with self._jobs_lock:
+            return set(self._jobs)
+
+    def _run(self, job_id: str):
+        try:
+            with self.app.app_context():
+                run_feedback_job(job_id)
+        except Exception as e:
+            logger.error("Feedback job %s crashed: %s", job_id, e)
+        finally:
+            self._finish(job_id)
+
+    def _finish(self, job_id: str):
+        with self._jobs_lock:
+            self._jobs.discard(job_id)
+        self._slots.release()
+
+    def start(self):
+        """Starts the heartbeat and recovery monitor; call it in the serving process."""
+        if self._monitor is not None:
+            return
+        self._monitor = threading.Thread(target=self._watch, name="feedback-monitor", daemon=True)
+        self._monitor.start()
+
+    def _watch(self):
+        # Recover right away, then heartbeat and sweep on every tick
+        while True:
+            with self.app.app_context():
+                try:
+                    touch_running_jobs(self.active_jobs())
+                    recover_feedback_jobs(self, self.timeout)
+                except Exception as e:
+                    db.session.rollback()
+                    logger.warning("Feedback job monitor skipped a tick: %s", e)
+            if self._stop.wait(self.heartbeat):
+                return
+
+    def shutdown(self):
+        self._stop.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def init_app(app, start: bool = False):
+    """
+    Creates the worker pool and, with `start`, its monitor, which re-queues
+    jobs left over by a dead process. Otherwise the serving process calls
+    start() (see start_background_workers).
+    """
+    pool = FeedbackWorkerPool(
+        app,
+        workers=app.config["AI_FEEDBACK_WORKERS"],
+        max_pending=app.config["AI_FEEDBACK_MAX_PENDING"],
+        heartbeat=app.config["AI_FEEDBACK_HEARTBEAT_SECONDS"],
+        timeout=app.config["AI_FEEDBACK_JOB_TIMEOUT"]
+    )
+    app.extensions["feedback_workers"] = pool
+    if start:
+        pool.start()
+
+
+def touch_running_jobs(job_ids):
+    """Heartbeat: marks the given running jobs as alive."""
+    if not job_ids:
+        return
+    (
+        FeedbackJob.query
+        .filter(FeedbackJob.id.in_(job_ids), FeedbackJob.status == "running")
+        .update({"updated_at": datetime.now(timezone.utc)}, synchronize_session=False)
+    )
+    db.session.commit()
+
+
+def recover_feedback_jobs(pool: FeedbackWorkerPool, timeout: int):
+    """
+    Re-submits jobs whose process died: running jobs without a heartbeat for
+    `timeout` seconds, and jobs queued that long that no pool here holds.
+    A job queued in a live process may be submitted twice; the claim in
+    run_feedback_job lets only one of them run it.
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=timeout)
+    stale = FeedbackJob.query.filter(
+        FeedbackJob.status == "running",
+        FeedbackJob.updated_at < cutoff
+    ).all()
+    for job in stale:
+        job.status = "queued"
+    db.session.commit()
+
+    orphaned = (
+        FeedbackJob.query
+        .filter(FeedbackJob.status == "queued", FeedbackJob.updated_at < cutoff)
+        .order_by(FeedbackJob.created_at)
+        .all()
+    )
+    active = pool.active_jobs()
+    for job in orphaned:
+        if job.id in active:
+            continue
+        if not pool.submit(job.id):
+            break  # the rest is picked up by a later sweep
+
+
+# -----------------------------
+# ENQUEUE
+# -----------------------------
+def enqueue_feedback_job(user_id: int, prompt: str):
+    pool = current_app.extensions["feedback_workers"]
+
+    try:
+        job = FeedbackJob(
+            id=str(uuid.uuid4()),
+            user_id=user_id,
+            prompt=prompt,
+            status="queued"
+        )
+        db.session.add(job)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logger.error("Error queueing feedback job: %s", e)
+        return {"error": "Internal server error"}, 500
+
+    if not pool.submit(job.id):
+        db.session.delete(job)
+        db.session.commit()
+        return {"error": "AI feedback queue is full, try again later"}, 503
+
+    return serialize_feedback_job(job), 202
+
+
+# -----------------------------
+# RUN (WORKER THREAD)
+# -----------------------------
+def run_feedback_job(job_id: str):
+    # Claim the job atomically so two processes never run it twice
+    claimed = (
+        FeedbackJob.query
+        .filter_by(id=job_id, status="queued")
+        .update({"status": "running", "updated_at": datetime.now(timezone.utc)})
+    )
+    db.session.commit()
+    if not claimed:
+        return
+
+    job = db.session.get(FeedbackJob, job_id)
+    try:
+        content, _ = ai_service.generate_feedback(job.prompt)
+        job.result = content
+        job.status = "done"
+    except Exception as e:
+        logger.error("Feedback job %s failed: %s", job_id, e)
+        job.error = "AI feedback generation failed"
+        job.status = "failed"
+
+    job.updated_at = datetime.now(timezone.utc)
+    db.session.commit()
+
+
+# -----------------------------
+# GET (OWNERSHIP ENFORCED)
+# -----------------------------
+def get_feedback_job(user_id: int, job_id: str):
+    job = FeedbackJob.query.filter_by(id=job_id, user_id=user_id).first()
+    return serialize_feedback_job(job) if job else None
@@ -1,11 +1,55 @@
+from ..database import reads_from_replica
 from .. import db
-from ..models import Job
+from ..models import Job, Application, CoverLetter
+from .collection_version_service import bump_collection_versions, JOBS, APPLICATIONS, COVER_LETTERS
+from .list_cache_service import cached_list
+from ..term_vectors import index_job, job_text, term_vector
+from ..utils import insert_returning_ids, paginate_by_id, parse_iso_datetime
+from flask import current_app
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import load_only
 from datetime import datetime, timezone
+import csv
+import io
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Columns needed by the summary projection (no description)
+SUMMARY_COLUMNS = (
+    Job.id, Job.title, Job.company, Job.location, Job.job_url,
+    Job.date_posted, Job.deadline, Job.employment_type, Job.user_id
+)
+
+# Fields a client may set on a job
+JOB_FIELDS = (
+    "title", "company", "location", "job_url", "description",
+    "date_posted", "deadline", "employment_type"
+)
+DATE_FIELDS = ("date_posted", "deadline")
+
+IMPORT_FORMATS = ("csv", "jsonl")
+# Only the first errors are returned so the report stays small for any file size
+MAX_IMPORT_ERRORS = 100
 
 # -----------------------------
 # SERIALIZER
 # -----------------------------
-def serialize_job(job: Job):
+def serialize_job(job: Job, summary: bool = False):
+    if summary:
+        return {
+            "id": job.id,
+            "title": job.title,
+            "company": job.company,
+            "location": job.location,
+            "job_url": job.job_url,
+            "date_posted": job.date_posted.isoformat() if job.date_posted else None,
+            "deadline": job.deadline.isoformat() if job.deadline else None,
+            "employment_type": job.employment_type,
+            "user_id": job.user_id
+        }
+
     return {
         "id": job.id,
         "title": job.title,
@@ -19,17 +63,39 @@ def serialize_job(job: Job):
         "user_id": job.user_id
     }
 
+# -----------------------------
+# DATES
+# -----------------------------
+def parse_job_dates(data: dict) -> dict:
+    """
+    Returns a copy of `data` with the DATE_FIELDS it contains parsed, the way
+    bulk create and import parse them.
+
+    Raises:
+        ValueError: Naming the first field that is not an ISO 8601 date.
+    """
+    return {
+        **data,
+        **{field: parse_iso_datetime(data[field], field) for field in DATE_FIELDS if field in data}
+    }
+
 # -----------------------------
 # CREATE
 # -----------------------------
 def create_job(user_id, data: dict):
-    print(f"[DEBUG] create_job called with user_id={user_id}, data={data}")
+    logger.debug("create_job called", extra={"user_id": user_id, "fields": sorted(data)})
     title = data.get("title")
     company = data.get("company")
     if not title or not company:
-        print("[WARN] Missing title or company")
+        logger.warning("create_job missing title or company", extra={"user_id": user_id})
         return {"error": "Job title and company are required"}, 400
 
+    try:
+        data = parse_job_dates(data)
+    except ValueError as e:
+        logger.warning("create_job invalid date", extra={"user_id": user_id})
+        return {"error": str(e)}, 400
+
     try:
         date_posted = data.get("date_posted") or datetime.now(timezone.utc)
         new_job = Job(
@@ -43,81 +109,337 @@ def create_job(user_id, data: dict):
             deadline=data.get("deadline"),
             employment_type=data.get("employment_type")
         )
+        index_job(new_job)
         db.session.add(new_job)
+        bump_collection_versions(user_id, JOBS)
         db.session.commit()
-        print(f"[DEBUG] Job created successfully: {serialize_job(new_job)}")
+        logger.debug("Job created", extra={"user_id": user_id, "job_id": new_job.id})
         return serialize_job(new_job), 201
     except Exception as e:
         db.session.rollback()
-        print(f"[ERROR] Error creating job: {e}")
+        logger.exception("Error creating job: %s", e)
         return {"error": "Internal server error"}, 500
 
 # -----------------------------
 # GET JOBS BY USER
 # -----------------------------
-def get_jobs_by_user(user_id):
-    print(f"[DEBUG] get_jobs_by_user called with user_id={user_id}")
+@reads_from_replica
+def get_jobs_by_user(user_id, limit=None, after=None, summary=False):
     try:
-        jobs = Job.query.filter_by(user_id=user_id).all()
-        print(f"[DEBUG] Found {len(jobs)} jobs for user_id={user_id}")
-        serialized = [serialize_job(j) for j in jobs]
-        print(f"[DEBUG] Serialized jobs: {serialized}")
-        return serialized
+        return cached_list(
+            JOBS, user_id, (limit, after, summary),
+            lambda: _load_jobs(user_id, limit, after, summary)
+        )
     except Exception as e:
-        print(f"[ERROR] Error fetching jobs by user ID: {e}")
-        return []
+        logger.exception("Error fetching jobs by user ID: %s", e)
+        return {"items": [], "next_cursor": None} if limit is not None else []
+
+
+def _load_jobs(user_id, limit, after, summary):
+    query = Job.query.filter_by(user_id=user_id)
+    if summary:
+        query = query.options(load_only(*SUMMARY_COLUMNS))
+    if limit is not None:
+        jobs, next_cursor = paginate_by_id(query, Job.id, limit, after)
+        logger.debug("Found %d jobs", len(jobs), extra={"user_id": user_id, "next_cursor": next_cursor})
+        return {"items": [serialize_job(j, summary) for j in jobs], "next_cursor": next_cursor}
+
+    jobs = query.all()
+    logger.debug("Found %d jobs", len(jobs), extra={"user_id": user_id})
+    return [serialize_job(j, summary) for j in jobs]
 
 # -----------------------------
 # GET SINGLE JOB BY ID (OWNER CHECK)
 # -----------------------------
+@reads_from_replica
 def get_job_by_id(user_id, job_id):
-    print(f"[DEBUG] get_job_by_id called with user_id={user_id}, job_id={job_id}")
     job = Job.query.get(job_id)
     if not job or job.user_id != user_id:
-        print(f"[WARN] Job not found or does not belong to user")
+        logger.warning("Job not found or does not belong to user", extra={"user_id": user_id, "job_id": job_id})
         return None
-    serialized = serialize_job(job)
-    print(f"[DEBUG] Returning job: {serialized}")
-    return serialized
+    return serialize_job(job)
 
 # -----------------------------
 # UPDATE JOB
 # -----------------------------
 def update_job(user_id, job_id, updates: dict):
-    print(f"[DEBUG] update_job called with user_id={user_id}, job_id={job_id}, updates={updates}")
+    logger.debug("update_job called", extra={"user_id": user_id, "job_id": job_id, "fields": sorted(updates)})
     job = Job.query.get(job_id)
     if not job or job.user_id != user_id:
-        print(f"[WARN] Job not found or does not belong to user")
+        logger.warning("Job not found or does not belong to user", extra={"user_id": user_id, "job_id": job_id})
         return None
     try:
         for key, value in updates.items():
             if hasattr(job, key):
                 setattr(job, key, value)
-                print(f"[DEBUG] Updated {key} -> {value}")
+        index_job(job)
+        # Applications embed job fields
+        bump_collection_versions(user_id, JOBS, APPLICATIONS)
         db.session.commit()
-        serialized = serialize_job(job)
-        print(f"[DEBUG] Job updated successfully: {serialized}")
-        return serialized
+        logger.debug("Job updated", extra={"user_id": user_id, "job_id": job_id})
+        return serialize_job(job)
     except Exception as e:
         db.session.rollback()
-        print(f"[ERROR] Error updating job: {e}")
+        logger.exception("Error updating job: %s", e)
         return None
 
 # -----------------------------
 # DELETE JOB
 # -----------------------------
 def delete_job(user_id, job_id):
-    print(f"[DEBUG] delete_job called with user_id={user_id}, job_id={job_id}")
     job = Job.query.get(job_id)
     if not job or job.user_id != user_id:
-        print(f"[WARN] Job not found or does not belong to user")
+        logger.warning("Job not found or does not belong to user", extra={"user_id": user_id, "job_id": job_id})
         return False
     try:
         db.session.delete(job)
+        # Deleting a job cascades to its applications and their cover letters
+        bump_collection_versions(user_id, JOBS, APPLICATIONS, COVER_LETTERS)
         db.session.commit()
-        print(f"[DEBUG] Job deleted successfully: id={job_id}")
+        logger.debug("Job deleted", extra={"user_id": user_id, "job_id": job_id})
         return True
     except Exception as e:
         db.session.rollback()
-        print(f"[ERROR] Error deleting job: {e}")
+        logger.exception("Error deleting job: %s", e)
         return False
+
+# -----------------------------
+# FIELD VALIDATION (BULK / IMPORT)
+# -----------------------------
+def job_values(data: dict, partial: bool = False) -> dict:
+    """
+    Validates client-supplied job fields against the Job columns.
+
+    Args:
+        data (dict): Raw fields; anything outside JOB_FIELDS is ignored.
+        partial (bool): Allow title/company to be absent (updates).
+
+    Returns:
+        dict: Column values ready for an INSERT or UPDATE.
+
+    Raises:
+        ValueError: Describing the first invalid field.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Job must be an object")
+
+    values = {}
+    for field in JOB_FIELDS:
+        if field not in data:
+            continue
+        value = data[field]
+        if field in DATE_FIELDS:
+            value = parse_iso_datetime(value, field)
+        elif value is not None:
+            if not isinstance(value, str):
+                raise ValueError(f"{field} must be a string")
+            length = Job.__table__.c[field].type.length
+            if length and len(value) > length:
+                raise ValueError(f"{field} exceeds {length} characters")
+        values[field] = value
+
+    for field in ("title", "company"):
+        if (not partial or field in values) and not values.get(field):
+            raise ValueError("Job title and company are required")
+    return values
+
+
+def _insert_row(user_id, values: dict) -> dict:
+    # Every row of a multi-row INSERT needs the same keys
+    row = {field: values.get(field) for field in JOB_FIELDS}
+    row["date_posted"] = row["date_posted"] or datetime.now(timezone.utc)
+    row["employment_type"] = row["employment_type"] or "Full-time"
+    row["term_vector"], row["term_length"] = term_vector(job_text(row["title"], row["description"]))
+    row["user_id"] = user_id
+    return row
+
+
+def _insert_jobs(rows: list) -> list:
+    """Inserts rows with multi-row INSERT statements, returning ids in row order."""
+    return insert_returning_ids(db.session, Job, rows)
+
+# -----------------------------
+# BULK CREATE
+# -----------------------------
+def bulk_create_jobs(user_id, items: list):
+    results = [None] * len(items)
+    rows, indexes = [], []
+    for index, item in enumerate(items):
+        try:
+            rows.append(_insert_row(user_id, job_values(item)))
+            indexes.append(index)
+        except ValueError as e:
+            results[index] = {"index": index, "status": "error", "error": str(e)}
+
+    if rows:
+        try:
+            ids = _insert_jobs(rows)
+            bump_collection_versions(user_id, JOBS)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.exception("Error bulk creating jobs: %s", e)
+            return {"error": "Internal server error"}, 500
+        for index, job_id in zip(indexes, ids):
+            results[index] = {"index": index, "status": "created", "id": job_id}
+
+    logger.debug("Bulk created %d jobs", len(rows), extra={"user_id": user_id, "failed": len(items) - len(rows)})
+    return {"results": results, "succeeded": len(rows), "failed": len(items) - len(rows)}, 200
+
+# -----------------------------
+# BULK UPDATE (SAME CHANGES FOR EVERY ID)
+# -----------------------------
+def bulk_update_jobs(user_id, ids: list, changes: dict):
+    try:
+        values = job_values(changes, partial=True)
+    except ValueError as e:
+        return {"error": str(e)}, 400
+    if not values:
+        return {"error": "No updatable fields in changes"}, 400
+    if "title" in values or "description" in values:
+        # Each row's text differs, so term vectors are rebuilt lazily on the next match scoring
+        values["term_vector"] = None
+        values["term_length"] = None
+
+    try:
+        stmt = (
+            update(Job)
+            .where(Job.user_id == user_id, Job.id.in_(ids))
+            .values(**values)
+            .returning(Job.id)
+            .execution_options(synchronize_session=False)
+        )
+        updated = set(db.session.execute(stmt).scalars())
+        if updated:
+            # Applications embed job fields
+            bump_collection_versions(user_id, JOBS, APPLICATIONS)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logger.exception("Error bulk updating jobs: %s", e)
+        return {"error": "Internal server error"}, 500
+
+    results = [{"id": job_id, "status": "updated" if job_id in updated else "not_found"} for job_id in ids]
+    return {"results": results, "succeeded": len(updated), "failed": len(ids) - len(updated)}, 200
+
+# -----------------------------
+# BULK DELETE
+# -----------------------------
+def bulk_delete_jobs(user_id, ids: list):
+    owned_jobs = select(Job.id).where(Job.user_id == user_id, Job.id.in_(ids))
+    owned_apps = select(Application.id).where(Application.user_id == user_id, Application.job_id.in_(owned_jobs))
+    try:
+        # Children first and explicitly, so nothing depends on the database enforcing ON DELETE CASCADE
+        db.session.execute(
+            delete(CoverLetter)
+            .where(CoverLetter.application_id.in_(owned_apps))
+            .execution_options(synchronize_session=False)
+        )
+        db.session.execute(
+            delete(Application)
+            .where(Application.id.in_(owned_apps))
+            .execution_options(synchronize_session=False)
+        )
+        deleted = set(db.session.execute(
+            delete(Job)
+            .where(Job.user_id == user_id, Job.id.in_(ids))
+            .returning(Job.id)
+            .execution_options(synchronize_session=False)
+        ).scalars())
+        if deleted:
+            bump_collection_versions(user_id, JOBS, APPLICATIONS, COVER_LETTERS)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logger.exception("Error bulk deleting jobs: %s", e)
+        return {"error": "Internal server error"}, 500
+
+    results = [{"id": job_id, "status": "deleted" if job_id in deleted else "not_found"} for job_id in ids]
+    return {"results": results, "succeeded": len(deleted), "failed": len(ids) - len(deleted)}, 200
+
+# -----------------------------
+# STREAMING IMPORT (CSV / JSONL)
+# -----------------------------
+def _csv_records(text):
+    """Yields (line_number, record, error) for each data row of a CSV with a header row."""
+    reader = csv.DictReader(text)
+    if reader.fieldnames is None:
+        return
+    reader.fieldnames = [(name or "").strip().lower() for name in reader.fieldnames]
+    for record in reader:
+        # Blank cells mean "not set"; columns without a header are dropped
+        yield reader.line_num, {
+            key: value.strip() or None
+            for key, value in record.items()
+            if key and isinstance(value, str)
+        }, None
+
+
+def _jsonl_records(text):
+    """Yields (line_number, record, error) for each non-blank line of a JSONL file."""
+    for line_number, line in enumerate(text, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line), None
+        except ValueError:
+            yield line_number, None, "Invalid JSON"
+
+
+def _flush_import_chunk(user_id, rows: list) -> int:
+    _insert_jobs(rows)
+    bump_collection_versions(user_id, JOBS)
+    db.session.commit()
+    return len(rows)
+
+
+def import_jobs(user_id, stream, fmt: str):
+    """
+    Imports jobs from an uploaded CSV or JSONL file without reading it whole.
+
+    Rows are validated like bulk creates and inserted in chunks of
+    JOB_IMPORT_CHUNK_SIZE, each committed on its own, so memory stays flat
+    and a failure keeps the chunks already imported.
+
+    Args:
+        stream: Binary file object of the upload.
+        fmt (str): "csv" (header row with Job field names) or "jsonl".
+    """
+    chunk_size = current_app.config["JOB_IMPORT_CHUNK_SIZE"]
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="" if fmt == "csv" else None)
+    records = _csv_records(text) if fmt == "csv" else _jsonl_records(text)
+
+    imported, failed, errors, chunk = 0, 0, [], []
+    try:
+        for line_number, record, error in records:
+            if error is None:
+                try:
+                    chunk.append(_insert_row(user_id, job_values(record)))
+                except ValueError as e:
+                    error = str(e)
+            if error is not None:
+                failed += 1
+                if len(errors) < MAX_IMPORT_ERRORS:
+                    errors.append({"line": line_number, "error": error})
+                continue
+            if len(chunk) >= chunk_size:
+                imported += _flush_import_chunk(user_id, chunk)
+                chunk = []
+        if chunk:
+            imported += _flush_import_chunk(user_id, chunk)
+    except (csv.Error, UnicodeDecodeError) as e:
+        db.session.rollback()
+        logger.warning("Job import stopped on unreadable file: %s", e, extra={"user_id": user_id, "imported": imported})
+        return {"error": f"Could not read file: {e}", "imported": imported, "failed": failed, "errors": errors}, 400
+    except Exception as e:
+        db.session.rollback()
+        logger.exception("Error importing jobs: %s", e)
+        return {"error": "Internal server error", "imported": imported}, 500
+
+    logger.info("Imported %d jobs", imported, extra={"user_id": user_id, "failed": failed})
+    return {
+        "imported": imported,
+        "failed": failed,
+        "errors": errors,
+        "errors_truncated": failed > len(errors)
+    }, 200
@@ -0,0 +1,58 @@
+from .cache_service import build_cache, hash_key
+from .collection_version_service import get_collection_version
+from flask import current_app
+
+
+# -----------------------------
+# READ-THROUGH
+# -----------------------------
+def cached_list(collection: str, user_id: int, params: tuple, loader):
+    """
+    Serves a list payload from the cache, calling `loader` on a miss.
+
+    Payloads are keyed on the user's collection version in the database, the
+    one conditional_get tags responses with. A committed write bumps it, so
+    every worker and host stops serving the old payloads at once, whatever
+    the cache backend. The version is the one conditional_get already read,
+    from the database the payload is loaded from.
+
+    Args:
+        collection (str): Collection name from collection_version_service.
+        user_id (int): Owner of the list.
+        params (tuple): Everything else the payload depends on (page, fields, ...).
+        loader (callable): Builds the JSON-serializable payload. Exceptions propagate
+            and nothing is cached.
+    """
+    cache = current_app.extensions.get("list_cache")
+    if cache is None:
+        return loader()
+
+    # Read the version first: a write committing during the load bumps it,
+    # so a payload mixing both states is stored under a version nobody reads any more
+    version = get_collection_version(user_id, collection)
+    key = hash_key("list", collection, user_id, version, *params)
+    cached = cache.get(key)
+    if cached is not None:
+        return current_app.json.loads(cached)
+
+    payload = loader()
+    # Flask's encoder, so a hit renders exactly like the payload it replaces
+    cache.set(key, current_app.json.dumps(payload))
+    return payload
+
+
+def init_app(app):
+    """
+    Creates the list cache (LIST_CACHE: "memory", "redis" or "none").
+
+    Entries of superseded versions are never read again and age out through
+    LIST_CACHE_TTL and, in memory, the LIST_CACHE_SIZE bound. The memory backend
+    is per process, which only costs hit rate: a worker never serves a list
+    older than the database's collection version.
+    """
+    app.extensions["list_cache"] = build_cache(
+        app.config["LIST_CACHE"],
+        max_entries=app.config["LIST_CACHE_SIZE"],
+        ttl=app.config["LIST_CACHE_TTL"],
+        url=app.config["REDIS_URL"]
+    )
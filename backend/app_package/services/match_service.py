@@ -0,0 +1,180 @@
+from .. import db
+from ..models import Job, Resume
+from ..term_vectors import index_resume, job_text, term_vector
+from .cache_service import MemoryCache
+from .collection_version_service import get_collection_version, JOBS
+from .job_service import SUMMARY_COLUMNS, serialize_job
+from flask import current_app
+from sqlalchemy import update
+from sqlalchemy.orm import load_only, undefer
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# numpy is imported inside the scoring functions: it only costs startup time
+# for workers that actually score matches
+
+# BM25 parameters (the usual defaults)
+BM25_K1 = 1.2
+BM25_B = 0.75
+MATCHED_TERMS = 5
+
+# -----------------------------
+# LAZY INDEXING
+# -----------------------------
+def _backfill_jobs(user_id: int):
+    """Indexes jobs written before term vectors existed (or reset by a bulk update)."""
+    missing = (
+        db.session.query(Job.id, Job.title, Job.description)
+        .filter(Job.user_id == user_id, Job.term_length.is_(None))
+        .all()
+    )
+    if not missing:
+        return
+    rows = []
+    for job_id, title, description in missing:
+        vector, length = term_vector(job_text(title, description))
+        rows.append({"id": job_id, "term_vector": vector, "term_length": length})
+    # ORM bulk UPDATE by primary key: one executemany for all rows
+    db.session.execute(update(Job), rows)
+    db.session.commit()
+    logger.info("Indexed %d jobs for match scoring", len(missing), extra={"user_id": user_id})
+
+
+# -----------------------------
+# PER-USER JOB INDEX (CACHED PER JOBS VERSION)
+# -----------------------------
+class JobTermIndex:
+    """
+    A user's job term vectors as flat COO arrays: entry k says job rows[k]
+    contains term terms[k] counts[k] times. Immutable once built.
+    """
+
+    def __init__(self, rows):
+        import numpy as np
+        self.vocabulary = {}
+        job_ids, lengths, entry_rows, entry_terms, entry_counts = [], [], [], [], []
+        for row, (job_id, vector, length) in enumerate(rows):
+            job_ids.append(job_id)
+            lengths.append(length)
+            for term, count in json.loads(vector).items():
+                entry_rows.append(row)
+                entry_terms.append(self.vocabulary.setdefault(term, len(self.vocabulary)))
+                entry_counts.append(count)
+
+        self.job_ids = np.array(job_ids, dtype=np.int64)
+        self.lengths = np.array(lengths, dtype=np.float32)
+        self.rows = np.array(entry_rows, dtype=np.int32)
+        self.terms = np.array(entry_terms, dtype=np.int32)
+        self.counts = np.array(entry_counts, dtype=np.float32)
+
+
+def _job_index(user_id: int) -> JobTermIndex:
+    cache = current_app.extensions["match_index_cache"]
+    key = (user_id, get_collection_version(user_id, JOBS))
+    index = cache.get(key)
+    if index is None:
+        # Any write that could change term vectors bumps the jobs version
+        _backfill_jobs(user_id)
+        rows = (
+            db.session.query(Job.id, Job.term_vector, Job.term_length)
+            .filter(Job.user_id == user_id)
+            .all()
+        )
+        index = JobTermIndex(rows)
+        cache.set(key, index)
+    return index
+
+
+def init_app(app):
+    """In-process LRU of per-user job indexes; stale versions simply age out."""
+    app.extensions["match_index_cache"] = MemoryCache(app.config["MATCH_INDEX_CACHE_SIZE"])
+
+
+# -----------------------------
+# SCORING (ONE MATRIX OPERATION)
+# -----------------------------
+def bm25_scores(query_counts: dict, index: JobTermIndex):
+    """
+    Scores every job in the index against the query at once.
+
+    Args:
+        query_counts (dict): Term counts of the query (the resume).
+        index (JobTermIndex): The user's jobs.
+
+    Returns:
+        tuple: (scores of shape [n_jobs], per-term contributions of shape
+        [n_jobs, n_terms], vocabulary list)
+    """
+    import numpy as np
+
+    # Terms no job contains contribute nothing
+    vocabulary = [term for term in query_counts if term in index.vocabulary]
+    n_jobs = len(index.job_ids)
+
+    # Only query terms matter, so the matrix is n_jobs x |query vocabulary|
+    column = np.full(len(index.vocabulary), -1, dtype=np.int32)
+    column[[index.vocabulary[term] for term in vocabulary]] = np.arange(len(vocabulary), dtype=np.int32)
+    entry_columns = column[index.terms]
+    hit = entry_columns >= 0
+    tf = np.zeros((n_jobs, len(vocabulary)), dtype=np.float32)
+    tf[index.rows[hit], entry_columns[hit]] = index.counts[hit]
+
+    avg_length = max(float(index.lengths.mean()), 1.0) if n_jobs else 1.0
+    df = np.count_nonzero(tf, axis=0)
+    idf = np.log1p((n_jobs - df + 0.5) / (df + 0.5))
+
+    norm = BM25_K1 * (1 - BM25_B + BM25_B * index.lengths / avg_length)
+    weights = tf * (BM25_K1 + 1) / (tf + norm[:, None]) * idf
+    # Repeated resume terms count more, with diminishing returns
+    query_weights = 1 + np.log(np.array([query_counts[term] for term in vocabulary], dtype=np.float32))
+
+    contributions = weights * query_weights
+    return contributions.sum(axis=1), contributions, vocabulary
+
+
+def score_jobs_for_resume(user_id: int, resume_id: int, limit: int = 20):
+    import numpy as np
+
+    resume = Resume.query.options(undefer(Resume.term_vector)).get(resume_id)
+    if not resume or resume.user_id != user_id:
+        return {"error": "Not found"}, 404
+
+    try:
+        needs_index = resume.term_length is None
+        if needs_index:
+            index_resume(resume)
+        # Read before committing so the resume is not reloaded
+        query_counts = json.loads(resume.term_vector)
+        if needs_index:
+            db.session.commit()
+
+        index = _job_index(user_id)
+        if not len(index.job_ids) or not query_counts:
+            return {"resume_id": resume_id, "items": []}, 200
+
+        scores, contributions, vocabulary = bm25_scores(query_counts, index)
+        top = np.argsort(-scores, kind="stable")[:limit]
+        top = top[scores[top] > 0]
+        jobs = {
+            job.id: job
+            for job in Job.query.options(load_only(*SUMMARY_COLUMNS)).filter(Job.id.in_(index.job_ids[top].tolist()))
+        }
+    except Exception as e:
+        db.session.rollback()
+        logger.exception("Error scoring jobs for resume: %s", e)
+        return {"error": "Internal server error"}, 500
+
+    items = []
+    for row in top:
+        job = jobs.get(int(index.job_ids[row]))
+        if job is None:
+            continue  # deleted since the index was built
+        best_terms = np.argsort(-contributions[row])[:MATCHED_TERMS]
+        items.append({
+            "job": serialize_job(job, summary=True),
+            "score": round(float(scores[row]), 4),
+            "matched_terms": [vocabulary[i] for i in best_terms if contributions[row, i] > 0]
+        })
+    return {"resume_id": resume_id, "items": items}, 200
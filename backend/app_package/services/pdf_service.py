@@ -0,0 +1,235 @@
+import logging
+import multiprocessing
+import signal
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError, wait
+from concurrent.futures.process import BrokenProcessPool
+from flask import current_app
+from .cache_service import build_cache, hash_key
+from ..metrics import PDF_EXTRACTION_LATENCY
+import hashlib
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def _fitz():
+    # PyMuPDF is slow to import and only needed once a PDF arrives (mostly in pool processes)
+    import fitz
+    return fitz
+
+
+def _page_texts(doc):
+    """Yields the non-empty stripped text of each page."""
+    for page in doc:
+        page_text = page.get_text().strip()
+        if page_text:
+            yield page_text
+
+
+# -----------------------------
+# WORKER PROCESS SIDE
+# -----------------------------
+class _ExtractionTimeout(Exception):
+    pass
+
+
+def _raise_timeout(signum, frame):
+    raise _ExtractionTimeout()
+
+
+def _extract_in_worker(data: bytes, max_pages: int, max_chars: int, timeout: float) -> dict:
+    """
+    Runs inside a pool process. Enforces the wall-clock timeout with SIGALRM so a
+    slow document is abandoned between pages instead of holding the process.
+    """
+    use_alarm = hasattr(signal, "SIGALRM")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+
+    try:
+        with _fitz().open(stream=data, filetype="pdf") as doc:
+            if len(doc) > max_pages:
+                return {"status": "too_many_pages", "pages": len(doc)}
+
+            parts = []
+            size = 0
+            for page_text in _page_texts(doc):
+                parts.append(page_text)
+                size += len(page_text) + 1
+                if size >= max_chars:
+                    break
+        return {"status": "ok", "text": "\n".join(parts)[:max_chars]}
+    except _ExtractionTimeout:
+        return {"status": "timeout"}
+    except Exception as e:
+        return {"status": "error", "error": str(e)}
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+# -----------------------------
+# PROCESS POOL
+# -----------------------------
+class PDFExtractionPool:
+    """
+    Bounded process pool for PDF parsing.
+
+    At most `workers` documents are parsed at once and at most `max_pending`
+    wait for a process; submit() returns None beyond that so the route can
+    answer 503 instead of queueing forever. Processes are started on first use.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self._slots = threading.BoundedSemaphore(workers + max_pending)
+        self._lock = threading.Lock()
+        self._executor = None
+        self._pending = set()  # futures of the current executor
+
+    def _get_executor(self):
+        # Called with self._lock held
+        if self._executor is None:
+            # spawn avoids forking a process that already runs request threads
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            self._pending = set()
+        return self._executor, self._pending
+
+    def submit(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            return None
+        try:
+            with self._lock:
+                executor, pending = self._get_executor()
+                future = executor.submit(fn, *args)
+                pending.add(future)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda f: self._done(f, pending))
+        return future
+
+    def _done(self, future, pending):
+        with self._lock:
+            pending.discard(future)
+        self._slots.release()
+
+    def recycle(self, grace: float = 0):
+        """
+        Swaps in a fresh executor for new work, e.g. after a worker stopped
+        responding. The old processes get `grace` seconds to finish the
+        documents already submitted to them; then whatever is left, the stuck
+        worker included, is killed.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+            pending = set(self._pending)
+        if executor is None:
+            return
+        threading.Thread(
+            target=self._retire, args=(executor, pending, grace), name="pdf-pool-retire", daemon=True
+        ).start()
+
+    @staticmethod
+    def _retire(executor, pending, grace: float):
+        wait(pending, timeout=grace)
+        # ProcessPoolExecutor has no public API to kill a stuck task
+        for process in list((getattr(executor, "_processes", None) or {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def init_app(app):
+    app.extensions["pdf_pool"] = PDFExtractionPool(
+        workers=app.config["PDF_EXTRACT_WORKERS"],
+        max_pending=app.config["PDF_EXTRACT_MAX_PENDING"]
+    )
+    # Extracted text keyed by the hash of the uploaded bytes
+    app.extensions["pdf_text_cache"] = build_cache(
+        app.config["PDF_TEXT_CACHE"],
+        max_entries=app.config["PDF_TEXT_CACHE_SIZE"],
+        ttl=app.config["PDF_TEXT_CACHE_TTL"],
+        max_rows=app.config["RESPONSE_CACHE_MAX_ROWS"],
+        purge_interval=app.config["RESPONSE_CACHE_PURGE_SECONDS"]
+    )
+
+
+# -----------------------------
+# EXTRACT (REQUEST SIDE)
+# -----------------------------
+def extract_pdf_text(data: bytes):
+    """
+    Extracts text from in-memory PDF bytes in the process pool with page, size
+    and time limits. Nothing is written to disk.
+
+    Returns:
+        tuple: ({"text": str}, 200) on success, or ({"error": str}, status) where
+        status is 400 for an unusable document and 503 when the pool is saturated.
+    """
+    config = current_app.config
+    pool = current_app.extensions["pdf_pool"]
+    timeout = config["PDF_EXTRACT_TIMEOUT"]
+    max_pages = config["PDF_MAX_PAGES"]
+    max_chars = config["PDF_MAX_CHARS"]
+
+    # Re-uploads of the same file skip parsing entirely. The limits are part of
+    # the key because they change what gets extracted.
+    cache = current_app.extensions.get("pdf_text_cache")
+    cache_key = hash_key(hashlib.sha256(data).hexdigest(), max_pages, max_chars)
+    if cache is not None:
+        text = cache.get(cache_key)
+        if text is not None:
+            return {"text": text}, 200
+
+    future = pool.submit(
+        _extract_in_worker,
+        data,
+        max_pages,
+        max_chars,
+        timeout
+    )
+    if future is None:
+        return {"error": "PDF processing is busy, please try again shortly"}, 503
+
+    # Extra time covers process start-up and queueing behind other documents
+    wait_limit = timeout * 2 + 5
+    start = time.perf_counter()
+    try:
+        outcome = future.result(timeout=wait_limit)
+    except FutureTimeoutError:
+        PDF_EXTRACTION_LATENCY.observe(time.perf_counter() - start, outcome="hung")
+        logger.error("PDF extraction did not return, recycling pool")
+        # Documents already in the old pool get as long as this one had
+        pool.recycle(grace=wait_limit)
+        return {"error": "PDF processing timed out"}, 503
+    except BrokenProcessPool:
+        PDF_EXTRACTION_LATENCY.observe(time.perf_counter() - start, outcome="broken")
+        logger.error("PDF extraction pool broke, recycling pool")
+        pool.recycle()
+        return {"error": "PDF processing is unavailable, please try again shortly"}, 503
+    PDF_EXTRACTION_LATENCY.observe(time.perf_counter() - start, outcome=outcome["status"])
+
+    if outcome["status"] == "too_many_pages":
+        return {"error": f"PDF has {outcome['pages']} pages, the maximum is {max_pages}"}, 400
+    if outcome["status"] == "timeout":
+        return {"error": "PDF took too long to process"}, 400
+    if outcome["status"] == "error":
+        logger.error("Failed to extract text from PDF: %s", outcome['error'])
+        return {"error": "Could not extract text from PDF"}, 400
+    if not outcome["text"]:
+        return {"error": "Could not extract text from PDF"}, 400
+
+    if cache is not None:
+        cache.set(cache_key, outcome["text"])
+    return {"text": outcome["text"]}, 200
@@ -1,14 +1,31 @@
+from ..database import reads_from_replica
 from .. import db
 from ..models import Resume
-from ..services.ai_service import extract_text_from_pdf
-import os
-import uuid
+from .collection_version_service import bump_collection_versions, RESUMES, APPLICATIONS
+from .list_cache_service import cached_list
+from ..services.pdf_service import extract_pdf_text
+from ..term_vectors import index_resume
+from ..utils import paginate_by_id
 from flask import current_app
+from sqlalchemy.orm import load_only
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Columns needed by the summary projection (no content)
+SUMMARY_COLUMNS = (Resume.id, Resume.title, Resume.user_id)
 
 # -----------------------------
 # SERIALIZER
 # -----------------------------
-def serialize_resume(resume: Resume):
+def serialize_resume(resume: Resume, summary: bool = False):
+    if summary:
+        return {
+            "id": resume.id,
+            "title": resume.title,
+            "user_id": resume.user_id
+        }
+
     return {
         "id": resume.id,
         "title": resume.title,
@@ -34,8 +51,10 @@ def create_resume(user_id: int, data: dict):
         title=title,
         content=content
     )
+    index_resume(new_resume)
 
     db.session.add(new_resume)
+    bump_collection_versions(user_id, RESUMES)
     db.session.commit()
 
     return serialize_resume(new_resume), 201
@@ -44,17 +63,37 @@ def create_resume(user_id: int, data: dict):
 # -----------------------------
 # GET ALL RESUMES FOR USER
 # -----------------------------
-def get_resumes_by_user(user_id: int):
+@reads_from_replica
+def get_resumes_by_user(user_id: int, limit: int = None, after: int = None, summary: bool = False):
     try:
-        resumes = Resume.query.filter_by(user_id=user_id).all()
-        return [serialize_resume(r) for r in resumes], 200
+        result = cached_list(
+            RESUMES, user_id, (limit, after, summary),
+            lambda: _load_resumes(user_id, limit, after, summary)
+        )
+        return result, 200
     except Exception as e:
-        print(f"Error fetching resumes by user ID: {e}")
+        logger.exception("Error fetching resumes by user ID: %s", e)
         return {"error": "Internal server error"}, 500
 
+
+def _load_resumes(user_id: int, limit: int, after: int, summary: bool):
+    query = Resume.query.filter_by(user_id=user_id)
+    if summary:
+        query = query.options(load_only(*SUMMARY_COLUMNS))
+    if limit is not None:
+        resumes, next_cursor = paginate_by_id(query, Resume.id, limit, after)
+        return {
+            "items": [serialize_resume(r, summary) for r in resumes],
+            "next_cursor": next_cursor
+        }
+
+    resumes = query.all()
+    return [serialize_resume(r, summary) for r in resumes]
+
 # -----------------------------
 # GET RESUME BY ID
 # -----------------------------
+@reads_from_replica
 def get_resume_by_id(user_id: int, resume_id: int):
     try:
         resume = Resume.query.get(resume_id)
@@ -62,7 +101,7 @@ def get_resume_by_id(user_id: int, resume_id: int):
             return {"error": "Not found"}, 404
         return serialize_resume(resume), 200
     except Exception as e:
-        print(f"Error fetching resume by ID: {e}")
+        logger.exception("Error fetching resume by ID: %s", e)
         return {"error": "Internal server error"}, 500
 
 # -----------------------------
@@ -74,28 +113,26 @@ def update_resume(user_id: int, resume_id: int, updates: dict, pdf_file=None):
         if not resume or resume.user_id != user_id:
             return {"error": "Not found"}, 404
 
-        # Update title/content_url from form
+        # Update title/content from form
         if "title" in updates and updates["title"]:
             resume.title = updates["title"]
 
         if pdf_file:
-            temp_dir = get_temp_upload_dir()
-            filename = f"{uuid.uuid4()}_{pdf_file.filename}"
-            temp_path = os.path.join(temp_dir, filename)
-            try:
-                pdf_file.save(temp_path)
-                resume.content_url = extract_text_from_pdf(temp_path)
-            finally:
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
-        elif "content_url" in updates and updates["content_url"]:
-            resume.content_url = updates["content_url"]
-
+            # Parsed in memory; a previously seen file is served from the text cache
+            extracted, extract_status = extract_pdf_text(pdf_file.read())
+            if extract_status != 200:
+                return extracted, extract_status
+            resume.content = extracted["text"]
+        elif "content" in updates and updates["content"]:
+            resume.content = updates["content"]
+
+        index_resume(resume)
+        bump_collection_versions(user_id, RESUMES)
         db.session.commit()
         return serialize_resume(resume), 200
     except Exception as e:
         db.session.rollback()
-        print(f"Error updating resume: {e}")
+        logger.exception("Error updating resume: %s", e)
         return {"error": "Internal server error"}, 500
 
 # -----------------------------
@@ -108,9 +145,11 @@ def delete_resume(user_id: int, resume_id: int):
             return {"error": "Not found"}, 404
 
         db.session.delete(resume)
+        # Applications using this resume have their resume_id cleared
+        bump_collection_versions(user_id, RESUMES, APPLICATIONS)
         db.session.commit()
         return {"message": "Deleted"}, 200
     except Exception as e:
         db.session.rollback()
-        print(f"Error deleting resume: {e}")
+        logger.exception("Error deleting resume: %s", e)
         return {"error": "Internal server error"}, 500
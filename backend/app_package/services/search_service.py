@@ -0,0 +1,156 @@
+from ..database import reads_from_replica
+from .. import db
+from ..models import Application, CoverLetter, Job, Resume, SEARCH_COLUMNS
+from ..utils import encode_offset_cursor
+from . import cover_letter_service, job_service, resume_service
+from sqlalchemy import column, func, literal_column, table
+from sqlalchemy.orm import load_only
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+# FTS5 bm25() column weights matching the Postgres setweight() classes
+BM25_WEIGHTS = {"A": 10.0, "B": 4.0, "C": 1.0}
+_WORD = re.compile(r"\w+", re.UNICODE)
+# An optional "-" and a "quoted phrase" (closing quote optional) or a bare word
+_TERM = re.compile(r'(-?)(?:"([^"]*)"?|([^\s"]+))')
+
+
+# -----------------------------
+# QUERY SYNTAX (SHARED BY BOTH BACKENDS)
+# -----------------------------
+def _parse_query(q: str) -> list:
+    """
+    Parses the websearch syntax both backends accept: words must all match,
+    "quoted words" match as a phrase, -word or -"phrase" excludes, and `or`
+    separates alternatives. Punctuation is ignored, as Postgres'
+    websearch_to_tsquery does.
+
+    Returns:
+        list: One (required, excluded) pair per alternative, each a list of
+        terms, a term being the list of its words. Alternatives with nothing
+        required are dropped: FTS5 cannot match on exclusions alone.
+    """
+    alternatives = [([], [])]
+    for match in _TERM.finditer(q):
+        negated, phrase, word = match.groups()
+        if phrase is None and not negated and word.lower() == "or":
+            alternatives.append(([], []))
+            continue
+        words = _WORD.findall(phrase if phrase is not None else word)
+        if words:
+            required, excluded = alternatives[-1]
+            (excluded if negated else required).append(words)
+    return [alternative for alternative in alternatives if alternative[0]]
+
+
+def _fts5_query(alternatives: list) -> str:
+    # Every word is quoted, so user input can never be parsed as other FTS5 syntax
+    def term(words):
+        return '"' + " ".join(words) + '"'
+
+    return " OR ".join(
+        "(" + " AND ".join(term(words) for words in required)
+        + "".join(f" NOT {term(words)}" for words in excluded) + ")"
+        for required, excluded in alternatives
+    )
+
+
+def _tsquery(alternatives: list) -> str:
+    # \w+ words hold no quotes or operators, so quoting them is enough
+    def term(words):
+        return "(" + " <-> ".join(f"'{word}'" for word in words) + ")"
+
+    return " | ".join(
+        "(" + " & ".join(
+            [term(words) for words in required] + [f"!{term(words)}" for words in excluded]
+        ) + ")"
+        for required, excluded in alternatives
+    )
+
+
+# -----------------------------
+# RANKED MATCHING (POSTGRES / SQLITE)
+# -----------------------------
+def _ranked(query, model, alternatives: list):
+    """Filters the query to rows matching the parsed query and orders it best match first."""
+    name = model.__tablename__
+
+    if db.session.get_bind().dialect.name == "postgresql":
+        tsquery = func.to_tsquery("english", _tsquery(alternatives))
+        vector = literal_column(f"{name}.search_vector")
+        rank = func.ts_rank_cd(vector, tsquery)
+        return (
+            query
+            .add_columns(rank.label("rank"))
+            .filter(vector.op("@@")(tsquery))
+            .order_by(rank.desc(), model.id.desc())
+        )
+
+    fts = table(f"{name}_fts", column("rowid"))
+    weights = ", ".join(str(BM25_WEIGHTS[weight]) for _, weight in SEARCH_COLUMNS[name])
+    # bm25() is lower for better matches; negated so rank grows with relevance on both backends
+    bm25 = literal_column(f"bm25({name}_fts, {weights})")
+    return (
+        query
+        .join(fts, fts.c.rowid == model.id)
+        .filter(literal_column(f"{name}_fts").op("MATCH")(_fts5_query(alternatives)))
+        .add_columns((-bm25).label("rank"))
+        .order_by(bm25, model.id.desc())
+    )
+
+
+def _search(query, model, serialize, q: str, limit: int, offset: int):
+    alternatives = _parse_query(q)
+    if not alternatives:
+        return {"items": [], "next_cursor": None}, 200
+
+    try:
+        rows = _ranked(query, model, alternatives).limit(limit + 1).offset(offset).all()
+    except Exception as e:
+        db.session.rollback()
+        logger.exception("Error searching %s: %s", model.__tablename__, e)
+        return {"error": "Internal server error"}, 500
+
+    next_cursor = encode_offset_cursor(offset + limit) if len(rows) > limit else None
+    items = []
+    for obj, rank in rows[:limit]:
+        item = serialize(obj, True)
+        item["rank"] = float(rank)
+        items.append(item)
+    return {"items": items, "next_cursor": next_cursor}, 200
+
+
+# -----------------------------
+# PUBLIC SEARCHES (OWNERSHIP ENFORCED)
+# -----------------------------
+@reads_from_replica
+def search_jobs(user_id: int, q: str, limit: int, offset: int = 0):
+    query = (
+        Job.query
+        .options(load_only(*job_service.SUMMARY_COLUMNS))
+        .filter(Job.user_id == user_id)
+    )
+    return _search(query, Job, job_service.serialize_job, q, limit, offset)
+
+
+@reads_from_replica
+def search_resumes(user_id: int, q: str, limit: int, offset: int = 0):
+    query = (
+        Resume.query
+        .options(load_only(*resume_service.SUMMARY_COLUMNS))
+        .filter(Resume.user_id == user_id)
+    )
+    return _search(query, Resume, resume_service.serialize_resume, q, limit, offset)
+
+
+@reads_from_replica
+def search_cover_letters(user_id: int, q: str, limit: int, offset: int = 0):
+    query = (
+        CoverLetter.query
+        .options(load_only(*cover_letter_service.SUMMARY_COLUMNS))
+        .join(Application)
+        .filter(Application.user_id == user_id)
+    )
+    return _search(query, CoverLetter, cover_letter_service.serialize_cover_letter, q, limit, offset)
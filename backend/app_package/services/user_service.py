@@ -2,6 +2,9 @@ from ..models import User
 from .. import db
 from werkzeug.security import generate_password_hash, check_password_hash
 from flask import session
+import logging
+
+logger = logging.getLogger(__name__)
 
 # -----------------------------
 # Serialize
@@ -30,7 +33,7 @@ def create_user(data: dict):
         return new_user
     except Exception as e:
         db.session.rollback()
-        print(f"Error creating user: {e}")
+        logger.exception("Error creating user: %s", e)
         return None
 
 # -----------------------------
@@ -60,7 +63,7 @@ def update_user(user: User, updates: dict):
         return user
     except Exception as e:
         db.session.rollback()
-        print(f"Error updating user: {e}")
+        logger.exception("Error updating user: %s", e)
         return None
 
 # -----------------------------
@@ -73,7 +76,7 @@ def delete_user(user: User):
         return True
     except Exception as e:
         db.session.rollback()
-        print(f"Error deleting user: {e}")
+        logger.exception("Error deleting user: %s", e)
         return False
 
 # -----------------------------
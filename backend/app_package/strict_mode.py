@@ -0,0 +1,71 @@
+from flask import current_app, g, has_app_context, jsonify, request
+from sqlalchemy import event
+from sqlalchemy.orm import Session, raiseload
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# -----------------------------
+# Per-endpoint query budgets
+# -----------------------------
+def query_budget(max_queries: int):
+    """
+    Declares how many SQL statements a view may run. Only enforced when
+    STRICT_QUERY_MODE is on; otherwise it is documentation. None marks a view
+    whose query count grows with its input by design (e.g. chunked imports).
+    """
+    def decorator(view):
+        view.query_budget = max_queries
+        return view
+    return decorator
+
+
+# -----------------------------
+# Raise on lazy loads
+# -----------------------------
+def _add_raiseload(orm_execute_state):
+    if not has_app_context() or not current_app.config["STRICT_QUERY_MODE"]:
+        return
+    # Refreshes and relationship loads themselves must not be blocked
+    if not orm_execute_state.is_select or orm_execute_state.is_column_load or orm_execute_state.is_relationship_load:
+        return
+    # Explicit eager options on the query still win over the wildcard
+    orm_execute_state.statement = orm_execute_state.statement.options(raiseload("*"))
+
+
+def init_app(app):
+    """
+    In STRICT_QUERY_MODE every relationship not eagerly loaded by the query
+    raises on access, and a request fails with 500 once it runs more SQL
+    statements than its budget (see query_budget, DEFAULT_QUERY_BUDGET).
+    Relies on the per-request query count kept by metrics.init_app.
+    """
+    if not app.config["STRICT_QUERY_MODE"]:
+        return
+
+    if not event.contains(Session, "do_orm_execute", _add_raiseload):
+        event.listen(Session, "do_orm_execute", _add_raiseload)
+
+    @app.after_request
+    def enforce_query_budget(response):
+        view = app.view_functions.get(request.endpoint)
+        if view is None or "db_queries" not in g:
+            return response
+
+        budget = getattr(view, "query_budget", app.config["DEFAULT_QUERY_BUDGET"])
+        if budget is None or g.db_queries <= budget:
+            return response
+
+        logger.error(
+            "Query budget exceeded",
+            extra={"endpoint": request.endpoint, "queries": g.db_queries, "budget": budget}
+        )
+        failure = jsonify({
+            "error": "Query budget exceeded",
+            "endpoint": request.endpoint,
+            "queries": g.db_queries,
+            "budget": budget
+        })
+        failure.status_code = 500
+        return failure
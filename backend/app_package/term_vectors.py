@@ -0,0 +1,44 @@
+from .models import Job, Resume
+from collections import Counter
+import json
+import re
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+STOP_WORDS = frozenset("""
+    a about above after all also an and any are as at be been being both but by can could
+    did do does doing for from further had has have having he her here hers him his how i
+    if in into is it its itself just me more most my no nor not of off on once only or other
+    our ours out over own same she should so some such than that the their theirs them then
+    there these they this those through to too under until up very was we were what when
+    where which while who whom why will with would you your yours
+""".split())
+
+
+# -----------------------------
+# Term vectors for local match scoring, computed on write
+# -----------------------------
+def tokenize(text: str) -> list:
+    if not text:
+        return []
+    return [
+        token for token in _TOKEN.findall(text.lower())
+        if len(token) > 1 and token not in STOP_WORDS
+    ]
+
+
+def term_vector(text: str):
+    """Returns (term counts as JSON, token count) for storing next to the text."""
+    tokens = tokenize(text)
+    return json.dumps(Counter(tokens), separators=(",", ":")), len(tokens)
+
+
+def job_text(title: str, description: str) -> str:
+    return f"{title or ''}\n{description or ''}"
+
+
+def index_job(job: Job):
+    job.term_vector, job.term_length = term_vector(job_text(job.title, job.description))
+
+
+def index_resume(resume: Resume):
+    resume.term_vector, resume.term_length = term_vector(resume.content)
@@ -0,0 +1,251 @@
+from datetime import datetime, timezone
+from sqlalchemy import insert
+import base64
+import json
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+MAX_BULK_ITEMS = 500
+DEFAULT_SEARCH_PAGE_SIZE = 20
+MAX_SEARCH_QUERY_LENGTH = 200
+
+# -----------------------------
+# Cursor pagination helpers
+# -----------------------------
+def _encode_payload(payload: dict) -> str:
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_payload(cursor: str, key: str) -> int:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        value = int(data[key])
+    except Exception:
+        raise ValueError("Invalid cursor")
+    return value
+
+
+def encode_cursor(last_id: int) -> str:
+    """Encodes the id of the last row on a page into an opaque cursor."""
+    return _encode_payload({"id": last_id})
+
+
+def decode_cursor(cursor: str) -> int:
+    """
+    Decodes a cursor produced by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    return _decode_payload(cursor, "id")
+
+
+def encode_offset_cursor(offset: int) -> str:
+    """Encodes the position of the next page of a ranked result set."""
+    return _encode_payload({"offset": offset})
+
+
+def decode_offset_cursor(cursor: str) -> int:
+    """
+    Decodes a cursor produced by encode_offset_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    offset = _decode_payload(cursor, "offset")
+    if offset < 0:
+        raise ValueError("Invalid cursor")
+    return offset
+
+
+def _parse_limit(limit, default: int) -> int:
+    if limit is None:
+        return default
+    try:
+        limit = int(limit)
+    except ValueError:
+        raise ValueError("limit must be an integer")
+    if limit < 1:
+        raise ValueError("limit must be positive")
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def parse_page_args(args, offset_cursor: bool = False):
+    """
+    Reads ?limit=&after= from the request args.
+
+    Args:
+        offset_cursor (bool): Decode `after` as an offset cursor (lists not sorted by id).
+
+    Returns:
+        tuple: (limit, after_id or offset), or (None, None) when the client did not ask for a page.
+
+    Raises:
+        ValueError: If limit or after is invalid.
+    """
+    limit = args.get("limit")
+    after = args.get("after")
+    if limit is None and after is None:
+        return None, None
+
+    limit = _parse_limit(limit, DEFAULT_PAGE_SIZE)
+    if offset_cursor:
+        return limit, decode_offset_cursor(after) if after else 0
+    after_id = decode_cursor(after) if after else None
+    return limit, after_id
+
+
+def parse_fields_arg(args) -> bool:
+    """
+    Reads ?fields= from the request args.
+
+    Returns:
+        bool: True when the client asked for the summary projection.
+
+    Raises:
+        ValueError: If fields is not "summary" or "full".
+    """
+    fields = args.get("fields", "full")
+    if fields not in ("summary", "full"):
+        raise ValueError("fields must be 'summary' or 'full'")
+    return fields == "summary"
+
+
+def parse_search_args(args):
+    """
+    Reads ?q=&limit=&after= for search endpoints.
+
+    Returns:
+        tuple: (q, limit, offset)
+
+    Raises:
+        ValueError: If q is missing or too long, or limit/after is invalid.
+    """
+    q = (args.get("q") or "").strip()
+    if not q:
+        raise ValueError("q is required")
+    if len(q) > MAX_SEARCH_QUERY_LENGTH:
+        raise ValueError(f"q must be at most {MAX_SEARCH_QUERY_LENGTH} characters")
+
+    limit = _parse_limit(args.get("limit"), DEFAULT_SEARCH_PAGE_SIZE)
+    after = args.get("after")
+    offset = decode_offset_cursor(after) if after else 0
+    return q, limit, offset
+
+
+def parse_export_format(args) -> str:
+    """
+    Reads ?format= for export endpoints ("ndjson" by default).
+
+    Raises:
+        ValueError: If format is not "ndjson" or "csv".
+    """
+    fmt = args.get("format", "ndjson")
+    if fmt not in ("ndjson", "csv"):
+        raise ValueError("format must be 'ndjson' or 'csv'")
+    return fmt
+
+
+def paginate_by_id(query, id_column, limit: int, after_id: int = None):
+    """
+    Applies keyset pagination ordered on id desc.
+
+    Fetches one extra row to know whether another page exists, so each page
+    costs an index range scan no matter how deep the client has scrolled.
+
+    Returns:
+        tuple: (rows, next_cursor) where next_cursor is None on the last page.
+    """
+    if after_id is not None:
+        query = query.filter(id_column < after_id)
+
+    rows = query.order_by(id_column.desc()).limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].id)
+    return rows, next_cursor
+
+
+def paginate_by_offset(query, limit: int, offset: int = 0):
+    """
+    Pages an already ordered query by offset, for orderings keyset pagination
+    cannot follow (e.g. nullable sort columns).
+
+    Returns:
+        tuple: (rows, next_cursor) where next_cursor is None on the last page.
+    """
+    rows = query.offset(offset).limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_offset_cursor(offset + limit)
+    return rows, next_cursor
+
+
+def parse_iso_datetime(value, field: str):
+    """
+    Parses an ISO 8601 date or datetime ("Z" accepted). Empty values give None.
+    Values with an offset are converted to naive UTC, which is what the
+    columns hold; values without one are taken as UTC already.
+
+    Raises:
+        ValueError: Naming the field when the value is not a valid date.
+    """
+    if value is None or value == "":
+        return None
+    if not isinstance(value, datetime):
+        try:
+            value = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            raise ValueError(f"{field} must be an ISO 8601 date")
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+# -----------------------------
+# Bulk request helpers
+# -----------------------------
+def insert_returning_ids(session, model, rows: list) -> list:
+    """
+    Inserts rows with multi-row INSERT ... RETURNING and returns the new ids
+    in row order.
+    """
+    if session.get_bind().dialect.name == "sqlite":
+        # SQLAlchemy falls back to one INSERT per row to order RETURNING on SQLite.
+        # Writers are serialized there and rowids are handed out in VALUES order,
+        # so sorting the ids of one batched statement gives the same result.
+        return sorted(session.execute(insert(model).returning(model.id), rows).scalars())
+    stmt = insert(model).returning(model.id, sort_by_parameter_order=True)
+    return session.execute(stmt, rows).scalars().all()
+
+
+def parse_bulk_items(data, key: str) -> list:
+    """
+    Reads the array of objects under `key` from a bulk request body.
+
+    Raises:
+        ValueError: If it is missing, empty, not a list or longer than MAX_BULK_ITEMS.
+    """
+    items = data.get(key) if isinstance(data, dict) else None
+    if not isinstance(items, list) or not items:
+        raise ValueError(f"{key} must be a non-empty array")
+    if len(items) > MAX_BULK_ITEMS:
+        raise ValueError(f"At most {MAX_BULK_ITEMS} {key} per request")
+    return items
+
+
+def parse_bulk_ids(data) -> list:
+    """
+    Reads the "ids" array of a bulk request body, dropping duplicates.
+
+    Raises:
+        ValueError: If it is not a non-empty list of integers of at most MAX_BULK_ITEMS.
+    """
+    ids = parse_bulk_items(data, "ids")
+    if not all(isinstance(i, int) and not isinstance(i, bool) for i in ids):
+        raise ValueError("ids must be integers")
+    return list(dict.fromkeys(ids))
@@ -0,0 +1,107 @@
+"""
+Cold-start budget check for a worker: imports app_package and runs create_app()
+in fresh interpreters under `python -X importtime`, then fails when the median
+startup exceeds the budget or a lazily loaded dependency got imported eagerly.
+
+    cd backend
+    python -m benchmarks.import_time                 # IMPORT_TIME_BUDGET_MS or 500 ms
+    python -m benchmarks.import_time --budget-ms 400 --runs 7 --top 15
+
+Exit status is 0 within budget and 1 otherwise, so it can gate CI.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cold start of one worker: imports plus create_app(), in milliseconds
+DEFAULT_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "500"))
+
+# Loaded on first use by ai_service, pdf_service and match_service
+LAZY_MODULES = ("openai", "fitz", "pymupdf", "numpy", "redis")
+
+STARTUP_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+from app_package import create_app
+create_app()
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({{"ms": elapsed, "eager": sorted(m for m in {lazy!r} if m in sys.modules)}}))
+"""
+
+
+def _startup_env() -> dict:
+    env = dict(os.environ)
+    # An in-memory database keeps the measurement independent of the network
+    env.setdefault("DATABASE_URL", "sqlite://")
+    env.setdefault("OPENAI_API_KEY", "sk-import-time-check")
+    env["LOG_LEVEL"] = "ERROR"
+    return env
+
+
+def _parse_importtime(stderr: str) -> dict:
+    """Maps each imported package (root name) to its largest cumulative import time in microseconds."""
+    packages = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        if not cumulative_us.strip().isdigit():
+            continue  # header line
+        package = name.strip().split(".")[0]
+        packages[package] = max(packages.get(package, 0), int(cumulative_us))
+    return packages
+
+
+def measure_once():
+    """Runs one cold start; returns (startup ms, eagerly imported lazy modules, import times)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", STARTUP_SCRIPT.format(lazy=LAZY_MODULES)],
+        cwd=BACKEND_DIR,
+        env=_startup_env(),
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    return report["ms"], report["eager"], _parse_importtime(result.stderr)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="slowest packages to list")
+    args = parser.parse_args(argv)
+
+    timings, eager, imports = [], set(), {}
+    for _ in range(args.runs):
+        ms, eager_modules, import_times = measure_once()
+        timings.append(ms)
+        eager.update(eager_modules)
+        imports = import_times
+
+    median = statistics.median(timings)
+    print(f"startup: median {median:.0f} ms over {args.runs} runs (min {min(timings):.0f}, max {max(timings):.0f}), budget {args.budget_ms:.0f} ms")
+    print("slowest packages to import (last run, cumulative):")
+    for name, us in sorted(imports.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {us / 1000:8.1f} ms  {name}")
+
+    failed = False
+    if eager:
+        print(f"FAIL: imported at startup but meant to load lazily: {', '.join(sorted(eager))}")
+        failed = True
+    if median > args.budget_ms:
+        print(f"FAIL: startup {median:.0f} ms is over the {args.budget_ms:.0f} ms budget")
+        failed = True
+    if not failed:
+        print("OK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
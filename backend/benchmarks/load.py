@@ -0,0 +1,478 @@
+"""
+End-to-end load benchmark for every blueprint.
+
+Boots create_app() against SQLite (a fresh temporary file by default) or a local
+Postgres, seeds N users with M jobs, applications, resumes and cover letters
+through the API, then drives each route of auth, job, application, resume,
+cover letter and AI blueprints from concurrent clients. Reports p50/p95/p99
+latency and throughput per route and compares them with a stored baseline.
+
+    cd backend
+    python -m benchmarks.load                               # SQLite, compare with baseline
+    python -m benchmarks.load --save-baseline               # record a new baseline
+    python -m benchmarks.load --database-url postgresql://localhost/career_bench --reset
+    python -m benchmarks.load --routes job_route application_route --requests 500
+
+Requests run in process through Flask test clients, one per virtual user and
+thread, so latencies include the whole Flask/SQLAlchemy stack but no network.
+OpenAI is replaced by a canned client (optionally delayed with --ai-latency-ms):
+the AI routes measure this app's overhead, not the model.
+
+Baselines are machine specific: record them on the machine that runs the check.
+Exit status is 1 when a route errors or regresses beyond the tolerance.
+"""
+from dataclasses import dataclass
+from types import SimpleNamespace
+import argparse
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import uuid
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+
+# Words jobs, resumes and cover letters are built from, so search and match routes find rows
+VOCABULARY = (
+    "python flask django react javascript typescript sql postgres redis docker kubernetes aws "
+    "backend frontend fullstack api rest graphql testing ci cd devops linux cloud data analytics "
+    "machine learning pandas spark kafka microservices security performance caching scaling "
+    "agile mentoring leadership design architecture mobile ios android product startup fintech "
+    "healthcare remote senior junior engineer developer platform infrastructure observability"
+).split()
+COMPANIES = ("Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark", "Wayne", "Wonka")
+STATUSES = ("Pending", "Applied", "Interview", "Offer", "Rejected")
+PASSWORD = "bench-password"
+
+STUB_FEEDBACK = json.dumps({
+    "strengths": ["Relevant backend experience."],
+    "gaps": ["No mention of Kubernetes."],
+    "suggestions": ["Quantify the API performance work."],
+    "tone_feedback": "Professional and confident."
+})
+
+
+# -----------------------------
+# Canned OpenAI client
+# -----------------------------
+class _StubCompletions:
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def create(self, stream=False, **kwargs):
+        if self.latency:
+            time.sleep(self.latency)
+        if stream:
+            parts = (STUB_FEEDBACK[:40], STUB_FEEDBACK[40:])
+            return iter(SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=p))]) for p in parts)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=STUB_FEEDBACK))])
+
+
+def install_stub_ai(latency_ms: float):
+    from app_package.services import ai_service
+    client = SimpleNamespace(chat=SimpleNamespace(completions=_StubCompletions(latency_ms / 1000)))
+    ai_service.get_client = lambda: client
+
+
+# -----------------------------
+# Virtual users and seeding
+# -----------------------------
+def _text(rng, words: int) -> str:
+    return " ".join(rng.choice(VOCABULARY) for _ in range(words))
+
+
+def _ok(response, what: str):
+    if response.status_code >= 300:
+        raise RuntimeError(f"{what} failed with {response.status_code}: {response.get_data(as_text=True)[:200]}")
+    return response.get_json()
+
+
+class VirtualUser:
+    """A registered, logged-in user with a client and the ids of the rows it owns."""
+
+    def __init__(self, app, username: str):
+        self.app = app
+        self.username = username
+        self.client = app.test_client()
+        self.job_ids, self.application_ids, self.resume_ids, self.cover_letter_ids = [], [], [], []
+
+    def register(self):
+        _ok(self.client.post("/api/auth/register", json={
+            "username": self.username, "email": f"{self.username}@bench.local", "password": PASSWORD
+        }), "register")
+        self.login(self.client)
+
+    def login(self, client):
+        _ok(client.post("/api/auth/login", json={"username": self.username, "password": PASSWORD}), "login")
+
+    def new_client(self, logged_in: bool = True):
+        client = self.app.test_client()
+        if logged_in:
+            self.login(client)
+        return client
+
+    def job_payloads(self, rng, count: int) -> list:
+        return [{
+            "title": f"{rng.choice(VOCABULARY).title()} {rng.choice(('Engineer', 'Developer', 'Lead'))}",
+            "company": rng.choice(COMPANIES),
+            "location": rng.choice(("Remote", "Berlin", "New York", "London")),
+            "description": _text(rng, 80),
+            "deadline": f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T00:00:00"
+        } for _ in range(count)]
+
+    def bulk_create_jobs(self, rng, count: int) -> list:
+        ids = []
+        for start in range(0, count, 500):
+            body = _ok(self.client.post("/api/jobs/bulk/create", json={
+                "jobs": self.job_payloads(rng, min(500, count - start))
+            }), "seed jobs")
+            ids.extend(r["id"] for r in body["results"] if r["status"] == "created")
+        return ids
+
+    def bulk_create_applications(self, rng, job_ids: list) -> list:
+        ids = []
+        for start in range(0, len(job_ids), 500):
+            body = _ok(self.client.post("/api/applications/bulk/create", json={"applications": [
+                {"title": f"Application {job_id}", "job_id": job_id, "status": rng.choice(STATUSES)}
+                for job_id in job_ids[start:start + 500]
+            ]}), "seed applications")
+            ids.extend(r["id"] for r in body["results"] if r["status"] == "created")
+        return ids
+
+    def create_resume(self, rng) -> int:
+        return _ok(self.client.post("/api/resumes/create", data={
+            "title": f"Resume {uuid.uuid4().hex[:6]}", "content": _text(rng, 300)
+        }), "create resume")["id"]
+
+    def create_cover_letter(self, rng) -> int:
+        return _ok(self.client.post("/api/cover-letters/create", data={
+            "title": f"Letter {uuid.uuid4().hex[:6]}",
+            "application_id": rng.choice(self.application_ids),
+            "content": _text(rng, 200)
+        }), "create cover letter")["id"]
+
+    def seed(self, rng, count: int):
+        self.register()
+        self.job_ids = self.bulk_create_jobs(rng, count)
+        self.application_ids = self.bulk_create_applications(rng, self.job_ids)
+        self.resume_ids = [self.create_resume(rng) for _ in range(count)]
+        self.cover_letter_ids = [self.create_cover_letter(rng) for _ in range(count)]
+
+
+# -----------------------------
+# Route operations
+# -----------------------------
+# Each operation gets (user, rng), may issue untimed setup requests, and returns
+# (client, method, path, request kwargs) for the one timed request.
+def _feedback_payload(rng) -> dict:
+    # A unique cover letter keeps every call a cache miss
+    return {"resume": _text(rng, 60), "job": _text(rng, 60), "cover_letter": f"{_text(rng, 60)} {uuid.uuid4().hex}"}
+
+
+def _csv_upload(user, rng, rows: int = 50) -> dict:
+    buffer = io.StringIO()
+    buffer.write("title,company,location,description\n")
+    for job in user.job_payloads(rng, rows):
+        buffer.write(f"{job['title']},{job['company']},{job['location']},{job['description']}\n")
+    return {"data": {"file": (io.BytesIO(buffer.getvalue().encode()), "jobs.csv")}, "content_type": "multipart/form-data"}
+
+
+def _throwaway_jobs(user, rng, count: int) -> list:
+    return user.bulk_create_jobs(rng, count)
+
+
+OPERATIONS = {
+    # auth_route
+    "auth_route.register": lambda u, r: (u.new_client(False), "POST", "/api/auth/register", {"json": {
+        "username": f"bench-{uuid.uuid4().hex}", "email": f"{uuid.uuid4().hex}@bench.local", "password": PASSWORD}}),
+    "auth_route.login": lambda u, r: (u.new_client(False), "POST", "/api/auth/login", {"json": {
+        "username": u.username, "password": PASSWORD}}),
+    "auth_route.logout": lambda u, r: (u.new_client(), "POST", "/api/auth/logout", {}),
+    "auth_route.me": lambda u, r: (u.client, "GET", "/api/auth/me", {}),
+
+    # job_route
+    "job_route.create": lambda u, r: (u.client, "POST", "/api/jobs/create", {"json": u.job_payloads(r, 1)[0]}),
+    "job_route.list": lambda u, r: (u.client, "GET", "/api/jobs/list", {}),
+    "job_route.list_page": lambda u, r: (u.client, "GET", "/api/jobs/list?limit=20&fields=summary", {}),
+    "job_route.get": lambda u, r: (u.client, "GET", f"/api/jobs/{r.choice(u.job_ids)}", {}),
+    "job_route.update": lambda u, r: (u.client, "PUT", f"/api/jobs/{r.choice(u.job_ids)}", {"json": {"location": r.choice(("Remote", "Paris"))}}),
+    "job_route.bulk_create": lambda u, r: (u.client, "POST", "/api/jobs/bulk/create", {"json": {"jobs": u.job_payloads(r, 20)}}),
+    "job_route.bulk_update": lambda u, r: (u.client, "PUT", "/api/jobs/bulk/update", {"json": {
+        "ids": r.sample(u.job_ids, min(20, len(u.job_ids))), "changes": {"location": r.choice(("Remote", "Paris"))}}}),
+    "job_route.bulk_delete": lambda u, r: (u.client, "DELETE", "/api/jobs/bulk/delete", {"json": {"ids": _throwaway_jobs(u, r, 20)}}),
+    "job_route.import": lambda u, r: (u.client, "POST", "/api/jobs/import", _csv_upload(u, r)),
+    "job_route.export": lambda u, r: (u.client, "GET", "/api/jobs/export?format=ndjson", {}),
+    "job_route.search": lambda u, r: (u.client, "GET", f"/api/jobs/search?q={r.choice(VOCABULARY)}", {}),
+
+    # application_route
+    "application_route.list": lambda u, r: (u.client, "GET", "/api/applications/list", {}),
+    "application_route.list_filtered": lambda u, r: (u.client, "GET",
+        f"/api/applications/list?status={r.choice(STATUSES)}&sort=-deadline&limit=20&fields=summary", {}),
+    "application_route.stats": lambda u, r: (u.client, "GET", "/api/applications/stats", {}),
+    "application_route.create": lambda u, r: (u.client, "POST", "/api/applications/create", {"json": {
+        "title": "Bench application", "job_id": r.choice(u.job_ids)}}),
+    "application_route.get": lambda u, r: (u.client, "GET", f"/api/applications/{r.choice(u.application_ids)}", {}),
+    "application_route.update": lambda u, r: (u.client, "PUT", f"/api/applications/update/{r.choice(u.application_ids)}", {"json": {
+        "status": r.choice(STATUSES)}}),
+    "application_route.delete": lambda u, r: (u.client, "DELETE", f"/api/applications/delete/{u.bulk_create_applications(r, [r.choice(u.job_ids)])[0]}", {}),
+    "application_route.bulk_create": lambda u, r: (u.client, "POST", "/api/applications/bulk/create", {"json": {"applications": [
+        {"title": "Bench application", "job_id": job_id} for job_id in r.sample(u.job_ids, min(20, len(u.job_ids)))]}}),
+    "application_route.bulk_update": lambda u, r: (u.client, "PUT", "/api/applications/bulk/update", {"json": {
+        "ids": r.sample(u.application_ids, min(20, len(u.application_ids))), "changes": {"status": r.choice(STATUSES)}}}),
+    "application_route.bulk_delete": lambda u, r: (u.client, "DELETE", "/api/applications/bulk/delete", {"json": {
+        "ids": u.bulk_create_applications(r, r.sample(u.job_ids, min(20, len(u.job_ids))))}}),
+    "application_route.export": lambda u, r: (u.client, "GET", "/api/applications/export?format=csv", {}),
+
+    # resume_route
+    "resume_route.list": lambda u, r: (u.client, "GET", "/api/resumes/list", {}),
+    "resume_route.create": lambda u, r: (u.client, "POST", "/api/resumes/create", {"data": {"title": "Bench resume", "content": _text(r, 300)}}),
+    "resume_route.update": lambda u, r: (u.client, "PUT", f"/api/resumes/update/{r.choice(u.resume_ids)}", {"data": {"title": f"Resume {r.randint(1, 999)}"}}),
+    "resume_route.delete": lambda u, r: (u.client, "DELETE", f"/api/resumes/delete/{u.create_resume(r)}", {}),
+    "resume_route.search": lambda u, r: (u.client, "GET", f"/api/resumes/search?q={r.choice(VOCABULARY)}", {}),
+    "resume_route.matches": lambda u, r: (u.client, "GET", f"/api/resumes/{r.choice(u.resume_ids)}/matches", {}),
+
+    # cover_letter_route
+    "cover_letter_route.list": lambda u, r: (u.client, "GET", "/api/cover-letters/list", {}),
+    "cover_letter_route.get": lambda u, r: (u.client, "GET", f"/api/cover-letters/{r.choice(u.cover_letter_ids)}", {}),
+    "cover_letter_route.create": lambda u, r: (u.client, "POST", "/api/cover-letters/create", {"data": {
+        "title": "Bench letter", "application_id": r.choice(u.application_ids), "content": _text(r, 200)}}),
+    "cover_letter_route.update": lambda u, r: (u.client, "PUT", f"/api/cover-letters/update/{r.choice(u.cover_letter_ids)}", {"data": {
+        "title": f"Letter {r.randint(1, 999)}"}}),
+    "cover_letter_route.delete": lambda u, r: (u.client, "DELETE", f"/api/cover-letters/delete/{u.create_cover_letter(r)}", {}),
+    "cover_letter_route.export": lambda u, r: (u.client, "GET", "/api/cover-letters/export?format=ndjson", {}),
+    "cover_letter_route.search": lambda u, r: (u.client, "GET", f"/api/cover-letters/search?q={r.choice(VOCABULARY)}", {}),
+
+    # ai_route
+    "ai_route.feedback": lambda u, r: (u.client, "POST", "/api/ai/feedback", {"json": _feedback_payload(r)}),
+    "ai_route.feedback_stream": lambda u, r: (u.client, "POST", "/api/ai/feedback/stream", {"json": _feedback_payload(r)}),
+    "ai_route.feedback_async": lambda u, r: (u.client, "POST", "/api/ai/feedback?async=1", {"json": _feedback_payload(r)}),
+    "ai_route.feedback_status": lambda u, r: (u.client, "GET", "/api/ai/feedback/" + _ok(
+        u.client.post("/api/ai/feedback?async=1", json=_feedback_payload(r)), "enqueue feedback")["job_id"], {}),
+}
+
+
+# -----------------------------
+# Driving and statistics
+# -----------------------------
+@dataclass
+class RouteResult:
+    name: str
+    latencies: list
+    errors: int
+    elapsed: float
+
+    def percentile(self, q: float) -> float:
+        """Nearest-rank percentile in milliseconds."""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        rank = max(1, int(round(q / 100 * len(ordered) + 0.5)))
+        return ordered[min(rank, len(ordered)) - 1] * 1000
+
+    @property
+    def throughput(self) -> float:
+        return len(self.latencies) / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> dict:
+        return {
+            "requests": len(self.latencies),
+            "errors": self.errors,
+            "p50_ms": round(self.percentile(50), 3),
+            "p95_ms": round(self.percentile(95), 3),
+            "p99_ms": round(self.percentile(99), 3),
+            "rps": round(self.throughput, 2)
+        }
+
+
+def _timed_request(operation, user, rng):
+    client, method, path, kwargs = operation(user, rng)
+    start = time.perf_counter()
+    response = client.open(path, method=method, **kwargs)
+    response.get_data()  # streamed bodies (exports, SSE) are part of the latency
+    elapsed = time.perf_counter() - start
+    response.close()
+    return elapsed, response.status_code
+
+
+def drive_route(name: str, users: list, requests: int, concurrency: int, warmup: int, seed: int) -> RouteResult:
+    """Runs `requests` timed calls of one route spread over `concurrency` threads."""
+    operation = OPERATIONS[name]
+    latencies = []
+    errors = 0
+    lock = threading.Lock()
+    remaining = iter(range(requests))
+
+    def attempt(user, rng, timed: bool):
+        # Warmup failures count as errors too; only timed successes give latencies
+        nonlocal errors
+        try:
+            elapsed, status = _timed_request(operation, user, rng)
+            failed = status >= 300
+        except Exception as e:
+            failed = True
+            print(f"  {name}: {e}", file=sys.stderr)
+        with lock:
+            if failed:
+                errors += 1
+            elif timed:
+                latencies.append(elapsed)
+
+    def worker(index: int):
+        rng = random.Random(seed * 1000 + index)
+        user = users[index % len(users)]
+        for _ in range(warmup):
+            attempt(user, rng, timed=False)
+        while True:
+            with lock:
+                if next(remaining, None) is None:
+                    return
+            attempt(user, rng, timed=True)
+
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return RouteResult(name, latencies, errors, time.perf_counter() - start)
+
+
+def compare(results: dict, baseline: dict, tolerance: float, min_delta_ms: float) -> list:
+    """Returns human-readable regressions of p95 latency or throughput against the baseline."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get("routes", {}).get(name)
+        if previous is None:
+            continue
+        p95, base_p95 = current["p95_ms"], previous["p95_ms"]
+        # The absolute floor keeps sub-millisecond routes from failing on jitter
+        if p95 > base_p95 * (1 + tolerance) and p95 - base_p95 > min_delta_ms:
+            regressions.append(f"{name}: p95 {p95:.1f} ms vs baseline {base_p95:.1f} ms")
+        if current["rps"] < previous["rps"] * (1 - tolerance):
+            regressions.append(f"{name}: {current['rps']:.1f} req/s vs baseline {previous['rps']:.1f} req/s")
+    return regressions
+
+
+# -----------------------------
+# App setup
+# -----------------------------
+def boot_app(database_url: str, reset: bool):
+    os.environ["DATABASE_URL"] = database_url
+    os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    os.environ["STRICT_QUERY_MODE"] = "false"
+
+    from app_package import create_app, db
+    app = create_app()
+    with app.app_context():
+        if reset:
+            db.drop_all()
+        db.create_all()
+    return app, db
+
+
+def seed_users(app, count: int, per_user: int, concurrency: int, seed: int) -> list:
+    run = uuid.uuid4().hex[:8]
+    users = [VirtualUser(app, f"bench-{run}-{i}") for i in range(count)]
+
+    def seed_one(user_index):
+        users[user_index].seed(random.Random(seed + user_index), per_user)
+
+    for start in range(0, count, concurrency):
+        batch = [threading.Thread(target=seed_one, args=(i,)) for i in range(start, min(start + concurrency, count))]
+        for thread in batch:
+            thread.start()
+        for thread in batch:
+            thread.join()
+    return users
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", help="default: a fresh SQLite file in a temporary directory")
+    parser.add_argument("--reset", action="store_true", help="drop and recreate all tables first")
+    parser.add_argument("--users", type=int, default=8, help="virtual users to seed (N)")
+    parser.add_argument("--per-user", type=int, default=50, help="jobs, applications, resumes and cover letters per user (M)")
+    parser.add_argument("--requests", type=int, default=200, help="timed requests per route")
+    parser.add_argument("--concurrency", type=int, default=8, help="concurrent clients")
+    parser.add_argument("--warmup", type=int, default=2, help="untimed requests per client before timing")
+    parser.add_argument("--routes", nargs="*", help="only routes whose name contains one of these")
+    parser.add_argument("--ai-latency-ms", type=float, default=0.0, help="delay of the canned OpenAI client")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--baseline", help="baseline file (default: benchmarks/baselines/<dialect>.json)")
+    parser.add_argument("--save-baseline", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative regression")
+    parser.add_argument("--min-delta-ms", type=float, default=2.0, help="ignore p95 regressions smaller than this")
+    parser.add_argument("--output", help="also write the results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    database_url = args.database_url or f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='career-bench-'), 'bench.db')}"
+    app, db = boot_app(database_url, args.reset)
+    install_stub_ai(args.ai_latency_ms)
+    with app.app_context():
+        dialect = db.engine.dialect.name
+
+    names = [name for name in OPERATIONS if not args.routes or any(part in name for part in args.routes)]
+    if not names:
+        parser.error("no route matches --routes")
+
+    start = time.perf_counter()
+    users = seed_users(app, args.users, args.per_user, args.concurrency, args.seed)
+    print(f"seeded {args.users} users x {args.per_user} rows on {dialect} in {time.perf_counter() - start:.1f} s")
+
+    print(f"{'route':<36} {'req':>6} {'err':>5} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'req/s':>9}")
+    results, total_requests, total_time = {}, 0, 0.0
+    for name in names:
+        result = drive_route(name, users, args.requests, args.concurrency, args.warmup, args.seed)
+        summary = results[name] = result.summary()
+        total_requests += summary["requests"]
+        total_time += result.elapsed
+        print(f"{name:<36} {summary['requests']:>6} {summary['errors']:>5} {summary['p50_ms']:>9.2f} "
+              f"{summary['p95_ms']:>9.2f} {summary['p99_ms']:>9.2f} {summary['rps']:>9.1f}")
+    print(f"total: {total_requests} requests in {total_time:.1f} s ({total_requests / total_time:.1f} req/s)")
+
+    report = {
+        "meta": {
+            "dialect": dialect, "users": args.users, "per_user": args.per_user,
+            "requests": args.requests, "concurrency": args.concurrency, "ai_latency_ms": args.ai_latency_ms
+        },
+        "routes": results
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    failed = False
+    errored = [name for name, summary in results.items() if summary["errors"]]
+    if errored:
+        print(f"FAIL: errors on {', '.join(errored)}")
+        failed = True
+
+    baseline_path = args.baseline or os.path.join(BASELINE_DIR, f"{dialect}.json")
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(baseline_path), exist_ok=True)
+        with open(baseline_path, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f"baseline written to {baseline_path}")
+    elif os.path.exists(baseline_path):
+        with open(baseline_path) as f:
+            baseline = json.load(f)
+        if baseline.get("meta") != report["meta"]:
+            print(f"note: baseline was recorded with different settings: {baseline.get('meta')}")
+        regressions = compare(results, baseline, args.tolerance, args.min_delta_ms)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}")
+        failed = failed or bool(regressions)
+    else:
+        print(f"no baseline at {baseline_path}; run with --save-baseline to record one")
+
+    print("FAIL" if failed else "OK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
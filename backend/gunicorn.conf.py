@@ -0,0 +1,63 @@
+"""
+Gunicorn settings, read automatically when gunicorn starts in this directory:
+
+    gunicorn wsgi:app
+
+Every value can be overridden with the GUNICORN_* environment variables below.
+"""
+import multiprocessing
+import os
+
+
+def _env_bool(name: str, default: str) -> bool:
+    return os.getenv(name, default).lower() in ("1", "true", "yes")
+
+
+bind = os.getenv("GUNICORN_BIND", f"0.0.0.0:{os.getenv('PORT', '5000')}")
+
+# Threaded workers: requests mostly wait on Postgres, OpenAI and streamed
+# exports, so threads keep a worker busy without one process per request.
+# Each process holds its own DB pool (DB_POOL_SIZE + DB_MAX_OVERFLOW) and, with
+# LIST_CACHE=memory, its own list cache; LIST_CACHE=redis shares hits across workers.
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+workers = int(os.getenv("GUNICORN_WORKERS", str(multiprocessing.cpu_count() * 2 + 1)))
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+
+# Build the app once in the master so workers fork with it imported;
+# post_fork rebuilds what must not be shared across processes
+preload_app = _env_bool("GUNICORN_PRELOAD", "true")
+
+# Seconds an idle keep-alive connection is held open (behind a load balancer,
+# keep this above the balancer's idle timeout)
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+# A worker silent for this long is killed; AI feedback runs in background
+# threads, so requests themselves stay well below it
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+# Time given to in-flight requests (and streamed exports) on restart or shutdown
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+
+# Recycle workers periodically to bound memory growth; jitter avoids restarting all at once
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "2000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "200"))
+
+# The app writes one access line per request itself (app_package.access, in
+# LOG_FORMAT with request ids); set this to "-" for gunicorn's own on top
+accesslog = os.getenv("GUNICORN_ACCESS_LOG") or None
+errorlog = "-"
+loglevel = os.getenv("GUNICORN_LOG_LEVEL", "info")
+
+
+def post_fork(server, worker):
+    if not preload_app:
+        return
+    from app_package import reset_after_fork
+    from wsgi import app
+    reset_after_fork(app)
+
+
+def post_worker_init(worker):
+    # Each worker heartbeats its own feedback jobs and re-queues those of
+    # workers recycled by max_requests or killed on timeout
+    from app_package import start_background_workers
+    from wsgi import app
+    start_background_workers(app)
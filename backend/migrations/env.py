@@ -1,4 +1,5 @@
 import logging
+import re
 from logging.config import fileConfig
 
 from flask import current_app
@@ -51,6 +52,19 @@ def get_metadata():
     return target_db.metadata
 
 
+# The full-text search objects (see SEARCH_COLUMNS in app_package/models.py)
+# are created by raw DDL, not mapped: the FTS5 tables with their shadow tables
+# on SQLite, the generated search_vector column and its GIN index on Postgres.
+# Autogenerate must neither report them as drift nor drop them.
+SEARCH_OBJECT = re.compile(r'^(\w+_fts(_\w+)?|search_vector|ix_\w+_search_vector)$')
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    if type_ in ('table', 'column', 'index') and SEARCH_OBJECT.match(name or ''):
+        return False
+    return True
+
+
 def run_migrations_offline():
     """Run migrations in 'offline' mode.
 
@@ -65,7 +79,8 @@ def run_migrations_offline():
     """
     url = config.get_main_option("sqlalchemy.url")
     context.configure(
-        url=url, target_metadata=get_metadata(), literal_binds=True
+        url=url, target_metadata=get_metadata(), literal_binds=True,
+        include_object=include_object
     )
 
     with context.begin_transaction():
@@ -93,10 +108,18 @@ def run_migrations_online():
     conf_args = current_app.extensions['migrate'].configure_args
     if conf_args.get("process_revision_directives") is None:
         conf_args["process_revision_directives"] = process_revision_directives
+    if conf_args.get("include_object") is None:
+        conf_args["include_object"] = include_object
 
     connectable = get_engine()
 
     with connectable.connect() as connection:
+        if connection.dialect.name == 'postgresql':
+            # The app's engine carries DB_STATEMENT_TIMEOUT_MS; index builds and
+            # table rewrites on large tables must not be cancelled by it
+            connection.exec_driver_sql('SET statement_timeout = 0')
+            connection.commit()
+
         context.configure(
             connection=connection,
             target_metadata=get_metadata(),
@@ -0,0 +1,47 @@
+"""Add indexes for application list filters
+
+Revision ID: a8e2d6f4c135
+Revises: f1c3a5e7b920
+Create Date: 2026-10-18 16:05:27.614820
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8e2d6f4c135'
+down_revision = 'f1c3a5e7b920'
+branch_labels = None
+depends_on = None
+
+# (index name, table, columns) matching the predicates the applications list
+# compiles its status, submitted-at, company and deadline filters into.
+INDEXES = [
+    ('ix_applications_user_id_status', 'applications', ['user_id', 'status']),
+    ('ix_applications_user_id_submitted_at', 'applications', ['user_id', 'submitted_at']),
+    ('ix_jobs_user_id_company', 'jobs', ['user_id', 'company']),
+    ('ix_jobs_user_id_deadline', 'jobs', ['user_id', 'deadline']),
+]
+
+
+def upgrade():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction on Postgres
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, table, columns in reversed(INDEXES):
+            op.drop_index(
+                name, table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,49 @@
+"""Add indexes for hot lookup paths
+
+Revision ID: b7d41c2e9a10
+Revises: 9cb0446603ca
+Create Date: 2026-10-18 10:12:41.283305
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d41c2e9a10'
+down_revision = '9cb0446603ca'
+branch_labels = None
+depends_on = None
+
+# (index name, table, columns) matching the filters and orderings in the services:
+# login filters users by username, list routes filter by user_id and order by id desc,
+# cover letters are reached through their application_id.
+INDEXES = [
+    ('ix_users_username', 'users', ['username']),
+    ('ix_jobs_user_id_id', 'jobs', ['user_id', 'id']),
+    ('ix_resumes_user_id_id', 'resumes', ['user_id', 'id']),
+    ('ix_applications_user_id_id', 'applications', ['user_id', 'id']),
+    ('ix_coverletters_application_id_id', 'coverletters', ['application_id', 'id']),
+]
+
+
+def upgrade():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction on Postgres
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, table, columns in reversed(INDEXES):
+            op.drop_index(
+                name, table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
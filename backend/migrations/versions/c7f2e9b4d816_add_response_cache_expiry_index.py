@@ -0,0 +1,37 @@
+"""Add response_cache expiry index
+
+Revision ID: c7f2e9b4d816
+Revises: a8e2d6f4c135
+Create Date: 2026-10-18 18:20:44.107362
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7f2e9b4d816'
+down_revision = 'a8e2d6f4c135'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Serves the purge of expired rows and the eviction order past RESPONSE_CACHE_MAX_ROWS.
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction on Postgres
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_response_cache_expires_at', 'response_cache', ['expires_at'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_response_cache_expires_at', table_name='response_cache',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,74 @@
+"""Add full-text search over jobs, resumes and cover letters
+
+Revision ID: e4b7c9d2a613
+Revises: d5a1b8c3e402
+Create Date: 2026-10-18 15:26:53.417730
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4b7c9d2a613'
+down_revision = 'd5a1b8c3e402'
+branch_labels = None
+depends_on = None
+
+# Searchable columns and rank weights; kept in sync with models.SEARCH_COLUMNS
+SEARCH_COLUMNS = {
+    'jobs': (('title', 'A'), ('company', 'B'), ('description', 'C')),
+    'resumes': (('title', 'A'), ('content', 'B')),
+    'coverletters': (('title', 'A'), ('content', 'B')),
+}
+
+
+def _postgres_upgrade():
+    # Adding a stored generated column rewrites the table; run off-peak on large tables
+    for table, columns in SEARCH_COLUMNS.items():
+        vector = " || ".join(
+            f"setweight(to_tsvector('english', coalesce({name}, '')), '{weight}')"
+            for name, weight in columns
+        )
+        op.execute(f"ALTER TABLE {table} ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ({vector}) STORED")
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction on Postgres
+    with op.get_context().autocommit_block():
+        for table in SEARCH_COLUMNS:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{table}_search_vector ON {table} USING GIN (search_vector)")
+
+
+def _sqlite_upgrade():
+    for table, columns in SEARCH_COLUMNS.items():
+        names = ", ".join(name for name, _ in columns)
+        new_values = ", ".join(f"new.{name}" for name, _ in columns)
+        old_values = ", ".join(f"old.{name}" for name, _ in columns)
+        insert = f"INSERT INTO {table}_fts(rowid, {names}) VALUES (new.id, {new_values});"
+        remove = f"INSERT INTO {table}_fts({table}_fts, rowid, {names}) VALUES ('delete', old.id, {old_values});"
+
+        op.execute(f"CREATE VIRTUAL TABLE {table}_fts USING fts5({names}, content='{table}', content_rowid='id', tokenize='porter unicode61')")
+        op.execute(f"CREATE TRIGGER {table}_fts_ai AFTER INSERT ON {table} BEGIN {insert} END")
+        op.execute(f"CREATE TRIGGER {table}_fts_ad AFTER DELETE ON {table} BEGIN {remove} END")
+        op.execute(f"CREATE TRIGGER {table}_fts_au AFTER UPDATE ON {table} BEGIN {remove} {insert} END")
+        # Index the rows that already exist
+        op.execute(f"INSERT INTO {table}_fts({table}_fts) VALUES ('rebuild')")
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        _postgres_upgrade()
+    elif dialect == 'sqlite':
+        _sqlite_upgrade()
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    for table in reversed(list(SEARCH_COLUMNS)):
+        if dialect == 'postgresql':
+            op.execute(f"DROP INDEX IF EXISTS ix_{table}_search_vector")
+            op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector")
+        elif dialect == 'sqlite':
+            for suffix in ('ai', 'ad', 'au'):
+                op.execute(f"DROP TRIGGER IF EXISTS {table}_fts_{suffix}")
+            op.execute(f"DROP TABLE IF EXISTS {table}_fts")
@@ -1,19 +1,15 @@
-from sqlalchemy import text 
-from app_package import create_app, db
+from app_package import create_app, db, start_background_workers
 from flask_migrate import Migrate
-from app_package.models import User, Job, Resume, Application, CoverLetter
+import os
 
 app = create_app()
 migrate = Migrate(app, db)
 
 if __name__ == "__main__":
-    with app.app_context():
-        try:
-            with db.engine.connect() as conn:
-                result = conn.execute(text("SELECT 1"))
-                print("Database connection successful:", result.fetchone())
-        except Exception as e:
-            print("Database connection failed:", e)
-
-    # Start server
-    app.run(debug=True)
+    # Development server only; production runs gunicorn wsgi:app (see gunicorn.conf.py).
+    # Database connectivity is reported by GET /readyz.
+    debug = os.getenv("FLASK_DEBUG", "true").lower() in ("1", "true", "yes")
+    # The reloader's parent only watches files; its child (WERKZEUG_RUN_MAIN) serves
+    if not debug or os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        start_background_workers(app)
+    app.run(debug=debug)
@@ -0,0 +1,130 @@
+"""
+Shared fixtures: an app in STRICT_QUERY_MODE on a fresh SQLite file, a client
+logged in as a seeded user, and a SQL statement counter.
+
+    cd backend
+    python -m pytest
+"""
+from contextlib import contextmanager
+from sqlalchemy import event
+import pytest
+
+from app_package import create_app, db
+
+PASSWORD = "test-password"
+SEED_ROWS = 3
+
+
+@pytest.fixture
+def app_env(tmp_path, monkeypatch):
+    """The environment the `app` fixture builds from; override `app` to add to it."""
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'test.db'}")
+    monkeypatch.setenv("STRICT_QUERY_MODE", "true")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("LOG_LEVEL", "WARNING")
+    monkeypatch.delenv("DATABASE_REPLICA_URL", raising=False)
+    for name in ("AI_FEEDBACK_CACHE", "PDF_TEXT_CACHE", "LIST_CACHE"):
+        monkeypatch.setenv(name, "memory")
+    return monkeypatch
+
+
+def build_app():
+    """Creates the app from the current environment; yields it, then shuts it down."""
+    # No feedback monitor: tests drive the pool themselves, and it would add queries to the counts
+    app = create_app()
+    app.config["TESTING"] = True
+    with app.app_context():
+        db.create_all(bind_key=None)
+    yield app
+
+    app.extensions["feedback_workers"].shutdown()
+    app.extensions["pdf_pool"].shutdown()
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose()
+
+
+@pytest.fixture
+def app(app_env):
+    yield from build_app()
+
+
+def _ok(response):
+    assert response.status_code < 300, response.get_data(as_text=True)
+    return response.get_json()
+
+
+@pytest.fixture
+def client(app):
+    """A client logged in as `tester`, who owns SEED_ROWS rows of every collection."""
+    client = app.test_client()
+    _ok(client.post("/api/auth/register", json={
+        "username": "tester", "email": "tester@example.com", "password": PASSWORD
+    }))
+    _ok(client.post("/api/auth/login", json={"username": "tester", "password": PASSWORD}))
+
+    for i in range(SEED_ROWS):
+        job = _ok(client.post("/api/jobs/create", json={
+            "title": f"Python Engineer {i}", "company": f"Company {i}", "description": "python flask sql"
+        }))
+        application = _ok(client.post("/api/applications/create", json={
+            "title": f"Application {i}", "job_id": job["id"]
+        }))
+        _ok(client.post("/api/resumes/create", data={
+            "title": f"Resume {i}", "content": "python flask sql developer"
+        }))
+        _ok(client.post("/api/cover-letters/create", data={
+            "title": f"Letter {i}", "application_id": application["id"], "content": "python cover letter"
+        }))
+    return client
+
+
+@pytest.fixture
+def other_client(app, client):
+    """A client logged in as `other`, who owns one row of every collection, created after tester's."""
+    other = app.test_client()
+    _ok(other.post("/api/auth/register", json={
+        "username": "other", "email": "other@example.com", "password": PASSWORD
+    }))
+    _ok(other.post("/api/auth/login", json={"username": "other", "password": PASSWORD}))
+
+    job = _ok(other.post("/api/jobs/create", json={"title": "Python Wizard", "company": "Other"}))
+    application = _ok(other.post("/api/applications/create", json={"title": "Other application", "job_id": job["id"]}))
+    _ok(other.post("/api/resumes/create", data={"title": "Other resume", "content": "python"}))
+    _ok(other.post("/api/cover-letters/create", data={
+        "title": "Other letter", "application_id": application["id"], "content": "python cover letter"
+    }))
+    return other
+
+
+@pytest.fixture
+def count_queries(app):
+    """
+    Counts the SQL statements run inside the block, including those of a
+    streamed response body read inside it:
+
+        with count_queries() as counter:
+            client.get("/api/jobs/list").get_data()
+        assert counter.count == 2
+    """
+    @contextmanager
+    def counting():
+        counter = _Counter()
+        with app.app_context():
+            engines = list(db.engines.values())
+        for engine in engines:
+            event.listen(engine, "after_cursor_execute", counter.record)
+        try:
+            yield counter
+        finally:
+            for engine in engines:
+                event.remove(engine, "after_cursor_execute", counter.record)
+    return counting
+
+
+class _Counter:
+    def __init__(self):
+        self.count = 0
+
+    def record(self, *args):
+        self.count += 1
@@ -0,0 +1,45 @@
+"""
+One access log line per request, with the request id the response echoes.
+"""
+import logging
+
+import pytest
+
+from app_package.logging_config import RequestIdFilter, access_logger
+
+
+class _Records(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def access_records(app):
+    handler = _Records()
+    handler.addFilter(RequestIdFilter())
+    access_logger.addHandler(handler)
+    # The fixture's LOG_LEVEL=WARNING would drop the INFO lines
+    level = logging.getLogger("app_package").level
+    logging.getLogger("app_package").setLevel(logging.INFO)
+    yield handler.records
+    logging.getLogger("app_package").setLevel(level)
+    access_logger.removeHandler(handler)
+
+
+def test_requests_are_logged_once(client, access_records):
+    response = client.get("/api/jobs/list?limit=2", headers={"X-Request-ID": "abc-123"})
+
+    [record] = access_records
+    assert (record.method, record.path, record.status) == ("GET", "/api/jobs/list", 200)
+    assert record.duration_ms >= 0
+    assert record.request_id == response.headers["X-Request-ID"] == "abc-123"
+
+
+def test_probes_are_not_logged(client, access_records):
+    client.get("/healthz")
+    client.get("/metrics")
+    assert access_records == []
@@ -0,0 +1,43 @@
+"""
+AI provider failures answer with an error and are logged, on the plain and
+the streaming route.
+"""
+import pytest
+
+from app_package.routes import ai_route
+
+PAYLOAD = {"resume": "python developer", "job": "backend engineer", "cover_letter": "dear team"}
+
+
+def _provider_down(prompt):
+    raise RuntimeError("provider unavailable")
+
+
+@pytest.fixture
+def errors(monkeypatch):
+    """Records what the AI routes log, whatever LOG_LEVEL the app runs at."""
+    records = []
+    monkeypatch.setattr(ai_route.logger, "exception", lambda msg, *args: records.append(msg % args))
+    return records
+
+
+def test_failed_feedback_is_logged(client, monkeypatch, errors):
+    monkeypatch.setattr(ai_route.ai_service, "generate_feedback", _provider_down)
+
+    response = client.post("/api/ai/feedback", json=PAYLOAD)
+
+    assert response.status_code == 500
+    assert errors == ["AI feedback generation failed: provider unavailable"]
+
+
+def test_failed_stream_is_logged(client, monkeypatch, errors):
+    def stream(prompt):
+        yield "Partial"
+        _provider_down(prompt)
+    monkeypatch.setattr(ai_route.ai_service, "stream_feedback", stream)
+
+    body = client.post("/api/ai/feedback/stream", json=PAYLOAD).get_data(as_text=True)
+
+    assert body.startswith('event: token\ndata: {"text": "Partial"}')
+    assert "event: error" in body
+    assert errors == ["AI feedback stream failed: provider unavailable"]
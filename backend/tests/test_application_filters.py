@@ -0,0 +1,106 @@
+"""
+The applications list filters and sorts in SQL: the right rows, in the right
+order, on every page.
+"""
+from datetime import datetime
+
+import pytest
+
+from app_package import db
+from app_package.models import Application
+from conftest import PASSWORD
+
+# title: (company, employment type, deadline, status, submitted_at)
+APPLICATIONS = {
+    "A": ("Acme", "Full-time", "2026-11-01", "Pending", datetime(2026, 1, 10)),
+    "B": ("Globex, Inc.", "Contract", "2026-12-01", "Interview", datetime(2026, 2, 10)),
+    "C": ("Initech", "Part-time", None, "Rejected", datetime(2026, 3, 10)),
+    "D": ("Acme", "Contract", "2026-10-20", "Interview", datetime(2026, 4, 10)),
+}
+
+
+@pytest.fixture
+def applicant(app):
+    """A client whose only applications are APPLICATIONS, created in title order."""
+    client = app.test_client()
+    client.post("/api/auth/register", json={"username": "applicant", "email": "a@example.com", "password": PASSWORD})
+    client.post("/api/auth/login", json={"username": "applicant", "password": PASSWORD})
+
+    submitted = {}
+    for title, (company, employment_type, deadline, status, submitted_at) in APPLICATIONS.items():
+        job = client.post("/api/jobs/create", json={
+            "title": f"Job {title}", "company": company, "employment_type": employment_type, "deadline": deadline
+        }).get_json()
+        application = client.post("/api/applications/create", json={
+            "title": title, "job_id": job["id"], "status": status
+        }).get_json()
+        submitted[application["id"]] = submitted_at
+
+    with app.app_context():
+        for app_id, submitted_at in submitted.items():
+            db.session.get(Application, app_id).submitted_at = submitted_at
+        db.session.commit()
+    return client
+
+
+def _titles(client, **params):
+    response = client.get("/api/applications/list", query_string=params)
+    assert response.status_code == 200, response.get_data(as_text=True)
+    return [item["title"] for item in response.get_json()]
+
+
+@pytest.mark.parametrize("params, expected", [
+    ({"status": "Interview"}, {"B", "D"}),
+    ({"status": "Interview,Rejected"}, {"B", "C", "D"}),
+    ({"company": "Globex, Inc."}, {"B"}),
+    ({"company": ["Acme", "Initech"]}, {"A", "C", "D"}),
+    ({"employment_type": "Contract"}, {"B", "D"}),
+    ({"status": "Interview", "employment_type": "Contract", "company": "Acme"}, {"D"}),
+    ({"status": "Offer"}, set()),
+    # _after is inclusive, _before exclusive
+    ({"submitted_after": "2026-02-10", "submitted_before": "2026-04-10"}, {"B", "C"}),
+    ({"submitted_after": "2026-03-10T00:00:00Z"}, {"C", "D"}),
+    ({"deadline_before": "2026-11-15"}, {"A", "D"}),
+    ({"deadline_after": "2026-11-01"}, {"A", "B"}),
+])
+def test_filters_select_the_matching_rows(applicant, params, expected):
+    assert set(_titles(applicant, **params)) == expected
+
+
+@pytest.mark.parametrize("sort, expected", [
+    (None, ["D", "C", "B", "A"]),
+    ("id", ["A", "B", "C", "D"]),
+    ("-submitted_at", ["D", "C", "B", "A"]),
+    ("title", ["A", "B", "C", "D"]),
+    # Missing deadlines sort last both ways
+    ("deadline", ["D", "A", "B", "C"]),
+    ("-deadline", ["B", "A", "D", "C"]),
+    # Ties on the company fall back to the newest id first
+    ("company", ["D", "A", "B", "C"]),
+    ("-status", ["C", "A", "D", "B"]),
+])
+def test_sort_orders_the_rows(applicant, sort, expected):
+    assert _titles(applicant, **({"sort": sort} if sort else {})) == expected
+
+
+@pytest.mark.parametrize("params, expected", [
+    ({"sort": "deadline"}, ["D", "A", "B", "C"]),
+    ({"sort": "-submitted_at", "employment_type": "Contract"}, ["D", "B"]),
+    ({"status": "Interview,Pending"}, ["D", "B", "A"]),
+])
+def test_pages_follow_the_filter_and_sort(applicant, params, expected):
+    titles, after = [], None
+    while True:
+        page = applicant.get("/api/applications/list", query_string={
+            **params, "limit": 1 if len(expected) < 4 else 3, **({"after": after} if after else {})
+        }).get_json()
+        titles += [item["title"] for item in page["items"]]
+        after = page["next_cursor"]
+        if after is None:
+            break
+    assert titles == expected
+
+
+@pytest.mark.parametrize("params", [{"sort": "salary"}, {"deadline_after": "soon"}])
+def test_invalid_arguments_are_rejected(applicant, params):
+    assert applicant.get("/api/applications/list", query_string=params).status_code == 400
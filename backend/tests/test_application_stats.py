@@ -0,0 +1,58 @@
+"""
+Dashboard stats: counts, and upcoming deadlines compared and reported in UTC.
+"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from conftest import SEED_ROWS
+
+
+def _iso(delta: timedelta, offset_hours: int = 0) -> str:
+    zone = timezone(timedelta(hours=offset_hours))
+    return (datetime.now(timezone.utc) + delta).astimezone(zone).isoformat(timespec="seconds")
+
+
+@pytest.fixture
+def deadlines(client):
+    """Sets job 1's deadline in the past and jobs 2 and 3 in the future, one sent with an offset."""
+    client.put("/api/jobs/1", json={"deadline": _iso(-timedelta(hours=1))})
+    client.put("/api/jobs/2", json={"deadline": _iso(timedelta(days=2), offset_hours=-5)})
+    client.put("/api/jobs/3", json={"deadline": _iso(timedelta(days=1), offset_hours=9)})
+
+
+def test_stats_count_and_list_upcoming_deadlines(client, deadlines):
+    client.put("/api/applications/update/1", json={"status": "Interview"})
+    stats = client.get("/api/applications/stats").get_json()
+
+    assert stats["total"] == SEED_ROWS
+    assert stats["by_status"] == {"Interview": 1, "Pending": 2}
+    assert [item["job_id"] for item in stats["upcoming_deadlines"]] == [3, 2]
+
+
+def test_deadlines_are_reported_in_utc(client, deadlines):
+    [first, second] = client.get("/api/applications/stats").get_json()["upcoming_deadlines"]
+
+    for item in (first, second):
+        assert item["deadline"].endswith("+00:00")
+    # Offsets were converted on the way in, so the instants survive the round trip
+    sent = datetime.now(timezone.utc) + timedelta(days=1)
+    assert abs(datetime.fromisoformat(first["deadline"]) - sent) < timedelta(minutes=1)
+
+
+def test_upcoming_limits_the_list(client, deadlines):
+    stats = client.get("/api/applications/stats?upcoming=1").get_json()
+    assert [item["job_id"] for item in stats["upcoming_deadlines"]] == [3]
+
+
+@pytest.mark.parametrize("upcoming, error", [
+    ("abc", "upcoming must be an integer"),
+    ("2.5", "upcoming must be an integer"),
+    ("-1", "upcoming must be between 0 and 50"),
+    ("51", "upcoming must be between 0 and 50"),
+])
+def test_invalid_upcoming_is_rejected(client, upcoming, error):
+    response = client.get(f"/api/applications/stats?upcoming={upcoming}")
+
+    assert response.status_code == 400
+    assert response.get_json() == {"error": error}
@@ -0,0 +1,130 @@
+"""
+Bulk job and application writes: one result per item, and only the user's
+own rows are touched. Ids 1-3 are tester's seeded rows, 4 is other's.
+"""
+JOB = {"title": "Backend Engineer", "company": "Acme"}
+OTHERS = 4
+MISSING = 999
+
+
+def _ids(client, path):
+    return sorted(row["id"] for row in client.get(path).get_json())
+
+
+def test_bulk_create_jobs_reports_each_item(client, other_client):
+    response = client.post("/api/jobs/bulk/create", json={"jobs": [
+        {**JOB, "location": "Remote", "deadline": "2026-12-01"},
+        {"title": "No company"},
+        {**JOB, "deadline": "someday"},
+        "not an object",
+        {**JOB, "title": "Second"},
+    ]})
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["results"] == [
+        {"index": 0, "status": "created", "id": OTHERS + 1},
+        {"index": 1, "status": "error", "error": "Job title and company are required"},
+        {"index": 2, "status": "error", "error": "deadline must be an ISO 8601 date"},
+        {"index": 3, "status": "error", "error": "Job must be an object"},
+        {"index": 4, "status": "created", "id": OTHERS + 2},
+    ]
+    assert (body["succeeded"], body["failed"]) == (2, 3)
+
+    created = client.get(f"/api/jobs/{body['results'][0]['id']}").get_json()
+    assert (created["title"], created["location"], created["deadline"]) == ("Backend Engineer", "Remote", "2026-12-01T00:00:00")
+    assert client.get(f"/api/jobs/{body['results'][4]['id']}").get_json()["title"] == "Second"
+
+
+def test_bulk_update_jobs_skips_rows_the_user_does_not_own(client, other_client):
+    response = client.put("/api/jobs/bulk/update", json={"ids": [1, 2, OTHERS, MISSING], "changes": {"location": "Berlin"}})
+
+    assert response.status_code == 200
+    assert response.get_json() == {
+        "results": [
+            {"id": 1, "status": "updated"},
+            {"id": 2, "status": "updated"},
+            {"id": OTHERS, "status": "not_found"},
+            {"id": MISSING, "status": "not_found"},
+        ],
+        "succeeded": 2,
+        "failed": 2,
+    }
+    locations = {job["id"]: job["location"] for job in client.get("/api/jobs/list").get_json()}
+    assert locations == {1: "Berlin", 2: "Berlin", 3: None}
+    assert other_client.get(f"/api/jobs/{OTHERS}").get_json()["location"] is None
+
+
+def test_bulk_delete_jobs_removes_their_applications(client, other_client):
+    response = client.delete("/api/jobs/bulk/delete", json={"ids": [1, OTHERS, MISSING]})
+
+    assert response.status_code == 200
+    assert response.get_json()["results"] == [
+        {"id": 1, "status": "deleted"},
+        {"id": OTHERS, "status": "not_found"},
+        {"id": MISSING, "status": "not_found"},
+    ]
+    assert _ids(client, "/api/jobs/list") == [2, 3]
+    # Application 1 and its cover letter belonged to job 1
+    assert _ids(client, "/api/applications/list") == [2, 3]
+    assert _ids(client, "/api/cover-letters/list") == [2, 3]
+    assert _ids(other_client, "/api/jobs/list") == [OTHERS]
+
+
+def test_bulk_create_applications_checks_references(client, other_client):
+    response = client.post("/api/applications/bulk/create", json={"applications": [
+        {"title": "Valid", "job_id": 1, "resume_id": 2},
+        {"title": "Other's job", "job_id": OTHERS},
+        {"title": "Other's resume", "job_id": 1, "resume_id": OTHERS},
+        {"title": "Missing job", "job_id": MISSING},
+        {"title": "String id", "job_id": "1"},
+        {"title": "List id", "job_id": [1]},
+        {"title": "Bool id", "job_id": True},
+        {"job_id": 1},
+    ]})
+
+    assert response.status_code == 200
+    results = response.get_json()["results"]
+    assert results[0] == {"index": 0, "status": "created", "id": OTHERS + 1}
+    assert [result.get("error") for result in results[1:]] == [
+        "Invalid job_id", "Invalid resume_id", "Invalid job_id", "Invalid job_id",
+        "Invalid job_id", "Invalid job_id", "Application title is required",
+    ]
+
+    created = client.get(f"/api/applications/{OTHERS + 1}").get_json()
+    assert (created["title"], created["job_id"], created["resume_id"], created["status"]) == ("Valid", 1, 2, "Pending")
+    assert _ids(client, "/api/applications/list") == [1, 2, 3, OTHERS + 1]
+
+
+def test_bulk_update_applications_skips_rows_the_user_does_not_own(client, other_client):
+    response = client.put("/api/applications/bulk/update", json={
+        "ids": [2, OTHERS, MISSING], "changes": {"status": "Interview", "resume_id": 3}
+    })
+
+    assert response.status_code == 200
+    assert response.get_json()["results"] == [
+        {"id": 2, "status": "updated"},
+        {"id": OTHERS, "status": "not_found"},
+        {"id": MISSING, "status": "not_found"},
+    ]
+    updated = client.get("/api/applications/2").get_json()
+    assert (updated["status"], updated["resume_id"]) == ("Interview", 3)
+    assert client.get("/api/applications/1").get_json()["status"] == "Pending"
+    assert other_client.get(f"/api/applications/{OTHERS}").get_json()["status"] == "Pending"
+
+    rejected = client.put("/api/applications/bulk/update", json={"ids": [1], "changes": {"resume_id": OTHERS}})
+    assert rejected.status_code == 400
+    assert client.get("/api/applications/1").get_json()["resume_id"] is None
+
+
+def test_bulk_delete_applications_removes_their_cover_letters(client, other_client):
+    response = client.delete("/api/applications/bulk/delete", json={"ids": [2, OTHERS]})
+
+    assert response.status_code == 200
+    assert response.get_json()["results"] == [
+        {"id": 2, "status": "deleted"},
+        {"id": OTHERS, "status": "not_found"},
+    ]
+    assert _ids(client, "/api/applications/list") == [1, 3]
+    assert _ids(client, "/api/cover-letters/list") == [1, 3]
+    assert _ids(other_client, "/api/cover-letters/list") == [OTHERS]
@@ -0,0 +1,142 @@
+"""
+The response_cache table behind the "database" caches (isolation from the
+request session, expiry and the row bound) and the redis backend, run
+against fakeredis.
+"""
+import time
+
+import pytest
+
+from app_package import db
+from app_package.models import Job, ResponseCache
+from app_package.services.cache_service import DatabaseCache, RedisCache
+
+
+def test_cache_io_leaves_the_session_alone(app, client):
+    cache = DatabaseCache(ttl=60)
+    with app.app_context():
+        job = db.session.get(Job, 1)
+        job.title = "Pending edit"
+
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+        cache.get("missing")
+        cache.delete("key")
+
+        # Neither committed nor rolled back by the cache
+        assert job in db.session.dirty
+        db.session.rollback()
+        assert db.session.get(Job, 1).title != "Pending edit"
+
+
+def test_expired_entries_are_misses(app):
+    cache = DatabaseCache(ttl=60)
+    with app.app_context():
+        cache.set("key", "value", ttl=0.01)
+        time.sleep(0.02)
+        assert cache.get("key") is None
+        assert db.session.get(ResponseCache, "key") is None
+
+
+def test_purge_bounds_the_table(app):
+    cache = DatabaseCache(ttl=60, max_rows=3, purge_interval=3600)
+    with app.app_context():
+        cache.set("expired", "value", ttl=0.01)
+        cache.set("permanent", "value", ttl=0)
+        for i in range(4):
+            cache.set(f"key-{i}", "value", ttl=60 + i)
+        time.sleep(0.02)
+
+        cache.purge()
+        keys = set(db.session.execute(db.select(ResponseCache.key)).scalars())
+
+    # Expired rows go first, then the ones closest to expiring; permanent ones are kept
+    assert keys == {"permanent", "key-2", "key-3"}
+
+
+def test_purge_evicts_permanent_rows_last(app):
+    cache = DatabaseCache(ttl=60, max_rows=2, purge_interval=3600)
+    with app.app_context():
+        for i in range(3):
+            cache.set(f"permanent-{i}", "value", ttl=0)
+        cache.set("expiring", "value", ttl=60)
+
+        cache.purge()
+        remaining = db.session.query(ResponseCache).count()
+        cache.set("another", "value", ttl=60)
+        cache.purge()
+        keys = set(db.session.execute(db.select(ResponseCache.key)).scalars())
+
+    # Past max_rows with nothing else left to evict, permanent rows go too
+    assert remaining == 2
+    assert len(keys) == 2 and "another" not in keys and all(key.startswith("permanent-") for key in keys)
+
+
+def test_purge_runs_once_per_interval(app):
+    cache = DatabaseCache(ttl=60, max_rows=1, purge_interval=3600)
+    with app.app_context():
+        cache.set("first", "value")   # purges: one row, within the bound
+        cache.set("second", "value")  # purge not due yet
+        assert db.session.query(ResponseCache).count() == 2
+
+
+@pytest.fixture
+def redis_server():
+    fakeredis = pytest.importorskip("fakeredis")
+    return fakeredis.FakeServer()
+
+
+def _redis(redis_server):
+    import fakeredis
+    return fakeredis.FakeRedis(server=redis_server)
+
+
+def test_redis_values_are_strings_with_a_ttl(redis_server):
+    client = _redis(redis_server)
+    cache = RedisCache(ttl=60, prefix="test:", client=client)
+
+    cache.set("key", "välue")
+    cache.set("short", "value", ttl=5)
+    cache.set("permanent", "value", ttl=0)
+
+    # fakeredis, like redis-py, returns bytes
+    assert client.get("test:key") == "välue".encode("utf-8")
+    assert cache.get("key") == "välue"
+    assert cache.get("missing") is None
+    assert 55 < client.ttl("test:key") <= 60
+    assert 0 < client.ttl("test:short") <= 5
+    assert client.ttl("test:permanent") == -1
+
+    cache.delete("key")
+    assert cache.get("key") is None
+
+
+def test_redis_clear_only_drops_its_prefix(redis_server):
+    lists = RedisCache(prefix="lists:", client=_redis(redis_server))
+    sticky = RedisCache(prefix="sticky:", client=_redis(redis_server))
+    for i in range(3):
+        lists.set(f"key-{i}", "value")
+    sticky.set("key-0", "value")
+
+    lists.clear()
+
+    assert [lists.get(f"key-{i}") for i in range(3)] == [None, None, None]
+    assert sticky.get("key-0") == "value"
+
+
+class _DownRedis:
+    """A client whose server is unreachable."""
+
+    def __getattr__(self, name):
+        def fail(*args, **kwargs):
+            raise ConnectionError("Connection refused")
+        return fail
+
+
+def test_redis_failures_are_misses():
+    cache = RedisCache(ttl=60, client=_DownRedis())
+
+    cache.set("key", "value")
+    assert cache.get("key") is None
+    cache.delete("key")
+    cache.clear()
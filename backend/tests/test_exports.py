@@ -0,0 +1,64 @@
+"""
+Streamed NDJSON and CSV exports contain exactly the user's rows, in id order.
+"""
+import csv
+import io
+import json
+
+import pytest
+
+from app_package.services.export_service import APPLICATION_COLUMNS, COVER_LETTER_COLUMNS, JOB_COLUMNS
+from conftest import SEED_ROWS
+
+EXPORTS = [
+    ("/api/jobs/export", JOB_COLUMNS, [f"Python Engineer {i}" for i in range(SEED_ROWS)]),
+    ("/api/applications/export", APPLICATION_COLUMNS, [f"Application {i}" for i in range(SEED_ROWS)]),
+    ("/api/cover-letters/export", COVER_LETTER_COLUMNS, [f"Letter {i}" for i in range(SEED_ROWS)]),
+]
+
+
+@pytest.mark.parametrize("path, columns, titles", EXPORTS)
+def test_ndjson_holds_the_users_rows(client, other_client, path, columns, titles):
+    response = client.get(path)
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [row["title"] for row in rows] == titles
+    assert [row["id"] for row in rows] == list(range(1, SEED_ROWS + 1))
+    # Same shape as the single-row GET
+    assert rows[0] == client.get(path.replace("/export", "/1")).get_json()
+
+
+@pytest.mark.parametrize("path, columns, titles", EXPORTS)
+def test_csv_holds_the_users_rows(client, other_client, path, columns, titles):
+    response = client.get(f"{path}?format=csv")
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/csv"
+    assert response.headers["Content-Disposition"].endswith('.csv"')
+    reader = csv.reader(io.StringIO(response.get_data(as_text=True)))
+    header, *rows = list(reader)
+    assert header == list(columns)
+    records = [dict(zip(header, row)) for row in rows]
+    assert [record["title"] for record in records] == titles
+    assert [record["id"] for record in records] == [str(i) for i in range(1, SEED_ROWS + 1)]
+
+
+def test_csv_flattens_the_applications_job(client):
+    client.put("/api/jobs/1", json={"location": "Berlin, Germany", "deadline": "2026-12-01"})
+    body = client.get("/api/applications/export?format=csv").get_data(as_text=True)
+
+    first = next(csv.DictReader(io.StringIO(body)))
+    assert (first["job_id"], first["job_title"], first["job_company"]) == ("1", "Python Engineer 0", "Company 0")
+    assert (first["job_location"], first["job_deadline"]) == ("Berlin, Germany", "2026-12-01T00:00:00")
+    # Unset values are empty cells
+    assert first["resume_id"] == ""
+
+
+def test_other_users_get_only_their_own(client, other_client):
+    rows = [json.loads(line) for line in other_client.get("/api/jobs/export").get_data(as_text=True).splitlines()]
+    assert [row["title"] for row in rows] == ["Python Wizard"]
+
+    letters = other_client.get("/api/cover-letters/export?format=csv").get_data(as_text=True)
+    assert [record["title"] for record in csv.DictReader(io.StringIO(letters))] == ["Other letter"]
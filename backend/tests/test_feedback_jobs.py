@@ -0,0 +1,78 @@
+"""
+Recovery of async AI feedback jobs whose worker process died, and the
+heartbeat that keeps live ones from being taken over.
+"""
+from datetime import datetime, timedelta, timezone
+import time
+
+import pytest
+
+from app_package import db
+from app_package.models import FeedbackJob
+from app_package.services import feedback_job_service
+
+
+@pytest.fixture
+def pool(app, monkeypatch):
+    monkeypatch.setattr(feedback_job_service.ai_service, "generate_feedback", lambda prompt: ('{"ok": true}', False))
+    return app.extensions["feedback_workers"]
+
+
+def _add_job(app, status: str, silent_for: int) -> str:
+    with app.app_context():
+        job = FeedbackJob(
+            id=f"job-{status}-{silent_for}",
+            user_id=1,
+            prompt="prompt",
+            status=status,
+            updated_at=datetime.now(timezone.utc) - timedelta(seconds=silent_for)
+        )
+        db.session.add(job)
+        db.session.commit()
+        return job.id
+
+
+def _wait_for_status(app, job_id: str, status: str, seconds: float = 5) -> str:
+    deadline = time.monotonic() + seconds
+    while True:
+        with app.app_context():
+            current = db.session.get(FeedbackJob, job_id).status
+        if current == status or time.monotonic() > deadline:
+            return current
+        time.sleep(0.05)
+
+
+def test_pool_starts_no_thread_until_started(app):
+    # create_app() is what a pre-fork master and every CLI command run
+    pool = app.extensions["feedback_workers"]
+    assert pool._monitor is None
+    assert not pool._executor._threads
+
+
+def test_dead_workers_jobs_are_rerun(app, client, pool):
+    running = _add_job(app, "running", silent_for=600)
+    queued = _add_job(app, "queued", silent_for=600)
+
+    with app.app_context():
+        feedback_job_service.recover_feedback_jobs(pool, timeout=60)
+
+    assert _wait_for_status(app, running, "done") == "done"
+    assert _wait_for_status(app, queued, "done") == "done"
+
+
+def test_heartbeat_keeps_live_jobs(app, client, pool):
+    alive = _add_job(app, "running", silent_for=600)
+    recent = _add_job(app, "queued", silent_for=5)
+
+    with app.app_context():
+        feedback_job_service.touch_running_jobs({alive})
+        feedback_job_service.recover_feedback_jobs(pool, timeout=60)
+        assert db.session.get(FeedbackJob, alive).status == "running"
+        assert db.session.get(FeedbackJob, recent).status == "queued"
+    assert not pool.active_jobs()
+
+
+def test_monitor_recovers_after_start(app, client, pool):
+    job_id = _add_job(app, "running", silent_for=600)
+    pool.start()
+    assert _wait_for_status(app, job_id, "done") == "done"
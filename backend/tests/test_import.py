@@ -0,0 +1,105 @@
+"""
+Streaming job import: what each line becomes, across chunk boundaries.
+"""
+import io
+import json
+
+import pytest
+
+from conftest import SEED_ROWS
+
+
+def _upload(client, fmt, content):
+    return client.post(
+        f"/api/jobs/import?format={fmt}",
+        data={"file": (io.BytesIO(content.encode("utf-8")), f"jobs.{fmt}")}
+    )
+
+
+def _imported(client):
+    """Jobs other than the seeded ones, by title."""
+    jobs = client.get("/api/jobs/list").get_json()
+    return {job["title"]: job for job in jobs if not job["title"].startswith("Python Engineer")}
+
+
+def test_csv_rows_become_jobs(client):
+    response = _upload(client, "csv", (
+        "﻿Title, Company ,location,deadline,unknown\n"
+        "Data Engineer,Globex,Remote,2026-12-01,ignored\n"
+        "No company,,Berlin,,\n"
+        "SRE,Initech,,not a date,\n"
+        "\"Engineer, Platform\",Hooli,,,\n"
+    ))
+
+    assert response.status_code == 200
+    assert response.get_json() == {
+        "imported": 2,
+        "failed": 2,
+        "errors": [
+            {"line": 3, "error": "Job title and company are required"},
+            {"line": 4, "error": "deadline must be an ISO 8601 date"},
+        ],
+        "errors_truncated": False,
+    }
+    jobs = _imported(client)
+    assert sorted(jobs) == ["Data Engineer", "Engineer, Platform"]
+    data_engineer = jobs["Data Engineer"]
+    assert (data_engineer["company"], data_engineer["location"], data_engineer["deadline"]) == (
+        "Globex", "Remote", "2026-12-01T00:00:00"
+    )
+    # Blank cells are unset, not empty strings
+    assert jobs["Engineer, Platform"]["location"] is None
+
+
+def test_jsonl_lines_become_jobs(client):
+    lines = [
+        json.dumps({"title": "Data Engineer", "company": "Globex", "employment_type": "Contract"}),
+        "",
+        "{not json",
+        json.dumps(["not", "an", "object"]),
+        json.dumps({"title": "SRE", "company": "Initech", "location": 42}),
+        json.dumps({"title": "Analyst", "company": "Acme"}),
+    ]
+    response = _upload(client, "jsonl", "\n".join(lines) + "\n")
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert (body["imported"], body["failed"]) == (2, 3)
+    assert body["errors"] == [
+        {"line": 3, "error": "Invalid JSON"},
+        {"line": 4, "error": "Job must be an object"},
+        {"line": 5, "error": "location must be a string"},
+    ]
+    jobs = _imported(client)
+    assert sorted(jobs) == ["Analyst", "Data Engineer"]
+    assert jobs["Data Engineer"]["employment_type"] == "Contract"
+    assert jobs["Analyst"]["employment_type"] == "Full-time"
+
+
+@pytest.fixture
+def small_chunks(app):
+    app.config["JOB_IMPORT_CHUNK_SIZE"] = 2
+
+
+def test_every_chunk_is_imported(client, small_chunks):
+    rows = "".join(f"Job {i},Company {i}\n" for i in range(5))
+    response = _upload(client, "csv", "title,company\n" + rows)
+
+    assert response.get_json()["imported"] == 5
+    assert sorted(_imported(client)) == [f"Job {i}" for i in range(5)]
+    assert len(client.get("/api/jobs/list").get_json()) == SEED_ROWS + 5
+
+
+def test_unreadable_file_keeps_the_chunks_already_imported(client, small_chunks):
+    # Well past the text decoder's read-ahead, so the bad bytes are hit mid-import
+    rows = "".join(f"Job {i},Company {i}\n" for i in range(2000))
+    content = ("title,company\n" + rows).encode("utf-8") + b"\xff\xfe,broken\n"
+    response = client.post(
+        "/api/jobs/import?format=csv",
+        data={"file": (io.BytesIO(content), "jobs.csv")}
+    )
+
+    assert response.status_code == 400
+    imported = response.get_json()["imported"]
+    assert 0 < imported < 2000 and imported % 2 == 0
+    assert len(_imported(client)) == imported
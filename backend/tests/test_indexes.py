@@ -0,0 +1,108 @@
+"""
+Checks that SQLite's planner answers the login lookup and the per-user list
+queries from the indexes of migration b7d41c2e9a10 instead of scanning.
+
+The statements are the ones the routes actually run, captured from the
+engine, so a service changing its filter or ordering breaks the test.
+"""
+from sqlalchemy import event
+import pytest
+import re
+
+from app_package import db
+from conftest import PASSWORD
+
+
+@pytest.fixture
+def capture_selects(app):
+    """Records (statement, parameters) of every SELECT run inside the block."""
+    from contextlib import contextmanager
+
+    @contextmanager
+    def capturing():
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append((statement, parameters))
+
+        with app.app_context():
+            engine = db.engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+    return capturing
+
+
+def _plans(app, statements, table: str) -> list:
+    """EXPLAIN QUERY PLAN details of the captured statements reading `table`."""
+    plans = []
+    with app.app_context(), db.engine.connect() as conn:
+        for statement, parameters in statements:
+            if f"FROM {table}" not in statement and f"JOIN {table}" not in statement:
+                continue
+            rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).all()
+            plans.append([row[-1] for row in rows])
+    assert plans, f"no statement read {table}"
+    return plans
+
+
+def _index_of(plan: list, table: str):
+    """Name of the index the plan searches `table` with, None for a full scan."""
+    for detail in plan:
+        match = re.match(rf"(?:SEARCH|SCAN) {table} USING (?:COVERING )?INDEX (\w+)", detail)
+        if match:
+            return match.group(1)
+    return None
+
+
+def _sorts(plan: list) -> bool:
+    return any("TEMP B-TREE" in detail for detail in plan)
+
+
+def test_login_looks_up_username_by_index(app, client, capture_selects):
+    with capture_selects() as statements:
+        response = app.test_client().post("/api/auth/login", json={"username": "tester", "password": PASSWORD})
+    assert response.status_code == 200
+
+    for plan in _plans(app, statements, "users"):
+        assert _index_of(plan, "users") == "ix_users_username", plan
+
+
+# Unpaged lists have no ORDER BY, so any index leading with the filtered column serves them
+@pytest.mark.parametrize("path, table, prefix", [
+    ("/api/jobs/list", "jobs", "ix_jobs_user_id_"),
+    ("/api/resumes/list", "resumes", "ix_resumes_user_id_"),
+    ("/api/applications/list", "applications", "ix_applications_user_id_"),
+    ("/api/cover-letters/list", "applications", "ix_applications_user_id_"),
+    ("/api/cover-letters/list", "coverletters", "ix_coverletters_application_id_"),
+])
+def test_list_query_filters_by_index(app, client, capture_selects, path, table, prefix):
+    with capture_selects() as statements:
+        response = client.get(path)
+    assert response.status_code == 200
+
+    for plan in _plans(app, statements, table):
+        assert (_index_of(plan, table) or "").startswith(prefix), plan
+
+
+# Keyset pages filter by user_id and order by id: the composite index answers
+# both, so no page sorts the user's rows. Cover letters are owned through their
+# application, so their pages merge per-application index ranges and sort those.
+@pytest.mark.parametrize("path, table, index, sorts", [
+    ("/api/jobs/list", "jobs", "ix_jobs_user_id_id", False),
+    ("/api/resumes/list", "resumes", "ix_resumes_user_id_id", False),
+    ("/api/applications/list", "applications", "ix_applications_user_id_id", False),
+    ("/api/cover-letters/list", "coverletters", "ix_coverletters_application_id_id", True),
+])
+def test_keyset_page_uses_ordering_index(app, client, capture_selects, path, table, index, sorts):
+    first = client.get(f"{path}?limit=2").get_json()
+    with capture_selects() as statements:
+        response = client.get(f"{path}?limit=2&after={first['next_cursor']}")
+    assert response.status_code == 200
+
+    for plan in _plans(app, statements, table):
+        assert _index_of(plan, table) == index, plan
+        assert _sorts(plan) == sorts, plan
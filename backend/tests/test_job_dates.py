@@ -0,0 +1,34 @@
+"""
+Single and bulk job writes parse date fields with the same parser.
+"""
+import pytest
+
+JOB = {"title": "Backend Engineer", "company": "Acme"}
+
+
+def test_single_and_bulk_create_store_the_same_dates(client):
+    dates = {"deadline": "2026-12-01T10:00:00Z", "date_posted": "2026-10-01"}
+    single = client.post("/api/jobs/create", json={**JOB, **dates})
+    bulk = client.post("/api/jobs/bulk/create", json={"jobs": [{**JOB, **dates}]})
+    assert single.status_code == 201
+    assert bulk.status_code == 200
+
+    stored = client.get(f"/api/jobs/{bulk.get_json()['results'][0]['id']}").get_json()
+    assert single.get_json()["deadline"] == stored["deadline"] == "2026-12-01T10:00:00"
+    assert single.get_json()["date_posted"] == stored["date_posted"] == "2026-10-01T00:00:00"
+
+
+@pytest.mark.parametrize("method, path", [("POST", "/api/jobs/create"), ("PUT", "/api/jobs/1")])
+def test_invalid_dates_are_rejected(client, method, path):
+    response = client.open(path, method=method, json={**JOB, "deadline": "next friday"})
+
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "deadline must be an ISO 8601 date"}
+    assert client.get("/api/jobs/1").get_json()["deadline"] is None
+
+
+def test_update_parses_dates(client):
+    response = client.put("/api/jobs/1", json={"deadline": "2027-01-02"})
+
+    assert response.status_code == 200
+    assert response.get_json()["deadline"] == "2027-01-02T00:00:00"
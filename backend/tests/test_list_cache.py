@@ -0,0 +1,52 @@
+"""
+LIST_CACHE=redis end to end: two app instances (workers) share the cache
+through a fakeredis server, and a write in one is seen by the other.
+"""
+import pytest
+
+from conftest import PASSWORD, SEED_ROWS, build_app
+
+
+@pytest.fixture
+def redis_client(app_env):
+    fakeredis = pytest.importorskip("fakeredis")
+    client = fakeredis.FakeRedis(server=fakeredis.FakeServer())
+    app_env.setattr("redis.Redis.from_url", lambda url, **kwargs: client)
+    app_env.setenv("LIST_CACHE", "redis")
+    return client
+
+
+@pytest.fixture
+def app(redis_client):
+    yield from build_app()
+
+
+@pytest.fixture
+def other_worker(app, client):
+    """A second app on the same database and redis, logged in as `tester`."""
+    worker = build_app()
+    other = next(worker).test_client()
+    assert other.post("/api/auth/login", json={"username": "tester", "password": PASSWORD}).status_code == 200
+    yield other
+    next(worker, None)
+
+
+def test_lists_are_cached_in_redis(client, redis_client, count_queries):
+    client.get("/api/jobs/list")
+    assert redis_client.keys("career-engine:*")
+
+    with count_queries() as counter:
+        response = client.get("/api/jobs/list")
+    assert len(response.get_json()) == SEED_ROWS
+    assert counter.count == 1
+
+
+def test_a_write_in_one_worker_invalidates_the_others(client, other_worker):
+    assert len(client.get("/api/jobs/list").get_json()) == SEED_ROWS
+    assert len(other_worker.get("/api/jobs/list").get_json()) == SEED_ROWS
+
+    created = other_worker.post("/api/jobs/create", json={"title": "New", "company": "Acme"}).get_json()
+    assert [job["id"] for job in client.get("/api/jobs/list").get_json()][-1] == created["id"]
+
+    assert client.delete("/api/jobs/bulk/delete", json={"ids": [created["id"]]}).status_code == 200
+    assert created["id"] not in [job["id"] for job in other_worker.get("/api/jobs/list").get_json()]
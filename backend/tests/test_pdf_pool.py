@@ -0,0 +1,45 @@
+"""
+Recycling the PDF extraction pool after a hung document must not fail the
+other documents it was parsing.
+"""
+from concurrent.futures import CancelledError
+from concurrent.futures.process import BrokenProcessPool
+import time
+
+import pytest
+
+from app_package.services.pdf_service import PDFExtractionPool
+
+
+@pytest.fixture
+def pool():
+    pool = PDFExtractionPool(workers=2, max_pending=2)
+    yield pool
+    pool.shutdown()
+
+
+def test_recycle_lets_healthy_work_finish(pool):
+    healthy = pool.submit(time.sleep, 1)
+    stuck = pool.submit(time.sleep, 60)
+    # Both processes picked a task before the pool is swapped
+    time.sleep(0.5)
+
+    pool.recycle(grace=3)
+    fresh = pool.submit(abs, -1)
+
+    assert fresh.result(timeout=30) == 1
+    assert healthy.result(timeout=10) is None
+    with pytest.raises(BrokenProcessPool):
+        stuck.result(timeout=10)
+
+
+def test_recycle_frees_the_stuck_tasks_slot(pool):
+    stuck = [pool.submit(time.sleep, 60) for _ in range(4)]
+    assert pool.submit(abs, -1) is None
+
+    pool.recycle(grace=0)
+    for future in stuck:
+        # Running ones die with their process, queued ones are cancelled
+        with pytest.raises((BrokenProcessPool, CancelledError)):
+            future.result(timeout=30)
+    assert pool.submit(abs, -1).result(timeout=30) == 1
@@ -0,0 +1,134 @@
+"""
+Query counts of every job, application, resume and cover letter route in
+STRICT_QUERY_MODE, so an N+1 or a lost eager load fails here first.
+
+Counts are exact: a route running fewer statements should lower its number
+(and usually its query_budget) in the same change.
+"""
+import io
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+
+from app_package import db
+from conftest import SEED_ROWS
+
+JOB = {"title": "Backend Engineer", "company": "Acme", "description": "python"}
+IMPORT_CSV = "title,company,location,description\nData Engineer,Globex,Remote,sql\nSRE,Initech,Berlin,linux\n"
+
+# (method, path, request kwargs, expected status, expected SQL statements)
+ROUTES = [
+    # Jobs
+    ("POST", "/api/jobs/create", {"json": JOB}, 201, 3),
+    ("GET", "/api/jobs/list", {}, 200, 2),
+    ("GET", "/api/jobs/list?limit=2", {}, 200, 2),
+    ("GET", "/api/jobs/list?fields=summary", {}, 200, 2),
+    ("GET", "/api/jobs/1", {}, 200, 2),
+    ("PUT", "/api/jobs/1", {"json": {"title": "Renamed"}}, 200, 5),
+    ("POST", "/api/jobs/bulk/create", {"json": {"jobs": [JOB, JOB]}}, 200, 2),
+    ("PUT", "/api/jobs/bulk/update", {"json": {"ids": [1, 2], "changes": {"location": "Remote"}}}, 200, 3),
+    ("DELETE", "/api/jobs/bulk/delete", {"json": {"ids": [1, 2]}}, 200, 6),
+    ("POST", "/api/jobs/import?format=csv", {"data": {"file": (io.BytesIO(IMPORT_CSV.encode()), "jobs.csv")}}, 200, 2),
+    ("GET", "/api/jobs/export", {}, 200, 1),
+    ("GET", "/api/jobs/export?format=csv", {}, 200, 1),
+    ("GET", "/api/jobs/search?q=python", {}, 200, 2),
+
+    # Applications
+    ("GET", "/api/applications/list", {}, 200, 2),
+    ("GET", "/api/applications/list?limit=2&status=Pending&sort=-submitted_at", {}, 200, 2),
+    ("GET", "/api/applications/stats", {}, 200, 4),
+    ("POST", "/api/applications/create", {"json": {"title": "New", "job_id": 1}}, 201, 4),
+    ("GET", "/api/applications/1", {}, 200, 2),
+    ("PUT", "/api/applications/update/1", {"json": {"status": "Applied"}}, 200, 5),
+    ("DELETE", "/api/applications/delete/1", {}, 200, 6),
+    ("POST", "/api/applications/bulk/create", {"json": {"applications": [
+        {"title": "A", "job_id": 1}, {"title": "B", "job_id": 2, "resume_id": 1}
+    ]}}, 200, 5),
+    ("PUT", "/api/applications/bulk/update", {"json": {"ids": [1, 2], "changes": {"status": "Interview"}}}, 200, 2),
+    ("DELETE", "/api/applications/bulk/delete", {"json": {"ids": [1, 2]}}, 200, 4),
+    ("GET", "/api/applications/export", {}, 200, 1),
+
+    # Resumes
+    ("GET", "/api/resumes/list", {}, 200, 2),
+    ("GET", "/api/resumes/list?limit=2&fields=summary", {}, 200, 2),
+    ("POST", "/api/resumes/create", {"data": {"title": "New", "content": "python"}}, 201, 3),
+    ("PUT", "/api/resumes/update/1", {"data": {"content": "python flask"}}, 200, 4),
+    ("DELETE", "/api/resumes/delete/1", {}, 200, 5),
+    ("GET", "/api/resumes/search?q=python", {}, 200, 2),
+    ("GET", "/api/resumes/1/matches", {}, 200, 5),
+
+    # Cover letters
+    ("GET", "/api/cover-letters/list", {}, 200, 2),
+    ("GET", "/api/cover-letters/list?limit=2&fields=summary", {}, 200, 2),
+    ("GET", "/api/cover-letters/1", {}, 200, 2),
+    ("POST", "/api/cover-letters/create", {"data": {"title": "New", "application_id": 1, "content": "python"}}, 201, 4),
+    ("PUT", "/api/cover-letters/update/1", {"data": {"content": "python flask"}}, 200, 4),
+    ("DELETE", "/api/cover-letters/delete/1", {}, 200, 3),
+    ("GET", "/api/cover-letters/export", {}, 200, 1),
+    ("GET", "/api/cover-letters/search?q=python", {}, 200, 2),
+]
+
+
+@pytest.mark.parametrize(
+    "method, path, kwargs, status, queries", ROUTES,
+    ids=[f"{method} {path}" for method, path, *_ in ROUTES]
+)
+def test_route_query_count(app, client, count_queries, method, path, kwargs, status, queries):
+    with count_queries() as counter:
+        response = client.open(path, method=method, **kwargs)
+        # Streamed bodies run their queries while being read
+        body = response.get_data(as_text=True)
+
+    assert response.status_code == status, body
+    assert counter.count == queries
+
+    view = app.view_functions[app.url_map.bind("localhost").match(path.split("?")[0], method=method)[0]]
+    budget = getattr(view, "query_budget", app.config["DEFAULT_QUERY_BUDGET"])
+    assert budget is None or counter.count <= budget
+
+
+def test_list_cache_hit_costs_one_version_lookup(client, count_queries):
+    client.get("/api/jobs/list")
+    with count_queries() as counter:
+        response = client.get("/api/jobs/list")
+
+    assert len(response.get_json()) == SEED_ROWS
+    assert counter.count == 1
+
+
+def test_revalidation_costs_one_version_lookup(client, count_queries):
+    etag = client.get("/api/applications/list").headers["ETag"]
+    with count_queries() as counter:
+        response = client.get("/api/applications/list", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert counter.count == 1
+
+
+@pytest.fixture
+def probe_routes(app):
+    """Views that break the strict mode rules, registered before the first request."""
+    from app_package.models import Application, Job
+    from app_package.strict_mode import query_budget
+
+    @app.route("/test/lazy")
+    def lazy():
+        # Application.job is not eagerly loaded, so strict mode raises
+        return {"company": Application.query.first().job.company}
+
+    @app.route("/test/overrun")
+    @query_budget(1)
+    def overrun():
+        return {"titles": [db.session.get(Job, i).title for i in range(1, SEED_ROWS + 1)]}
+
+
+def test_lazy_load_raises(probe_routes, client):
+    # TESTING propagates the error instead of answering 500
+    with pytest.raises(InvalidRequestError, match="lazy='raise'"):
+        client.get("/test/lazy")
+
+
+def test_budget_overrun_fails_the_request(probe_routes, client):
+    response = client.get("/test/overrun")
+    assert response.status_code == 500
+    assert response.get_json()["queries"] == SEED_ROWS
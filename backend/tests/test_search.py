@@ -0,0 +1,80 @@
+"""
+Ranked search on the SQLite FTS5 backend: query syntax, ranking, ownership
+and pagination of the results.
+"""
+import pytest
+
+JOBS = [
+    {"title": "Python Developer", "company": "Acme", "description": "django and flask"},
+    {"title": "Data Engineer", "company": "Globex", "description": "python pipelines, machine learning"},
+    {"title": "Frontend Engineer", "company": "Initech", "description": "react, some python"},
+    {"title": "Go Developer", "company": "Hooli", "description": "learning machine code"},
+]
+
+
+@pytest.fixture
+def jobs(client):
+    """Creates JOBS for the logged-in user, next to the seeded ones."""
+    for job in JOBS:
+        assert client.post("/api/jobs/create", json=job).status_code == 201
+
+
+def _titles(client, q, **params):
+    response = client.get("/api/jobs/search", query_string={"q": q, **params})
+    assert response.status_code == 200, response.get_data(as_text=True)
+    return [item["title"] for item in response.get_json()["items"]]
+
+
+def test_matches_rank_by_column_weight(client):
+    # The same word in the title (weight A), the company (B) and the description (C)
+    for job in (
+        {"title": "Platform Engineer", "company": "Initech", "description": "rust services"},
+        {"title": "Rust Engineer", "company": "Globex", "description": "backend services"},
+        {"title": "Backend Engineer", "company": "Rust Labs", "description": "platform services"},
+    ):
+        client.post("/api/jobs/create", json=job)
+
+    items = client.get("/api/jobs/search?q=rust").get_json()["items"]
+    assert [item["title"] for item in items] == ["Rust Engineer", "Backend Engineer", "Platform Engineer"]
+    assert items[0]["rank"] > items[1]["rank"] > items[2]["rank"]
+
+
+@pytest.mark.parametrize("q, expected", [
+    ("python -django", {"Data Engineer", "Frontend Engineer"}),
+    ('"machine learning"', {"Data Engineer"}),
+    ("machine learning", {"Data Engineer", "Go Developer"}),
+    ("react or globex", {"Frontend Engineer", "Data Engineer"}),
+    ('engineer -"some python"', {"Data Engineer"}),
+    ("-python", set()),
+    ("pipelines; (python)", {"Data Engineer"}),
+])
+def test_websearch_syntax(client, jobs, q, expected):
+    # Seeded "Python Engineer N" jobs are left out of the comparison
+    titles = {title for title in _titles(client, q) if not title.startswith("Python Engineer")}
+    assert titles == expected
+
+
+def test_only_the_users_rows_are_found(client, jobs, other_client):
+    assert "Python Wizard" not in _titles(client, "python")
+    assert _titles(other_client, "python") == ["Python Wizard"]
+
+    letters = client.get("/api/cover-letters/search?q=letter").get_json()["items"]
+    assert sorted(item["title"] for item in letters) == ["Letter 0", "Letter 1", "Letter 2"]
+    letters = other_client.get("/api/cover-letters/search?q=letter").get_json()["items"]
+    assert [item["title"] for item in letters] == ["Other letter"]
+
+
+def test_pages_cover_every_match_once(client, jobs):
+    expected = _titles(client, "python", limit=50)
+    assert len(expected) > 2
+
+    titles, after = [], None
+    while True:
+        params = {"q": "python", "limit": 2, **({"after": after} if after else {})}
+        page = client.get("/api/jobs/search", query_string=params).get_json()
+        titles += [item["title"] for item in page["items"]]
+        after = page["next_cursor"]
+        if after is None:
+            break
+
+    assert titles == expected
@@ -0,0 +1,8 @@
+"""
+Production entry point: gunicorn wsgi:app (settings in gunicorn.conf.py).
+run.py stays the development server.
+"""
+from app_package import create_app
+
+# gunicorn.conf.py starts the background workers in each worker process
+app = create_app()
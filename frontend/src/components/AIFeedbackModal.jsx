@@ -1,5 +1,5 @@
 import React, { useEffect, useState } from "react";
-import { getCoverLetterFeedback } from "../services/aiService";
+import { streamCoverLetterFeedback } from "../services/aiService";
 
 export default function AiFeedbackModal({
   open,
@@ -11,31 +11,41 @@ export default function AiFeedbackModal({
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState(null);
   const [feedback, setFeedback] = useState(null);
+  // Raw model output shown while the feedback streams in
+  const [partial, setPartial] = useState("");
 
   useEffect(() => {
     if (!open) return;
 
+    // Ignore a stream that outlives the modal or its inputs
+    let cancelled = false;
+
     async function loadFeedback() {
       setLoading(true);
       setError(null);
       setFeedback(null);
+      setPartial("");
 
       try {
-        const result = await getCoverLetterFeedback({
-          resumeText,
-          jobText,
-          coverLetterText,
-        });
-        setFeedback(result);
+        const result = await streamCoverLetterFeedback(
+          { resumeText, jobText, coverLetterText },
+          (text) => {
+            if (!cancelled) setPartial((prev) => prev + text);
+          }
+        );
+        if (!cancelled) setFeedback(result);
       } catch (err) {
         console.error(err);
-        setError(err.message);
+        if (!cancelled) setError(err.message);
       } finally {
-        setLoading(false);
+        if (!cancelled) setLoading(false);
       }
     }
 
     loadFeedback();
+    return () => {
+      cancelled = true;
+    };
   }, [open, coverLetterText, resumeText, jobText]);
 
   if (!open) return null;
@@ -57,7 +67,8 @@ export default function AiFeedbackModal({
 
           {/* Right pane: AI Feedback */}
           <div className="feedback-pane">
-            {loading && <p>Analyzing cover letter...</p>}
+            {loading && !partial && <p>Analyzing cover letter...</p>}
+            {loading && partial && <pre className="feedback-stream">{partial}</pre>}
             {error && <p className="error">{error}</p>}
 
             {feedback && (
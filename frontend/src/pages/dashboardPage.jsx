@@ -1,6 +1,6 @@
 import React, { useEffect, useState } from "react";
 import { useNavigate } from "react-router-dom";
-import { getApplications } from "../services/applicationService";
+import { getApplications, getApplicationStats } from "../services/applicationService";
 
 const statusColors = {
   Applied: "#2563eb",
@@ -10,16 +10,24 @@ const statusColors = {
   Pending: "#6b7280",
 };
 
+// Most recent applications shown on the dashboard
+const RECENT_APPLICATIONS_LIMIT = 6;
+
 export default function DashboardPage() {
   const navigate = useNavigate();
   const [recentApplications, setRecentApplications] = useState([]);
+  const [stats, setStats] = useState({ total: 0, by_status: {}, upcoming_deadlines: [] });
   const [loading, setLoading] = useState(true);
 
   useEffect(() => {
     async function loadDashboardData() {
       try {
-        const apps = await getApplications();
-        setRecentApplications(apps || []);
+        const [apps, appStats] = await Promise.all([
+          getApplications({ fields: "summary", limit: RECENT_APPLICATIONS_LIMIT }),
+          getApplicationStats(),
+        ]);
+        setRecentApplications(apps?.items || []);
+        setStats(appStats);
       } catch (err) {
         console.error("Failed to load recent applications", err);
       } finally {
@@ -29,24 +37,14 @@ export default function DashboardPage() {
     loadDashboardData();
   }, []);
 
-  // Aggregate stats for overview
-  const totalApps = recentApplications.length;
-  const statusCounts = recentApplications.reduce((acc, app) => {
-    acc[app.status] = (acc[app.status] || 0) + 1;
-    return acc;
-  }, {});
-
-  const upcomingDeadlines = recentApplications
-  .filter(app => app.job?.deadline)
-  .map(app => ({
-    id: app.id,
-    title: app.title,
-    company: app.job.company,
-    deadline: new Date(app.job.deadline),
-  }))
-  .filter(item => item.deadline >= new Date())
-  .sort((a, b) => a.deadline - b.deadline)
-  .slice(0, 4); // Max next 4 deadlines
+  // Aggregate stats for overview (computed by the backend)
+  const totalApps = stats.total;
+  const statusCounts = stats.by_status;
+
+  const upcomingDeadlines = stats.upcoming_deadlines.map(item => ({
+    ...item,
+    deadline: new Date(item.deadline),
+  }));
 
   return (
     <div className="dashboard-container">
@@ -32,3 +32,63 @@ export async function getCoverLetterFeedback({
     ? JSON.parse(data.feedback)
     : data.feedback;
 }
+
+/**
+ * Streams cover letter feedback over Server-Sent Events.
+ * @param {Object} docs - { resumeText, jobText, coverLetterText }
+ * @param {Function} onToken - called with each text chunk as it arrives
+ * @returns {Object} the validated feedback object from the final event
+ */
+export async function streamCoverLetterFeedback(
+  { resumeText, jobText, coverLetterText },
+  onToken
+) {
+  const res = await fetch(`${API_URL}/feedback/stream`, {
+    method: "POST",
+    credentials: "include",
+    headers: {
+      "Content-Type": "application/json",
+    },
+    body: JSON.stringify({
+      resume: resumeText,
+      job: jobText,
+      cover_letter: coverLetterText,
+    }),
+  });
+
+  if (!res.ok) {
+    const err = await res.json();
+    throw new Error(err.error || "AI request failed");
+  }
+
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+
+  while (true) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    // Events are separated by a blank line
+    let boundary;
+    while ((boundary = buffer.indexOf("\n\n")) !== -1) {
+      const raw = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+
+      let event = "message";
+      let data = "";
+      for (const line of raw.split("\n")) {
+        if (line.startsWith("event: ")) event = line.slice(7);
+        else if (line.startsWith("data: ")) data += line.slice(6);
+      }
+      const payload = data ? JSON.parse(data) : {};
+
+      if (event === "token" && onToken) onToken(payload.text);
+      else if (event === "result") return payload.feedback;
+      else if (event === "error") throw new Error(payload.error || "AI request failed");
+    }
+  }
+
+  throw new Error("AI stream ended without a result");
+}
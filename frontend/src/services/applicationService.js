@@ -1,11 +1,25 @@
 const API_URL = process.env.REACT_APP_API_URL + "/api/applications";
 
-export async function getApplications() {
-  const res = await fetch(`${API_URL}/list`, { credentials: "include" });
+// params: { status, company, employment_type, submitted_after, submitted_before,
+//           deadline_after, deadline_before, sort, limit, after }; arrays repeat the key
+export async function getApplications(params = {}) {
+  const query = new URLSearchParams();
+  Object.entries(params).forEach(([key, value]) => {
+    if (value === undefined || value === null || value === "") return;
+    (Array.isArray(value) ? value : [value]).forEach((v) => query.append(key, v));
+  });
+  const qs = query.toString();
+  const res = await fetch(`${API_URL}/list${qs ? `?${qs}` : ""}`, { credentials: "include" });
   if (!res.ok) throw new Error("Failed to fetch applications");
   return res.json();
 }
 
+export async function getApplicationStats(upcoming = 4) {
+  const res = await fetch(`${API_URL}/stats?upcoming=${upcoming}`, { credentials: "include" });
+  if (!res.ok) throw new Error("Failed to fetch application stats");
+  return res.json();
+}
+
 export async function createApplication(data) {
   const res = await fetch(`${API_URL}/create`, {
     method: "POST",